@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark of each phase of the site build on a synthetic or existing GEDCOM file.
+
+The build runs in a temporary directory, so the site in the repository is left untouched.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, where peak memory is not reported
+    resource = None
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add the python directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'python'))
+
+from ancestors import AncestorResolver
+from gedcom_reader import read_gedcom
+from html_generation import (
+    generate_html_for_individual, generate_index_html, generate_individuals_html, generate_surname_pages
+)
+from main import collect_tree, write_individual_pages
+from output import DirectoryWriter, get_sidecar_extensions
+from synthetic_gedcom import add_shape_arguments, generate_synthetic_gedcom
+
+def get_peak_rss():
+    """Return the peak resident memory of this process and its finished children in MiB, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / (1 << 10)
+
+class PhaseTimer:
+    """Records the duration and the number of items processed by each phase of the build."""
+
+    def __init__(self):
+        self.phases = []
+
+    def run(self, name, function, *args):
+        """Call function(*args), record how long it took and return its result."""
+        start = time.perf_counter()
+        result = function(*args)
+        self.phases.append({'phase': name, 'seconds': time.perf_counter() - start, 'items': None})
+        return result
+
+    def set_items(self, count):
+        """Set the number of items processed by the last phase."""
+        self.phases[-1]['items'] = count
+
+def run_build(gedcom_file, jobs, writer_threads, sidecars=()):
+    """Build the site from gedcom_file in the current directory, timing each phase."""
+    timer = PhaseTimer()
+
+    records = timer.run("parse", lambda: list(read_gedcom(gedcom_file)))
+    timer.set_items(len(records))
+
+    family_graph, individuals_data = timer.run("collect", collect_tree, records)
+    timer.set_items(len(individuals_data))
+    del records
+
+    def render_pages():
+        ancestor_resolver = AncestorResolver(family_graph, individuals_data)
+        return [
+            (data.file_path,
+             generate_html_for_individual(family_graph, data.pointer, individuals_data, ancestor_resolver))
+            for data in individuals_data.values()
+        ]
+
+    def write_pages(pages):
+        with DirectoryWriter(writer_threads, sidecars) as site_writer:
+            site_writer.make_directories([file_path for file_path, _ in pages])
+            for file_path, html_content in pages:
+                site_writer.write(file_path, html_content)
+
+    pages = timer.run("render pages", render_pages)
+    timer.set_items(len(pages))
+    timer.run("write pages", write_pages, pages)
+    timer.set_items(len(pages))
+    del pages
+
+    timer.run("index.html", generate_index_html, individuals_data)
+    timer.set_items(1)
+    timer.run("individuals.html", generate_individuals_html, individuals_data)
+    timer.set_items(1)
+    surname_paths = timer.run("surname pages", generate_surname_pages, individuals_data)
+    timer.set_items(len(surname_paths))
+
+    if jobs > 1:
+        written = timer.run(f"render + write pages (--jobs {jobs})",
+                            lambda: sum(1 for _ in write_individual_pages(family_graph, individuals_data, jobs)))
+        timer.set_items(written)
+
+    return timer.phases
+
+def print_report(phases, peak_rss):
+    """Print the phases as a table with their throughput."""
+    print(f"{'phase':36} {'seconds':>9} {'items':>8} {'items/s':>10}")
+    for phase in phases:
+        items = phase['items']
+        rate = f"{items / phase['seconds']:10.0f}" if items and phase['seconds'] else f"{'':10}"
+        print(f"{phase['phase']:36} {phase['seconds']:9.3f} {items if items is not None else '':>8} {rate}")
+    total = sum(phase['seconds'] for phase in phases if not phase['phase'].startswith('render + write'))
+    print(f"{'total (sequential)':36} {total:9.3f}")
+    print(f"peak RSS: {f'{peak_rss:.1f} MiB' if peak_rss is not None else 'n/a'}")
+
+def main():
+    """Generate or read a GEDCOM file, build the site from it and report the time of each phase."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--gedcom', help="benchmark an existing GEDCOM file instead of a synthetic one")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="also time the page build with this many worker processes (default: 1)")
+    parser.add_argument('--writer-threads', type=int, default=4,
+                        help="number of threads writing the pages, 0 to write them in turn (default: 4)")
+    parser.add_argument('--precompress', action='store_true',
+                        help="also write the .gz and .br sidecars of the individual pages")
+    parser.add_argument('--json', help="also write the results to this JSON file")
+    add_shape_arguments(parser)
+    args = parser.parse_args()
+
+    build_dir = tempfile.mkdtemp(prefix='familytree-benchmark-')
+    cwd = os.getcwd()
+    try:
+        if args.gedcom:
+            gedcom_file = os.path.abspath(args.gedcom)
+        else:
+            gedcom_file = os.path.join(build_dir, 'synthetic.ged')
+            individuals, families = generate_synthetic_gedcom(
+                gedcom_file, args.people, args.generations, args.fan_out, args.collapse, args.missing_parents,
+                args.seed
+            )
+            print(f"Synthetic tree: {individuals} individuals, {families} families")
+
+        # Pages are written relative to the current directory, and the per-file messages are dropped
+        os.chdir(build_dir)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            sidecars = get_sidecar_extensions() if args.precompress else ()
+            phases = run_build(gedcom_file, args.jobs, args.writer_threads, sidecars)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(build_dir)
+
+    peak_rss = get_peak_rss()
+    print_report(phases, peak_rss)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'arguments': vars(args), 'phases': phases, 'peak_rss_mib': peak_rss}, f, indent=1)
+
+if __name__ == "__main__":
+    main()
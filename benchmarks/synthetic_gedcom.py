@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Generator of synthetic GEDCOM files of a configurable size and shape, for benchmarking the build.
+
+The tree is made of lineages: each one starts from a founder couple and grows for a number of
+generations, every couple having on average `fan_out` children. Lineages are added until the
+requested number of people is reached.
+"""
+
+import argparse
+import random
+
+GIVEN_NAMES = {
+    'M': ['Adam', 'Boris', 'Carl', 'David', 'Emil', 'Farid', 'George', 'Hasan', 'Ivan', 'John',
+          'Kamal', 'Leon', 'Murad', 'Nikolai', 'Oscar', 'Peter', 'Ruslan', 'Samir', 'Timur', 'Victor'],
+    'F': ['Alina', 'Bella', 'Clara', 'Diana', 'Elena', 'Fatima', 'Gulnara', 'Helen', 'Irina', 'Julia',
+          'Kamila', 'Leyla', 'Maria', 'Nina', 'Olga', 'Polina', 'Rena', 'Sabina', 'Tamara', 'Vera']
+}
+
+SURNAMES = ['Abbasov', 'Aliyev', 'Brown', 'Dubois', 'Efendiyev', 'Garcia', 'Hasanov', 'Ivanov', 'Jansen',
+            'Kerimov', 'Kowalski', 'Mammadov', 'Muller', 'Novak', 'Petrov', 'Rossi', 'Smith', 'Suleymanov',
+            'Taylor', 'Yilmaz']
+
+MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+
+# Year of birth of the founders, and years between two generations
+FIRST_BIRTH_YEAR = 1800
+GENERATION_YEARS = 28
+
+class SyntheticTree:
+    """Builds the individuals and families of a synthetic tree."""
+
+    def __init__(self, people, generations, fan_out, collapse, missing_parents, seed):
+        self.people = people
+        self.generations = generations
+        self.fan_out = fan_out
+        self.collapse = collapse
+        self.missing_parents = missing_parents
+        self.random = random.Random(seed)
+        self.individuals = []
+        self.families = []
+
+    def add_individual(self, gender, surname, generation):
+        """Add an individual born in the given generation and return their index."""
+        birth_year = FIRST_BIRTH_YEAR + GENERATION_YEARS * generation + self.random.randint(-5, 5)
+        death_year = birth_year + self.random.randint(40, 95)
+        self.individuals.append({
+            'given_name': self.random.choice(GIVEN_NAMES[gender]),
+            'surname': surname,
+            'gender': gender,
+            'birth_date': f"{self.random.randint(1, 28)} {self.random.choice(MONTHS)} {birth_year}",
+            'death_date': f"{self.random.randint(1, 28)} {self.random.choice(MONTHS)} {death_year}"
+            if death_year < 2020 else '',
+            'famc': None,
+            'fams': []
+        })
+        return len(self.individuals) - 1
+
+    def add_family(self, husband, wife):
+        """Add a family for the given spouses, either of which may be None, and return its index."""
+        self.families.append({'husband': husband, 'wife': wife, 'children': []})
+        family = len(self.families) - 1
+        for spouse in (husband, wife):
+            if spouse is not None:
+                self.individuals[spouse]['fams'].append(family)
+        return family
+
+    def add_child(self, family, generation):
+        """Add a child to a family, carrying the father's surname when there is one."""
+        husband = self.families[family]['husband']
+        if husband is not None:
+            surname = self.individuals[husband]['surname']
+        else:
+            surname = self.individuals[self.families[family]['wife']]['surname']
+        child = self.add_individual(self.random.choice('MF'), surname, generation)
+        self.individuals[child]['famc'] = family
+        self.families[family]['children'].append(child)
+        return child
+
+    def add_married_in_spouse(self, gender, generation):
+        """Add a spouse from outside the tree, without parents."""
+        return self.add_individual(gender, self.random.choice(SURNAMES), generation)
+
+    def add_lineage(self):
+        """Grow one lineage from a founder couple, stopping once the tree has enough people."""
+        husband = self.add_married_in_spouse('M', 0)
+        wife = self.add_married_in_spouse('F', 0)
+        couples = [(husband, wife)]
+
+        for generation in range(1, self.generations):
+            children = []
+            for husband, wife in couples:
+                # Some families only record one of the parents
+                if self.random.random() < self.missing_parents:
+                    if self.random.random() < 0.5:
+                        husband = None
+                    else:
+                        wife = None
+                family = self.add_family(husband, wife)
+
+                for _ in range(self.random.randint(0, 2 * self.fan_out)):
+                    if len(self.individuals) >= self.people:
+                        return
+                    children.append(self.add_child(family, generation))
+
+            # Pair the children of this generation, marrying relatives for pedigree collapse
+            couples = []
+            unmarried = {'M': [], 'F': []}
+            for child in children:
+                unmarried[self.individuals[child]['gender']].append(child)
+            self.random.shuffle(unmarried['M'])
+            self.random.shuffle(unmarried['F'])
+            for gender, other in (('M', 'F'), ('F', 'M')):
+                while unmarried[gender]:
+                    child = unmarried[gender].pop()
+                    if unmarried[other] and self.random.random() < self.collapse:
+                        spouse = unmarried[other].pop()
+                    else:
+                        if len(self.individuals) >= self.people:
+                            return
+                        spouse = self.add_married_in_spouse(other, generation)
+                    couples.append((child, spouse) if gender == 'M' else (spouse, child))
+
+            if not couples:
+                return
+
+    def build(self):
+        """Add lineages until the tree holds the requested number of people."""
+        while len(self.individuals) < self.people:
+            self.add_lineage()
+        return self
+
+    def write(self, file_path):
+        """Write the tree as a GEDCOM 5.5.1 file."""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write("0 HEAD\n1 SOUR FamilyTree benchmarks\n1 GEDC\n2 VERS 5.5.1\n2 FORM LINEAGE-LINKED\n1 CHAR UTF-8\n")
+
+            for index, individual in enumerate(self.individuals):
+                given_name = individual['given_name']
+                surname = individual['surname']
+                f.write(f"0 @I{index:06d}@ INDI\n1 NAME {given_name} /{surname}/\n"
+                        f"2 GIVN {given_name}\n2 SURN {surname}\n1 SEX {individual['gender']}\n")
+                f.write(f"1 BIRT\n2 DATE {individual['birth_date']}\n")
+                if individual['death_date']:
+                    f.write(f"1 DEAT\n2 DATE {individual['death_date']}\n")
+                if individual['famc'] is not None:
+                    f.write(f"1 FAMC @F{individual['famc']:06d}@\n")
+                for family in individual['fams']:
+                    f.write(f"1 FAMS @F{family:06d}@\n")
+
+            for index, family in enumerate(self.families):
+                f.write(f"0 @F{index:06d}@ FAM\n")
+                if family['husband'] is not None:
+                    f.write(f"1 HUSB @I{family['husband']:06d}@\n")
+                if family['wife'] is not None:
+                    f.write(f"1 WIFE @I{family['wife']:06d}@\n")
+                for child in family['children']:
+                    f.write(f"1 CHIL @I{child:06d}@\n")
+
+            f.write("0 TRLR\n")
+
+def generate_synthetic_gedcom(file_path, people=1000, generations=8, fan_out=2, collapse=0.0,
+                              missing_parents=0.0, seed=0):
+    """Write a synthetic GEDCOM file and return the (number of individuals, number of families) in it."""
+    tree = SyntheticTree(people, generations, fan_out, collapse, missing_parents, seed).build()
+    tree.write(file_path)
+    return len(tree.individuals), len(tree.families)
+
+def add_shape_arguments(parser):
+    """Add the options describing the size and shape of a synthetic tree to an argument parser."""
+    parser.add_argument('--people', type=int, default=1000, help="number of individuals (default: 1000)")
+    parser.add_argument('--generations', type=int, default=8, help="generations per lineage (default: 8)")
+    parser.add_argument('--fan-out', type=int, default=2, help="average number of children per family (default: 2)")
+    parser.add_argument('--collapse', type=float, default=0.0,
+                        help="probability that two relatives marry, for pedigree collapse (default: 0)")
+    parser.add_argument('--missing-parents', type=float, default=0.0,
+                        help="probability that a family only records one parent (default: 0)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+
+def main():
+    """Write a synthetic GEDCOM file described by the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output', help="GEDCOM file to write")
+    add_shape_arguments(parser)
+    args = parser.parse_args()
+
+    individuals, families = generate_synthetic_gedcom(
+        args.output, args.people, args.generations, args.fan_out, args.collapse, args.missing_parents, args.seed
+    )
+    print(f"Wrote {individuals} individuals and {families} families to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the precompiled templates against str.format on the templates of constants.py.
+
+Every page of the GEDCOM file is rendered once to record the values each template is filled
+with, then both rendering paths are timed on exactly those values.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# Add the python directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), os.pardir, 'python'))
+
+import constants
+import templates
+from ancestors import AncestorResolver
+from constants import GEDCOM_FILE
+from html_generation import generate_html_for_individual
+from main import load_tree
+
+def record_template_values(family_graph, individuals_data):
+    """Render every individual's page and return the values passed to each template, by template name."""
+    names = {id(template): name for name, template in vars(templates).items()
+             if isinstance(template, templates.CompiledTemplate)}
+    recorded = {name: [] for name in names.values()}
+
+    render_into = templates.CompiledTemplate.render_into
+
+    def recording_render_into(self, parts, values):
+        recorded[names[id(self)]].append(dict(values))
+        render_into(self, parts, values)
+
+    templates.CompiledTemplate.render_into = recording_render_into
+    try:
+        ancestor_resolver = AncestorResolver(family_graph, individuals_data)
+        for data in individuals_data.values():
+            generate_html_for_individual(family_graph, data.pointer, individuals_data, ancestor_resolver)
+    finally:
+        templates.CompiledTemplate.render_into = render_into
+
+    return {name: values for name, values in recorded.items() if values}
+
+def time_calls(calls, repeat):
+    """Return the best time, over `repeat` runs, to make all the calls once."""
+    def run():
+        for call in calls:
+            call()
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+def main():
+    """Print the time spent by each rendering path on the recorded template values."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('gedcom_file', nargs='?', default=GEDCOM_FILE, help="GEDCOM file to render")
+    parser.add_argument('--repeat', type=int, default=5, help="number of timed runs, the best one is kept")
+    args = parser.parse_args()
+
+    family_graph, individuals_data = load_tree(args.gedcom_file)
+    recorded = record_template_values(family_graph, individuals_data)
+
+    print(f"{'template':36} {'calls':>7} {'format (ms)':>12} {'render (ms)':>12} {'speedup':>8}")
+    total_format = 0.0
+    total_render = 0.0
+    for name, values_list in sorted(recorded.items()):
+        format_string = getattr(constants, name)
+        compiled = getattr(templates, name)
+
+        # Both paths must produce the same text before their speed is compared
+        for values in values_list:
+            assert compiled.render(**values) == format_string.format(**values), name
+
+        format_time = time_calls([lambda v=v: format_string.format(**v) for v in values_list], args.repeat)
+        render_time = time_calls([lambda v=v: compiled.render(**v) for v in values_list], args.repeat)
+        total_format += format_time
+        total_render += render_time
+        print(f"{name:36} {len(values_list):7} {format_time * 1000:12.2f} {render_time * 1000:12.2f} "
+              f"{format_time / render_time:7.2f}x")
+
+    print(f"{'total':36} {'':7} {total_format * 1000:12.2f} {total_render * 1000:12.2f} "
+          f"{total_format / total_render:7.2f}x")
+
+if __name__ == "__main__":
+    main()
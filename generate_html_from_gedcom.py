@@ -11,24 +11,23 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), 'python'))
 
 # Import the main function from the main module
-from main import main
+from main import main, parse_arguments
 
 if __name__ == "__main__":
-    # Clean up old directories if they exist
-    if os.path.exists('ppl'):
-        print("Cleaning up old ppl directory...")
-        import shutil
-        shutil.rmtree('ppl')
+    args = parse_arguments()
 
-    if os.path.exists('surnames'):
-        print("Cleaning up old surnames directory...")
-        import shutil
-        shutil.rmtree('surnames')
+    if args.serve or args.watch:
+        main(args)
+        sys.exit()
 
-    # Run the main function to generate HTML files
+    # Run the main function to generate HTML files. Pages are written over the previous build:
+    # unchanged pages keep their modification times, and the pages of people no longer in the tree are removed
     print("Generating HTML files with new structure...")
-    main()
+    main(args)
 
     print("\nGeneration completed.")
-    print("Individual pages are now organized by surname in the 'ppl' directory.")
-    print("Surname pages are in the 'surnames' directory.")
+    if args.archive:
+        print(f"The site is in the archive {args.archive}.")
+    else:
+        print("Individual pages are now organized by surname in the 'ppl' directory.")
+        print("Surname pages are in the 'surnames' directory.")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Ancestor chart layout and the memoized lookups used to draw the charts of all the pages of a build.
+
+Ancestors are numbered in Ahnentafel order: the individual is 1, and the father and mother
+of the ancestor n are 2n and 2n + 1. Ancestor n belongs to generation n.bit_length() - 1.
+"""
+
+from functools import lru_cache
+
+from constants import (
+    ANCESTOR_DEPTH, ANCESTOR_CHART_START_TEMPLATE, ANCESTOR_FATHER_CONNECTOR_TEMPLATE, ANCESTOR_BOX_TEMPLATE
+)
+from data_extraction import get_parents
+from instrumentation import run_stats
+
+# Left margin of the chart, horizontal distance between two generations and width of a box
+CHART_MARGIN = 6
+COLUMN_WIDTH = 310
+BOX_WIDTH = 298
+
+# Vertical space given to each box of the deepest generation
+ROW_HEIGHT = 150
+
+# Distance from the middle of a box's share of the chart up to its top,
+# and from its top down to the line connecting it to its child
+BOX_OFFSET = 70
+LINE_OFFSET = 20
+
+def get_box_position(depth, number):
+    """Return the (generation, top, left) of the box of ancestor `number` in a chart of `depth` generations."""
+    generation = number.bit_length() - 1
+    row = number - (1 << generation)
+    share = ROW_HEIGHT << (depth - generation)
+    top = share * row + share // 2 - BOX_OFFSET
+    left = CHART_MARGIN + COLUMN_WIDTH * generation
+    return generation, top, left
+
+@lru_cache(maxsize=None)
+def get_box_frame(depth, number):
+    """Precompute the markup around the box of ancestor `number` in a chart of `depth` generations.
+
+    Returns the (before_path, before_label, after_label) chunks of its box. Only the boxes of known
+    ancestors are ever drawn, so frames are built, and cached, for those numbers alone.
+    """
+    generation, top, left = get_box_position(depth, number)
+    _, child_top, child_left = get_box_position(depth, number // 2)
+    indent = ' ' * 4 * (generation + 1)
+    line_top = top + LINE_OFFSET
+    child_line_top = child_top + LINE_OFFSET
+
+    # Only the father's box draws the line leaving the child's box
+    frame = ''
+    if number % 2 == 0:
+        frame += ANCESTOR_FATHER_CONNECTOR_TEMPLATE.format(
+            indent=indent,
+            child_line_top=child_line_top,
+            child_gline_top=child_line_top + 5,
+            connector_left=child_left + BOX_WIDTH - 19
+        )
+    frame += ANCESTOR_BOX_TEMPLATE.format(
+        indent=indent,
+        gender_class="male" if number % 2 == 0 else "female",
+        generation=generation,
+        top=top,
+        left=left,
+        shadow_top=top + 5,
+        shadow_left=left + 4,
+        line_top=line_top,
+        line_left=left - 16,
+        bar_top=min(line_top, child_line_top),
+        bar_height=abs(line_top - child_line_top) + 1,
+        path='{path}',
+        label='{label}'
+    )
+
+    before_path, _, rest = frame.partition('{path}')
+    before_label, _, after_label = rest.partition('{label}')
+    return before_path, before_label, after_label
+
+def get_chart_start(depth, gender_class, path, label):
+    """Return the markup opening an ancestor chart of `depth` generations with the individual's box."""
+    _, top, left = get_box_position(depth, 1)
+    return ANCESTOR_CHART_START_TEMPLATE.format(
+        width=CHART_MARGIN + COLUMN_WIDTH * depth + BOX_WIDTH,
+        height=ROW_HEIGHT << depth,
+        gender_class=gender_class,
+        top=top,
+        left=left,
+        shadow_top=top + 5,
+        shadow_left=left + 4,
+        path=path,
+        label=label
+    )
+
+class AncestorResolver:
+    """Caches each individual's parents and ancestor box, so every ancestor is resolved once per build."""
+
+    def __init__(self, family_graph, individuals_data, depth=ANCESTOR_DEPTH):
+        self.family_graph = family_graph
+        self.individuals_data = individuals_data
+        self.depth = depth
+        self._parents = {}
+        self._boxes = {}
+
+    def get_parents(self, pointer):
+        """Return the parents information of an individual, as data_extraction.get_parents does."""
+        if pointer not in self._parents:
+            run_stats.count('ancestor cache misses')
+            self._parents[pointer] = get_parents(self.family_graph, pointer)
+        else:
+            run_stats.count('ancestor cache hits')
+        return self._parents[pointer]
+
+    def get_box(self, pointer):
+        """Return the (path, label) shown in the ancestor chart box of an individual."""
+        if pointer not in self._boxes:
+            person = self.individuals_data[self.family_graph.ids[pointer]]
+            label = f"{person.name}<br/>*{person.birth_date or ''}<br/>+{person.death_date or '...'}"
+            self._boxes[pointer] = (person.path, label)
+        return self._boxes[pointer]
+
+    def get_ancestors(self, pointer):
+        """Return the known ancestors of an individual as {Ahnentafel number: pointer}, in drawing order.
+
+        The individual is number 1. Ancestors are listed depth first, fathers before mothers, and
+        only the lines of known ancestors are followed, so unknown branches cost nothing.
+        """
+        ancestors = {}
+        stack = [(1, pointer)]
+        while stack:
+            number, ancestor = stack.pop()
+            ancestors[number] = ancestor
+            if number >= 1 << self.depth:
+                continue
+            parents_info = self.get_parents(ancestor)
+            if not parents_info:
+                continue
+            if parents_info['mother']:
+                stack.append((2 * number + 1, parents_info['mother']))
+            if parents_info['father']:
+                stack.append((2 * number, parents_info['father']))
+        return ancestors
@@ -7,6 +7,23 @@ Constants and templates for generating HTML files from GEDCOM data.
 GEDCOM_FILE = 'ged/family_tree.ged'
 OUTPUT_DIR = 'ppl'
 SURNAMES_DIR = 'surnames'
+SEARCH_DIR = 'search'
+MANIFEST_FILE = '.build_manifest.json'
+SNAPSHOT_FILE = '.tree_snapshot'
+REPORT_FILE = 'build_report.json'
+PROFILE_FILE = 'build_profile.prof'
+
+# Files of the site that are not generated, copied into archives of the site
+STATIC_SITE_FILES = ('css', 'images', 'interactive_graph.html', 'search.html')
+
+# Number of generations shown above an individual in the ancestors section
+ANCESTOR_DEPTH = 3
+
+# Largest --ancestor-depth: the chart doubles in height with each generation
+MAX_ANCESTOR_DEPTH = 10
+
+# Number of generations shown below an individual in the descendants section, 0 to leave it out
+DESCENDANT_DEPTH = 0
 
 # HTML Templates
 HTML_TEMPLATE = """<!DOCTYPE html>
@@ -35,6 +52,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                     <li class = "CurrentSection"><a href="../../individuals.html" title="Individuals">Individuals</a></li>
                     <li><a href="../../index.html" title="Surnames">Surnames</a></li>
                     <li><a href="../../interactive_graph.html" title="Interactive Graph">Interactive Graph</a></li>
+                    <li><a href="../../search.html" title="Search">Search</a></li>
                 </ul>
             </div>
         </div>
@@ -48,7 +66,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                         {name}
                         </td>
                     </tr>
-                    {married_name_section}
+                    {married_name_section}{relationship_section}
                     <tr>
                         <td class="ColumnAttribute">Gender</td>
                         <td class="ColumnValue">{gender}</td>
@@ -90,7 +108,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             {parents_section}
             {families_section}
             {pedigree_section}
-            {ancestors_section}
+            {ancestors_section}{descendants_section}
         </div>
         <div class="fullclear"></div>
         <div id="footer">
@@ -115,6 +133,15 @@ MARRIED_NAME_TEMPLATE = """
 </tr>
 """
 
+RELATIONSHIP_TEMPLATE = """
+<tr>
+    <td class="ColumnAttribute">Relationship</td>
+    <td class="ColumnValue">
+    {relationship} of <a href="../../{home_path}">{home_name}</a>
+    </td>
+</tr>
+"""
+
 PARENTS_TEMPLATE = """
 <div class="subsection" id="parents">
     <h4>Parents</h4>
@@ -234,12 +261,13 @@ INDEX_HTML_TEMPLATE = """<!DOCTYPE html>
                     <li><a href="individuals.html" title="Individuals">Individuals</a></li>
                     <li class="CurrentSection"><a href="index.html" title="Surnames">Surnames</a></li>
                     <li><a href="interactive_graph.html" title="Interactive Graph">Interactive Graph</a></li>
+                    <li><a href="search.html" title="Search">Search</a></li>
                 </ul>
             </div>
         </div>
         <div class="content" id="SurnameDetail">
             <h3>Surnames</h3>
-            <p>This page contains an index of all the surnames in the database. Selecting a name will lead to a page for that surname.</p>
+            <p>This page contains an index of all the surnames in the database. Selecting a name will lead to a page for that surname.</p>{shard_navigation}
             <table class="infolist">
                 <thead>
                     <tr>
@@ -290,11 +318,12 @@ INDIVIDUALS_HTML_TEMPLATE = """<!DOCTYPE html>
                     <li class="CurrentSection"><a href="individuals.html" title="Individuals">Individuals</a></li>
                     <li><a href="index.html" title="Surnames">Surnames</a></li>
                     <li><a href="interactive_graph.html" title="Interactive Graph">Interactive Graph</a></li>
+                    <li><a href="search.html" title="Search">Search</a></li>
                 </ul>
             </div>
         </div>
         <div class="content" id="IndividualList">
-            <h3>Individuals</h3>
+            <h3>Individuals</h3>{shard_navigation}
             <table class="infolist primobjlist">
                 <thead>
                     <tr>
@@ -353,6 +382,7 @@ SURNAME_PAGE_TEMPLATE = """<!DOCTYPE html>
                     <li><a href="../individuals.html" title="Individuals">Individuals</a></li>
                     <li class="CurrentSection"><a href="../index.html" title="Surnames">Surnames</a></li>
                     <li><a href="../interactive_graph.html" title="Interactive Graph">Interactive Graph</a></li>
+                    <li><a href="../search.html" title="Search">Search</a></li>
                 </ul>
             </div>
         </div>
@@ -416,3 +446,46 @@ ANCESTORS_TEMPLATE = """
     {ancestors_content}
 </div>
 """
+
+DESCENDANTS_TEMPLATE = """
+<div class="subsection" id="descendants">
+    <h4>Descendants</h4>
+    <ol class="descendantgen">
+{descendants_content}    </ol>
+</div>
+"""
+
+ANCESTOR_CHART_START_TEMPLATE = """
+    <div id="treeContainer" style="width:{width}px; height:{height}px; top: 0px">
+    <div class="boxbg {gender_class} AncCol0" style="top: {top}px; left: {left}px;">
+        <a class="noThumb" href="../../{path}">
+        {label}
+        </a>
+    </div>
+    <div class="shadow" style="top: {shadow_top}px; left: {shadow_left}px;"></div>
+    """
+
+ANCESTOR_FATHER_CONNECTOR_TEMPLATE = """
+{indent}<div class="bvline" style="top: {child_line_top}px; left: {connector_left}px; width: 15px"></div>
+{indent}<div class="gvline" style="top: {child_gline_top}px; left: {connector_left}px; width: 20px"></div>"""
+
+ANCESTOR_BOX_TEMPLATE = """
+{indent}<div class="boxbg {gender_class} AncCol{generation}" style="top: {top}px; left: {left}px;">
+{indent}    <a class="noThumb" href="../../../FamilyTree/{path}">
+{indent}    {label}
+{indent}    </a>
+{indent}</div>
+{indent}<div class="shadow" style="top: {shadow_top}px; left: {shadow_left}px;"></div>
+{indent}<div class="bvline" style="top: {line_top}px; left: {line_left}px; width: 15px;"></div>
+{indent}<div class="bhline" style="top: {bar_top}px; left: {line_left}px; height: {bar_height}px;"></div>
+{indent}"""
+
+# Links between the pages of a sharded listing, shown above the listing table
+SHARD_NAVIGATION_TEMPLATE = """
+            <div id="alphanav">
+                <ul>
+{shard_links}                </ul>
+            </div>"""
+
+SHARD_LINK_TEMPLATE = """                    <li{current}><a href="{file_name}" title="{first} to {last}">{first}&ndash;{last}</a></li>
+"""
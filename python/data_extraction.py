@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """
-Functions for extracting data from GEDCOM elements.
+Functions for formatting the fields of the records of gedcom_reader and looking up relatives in the family graph.
 """
 
 from utils import generate_id_from_pointer, get_relative_path
+from instrumentation import run_stats
 
-def get_name(individual):
-    """Extract the name from an individual element."""
-    name_tuple = individual.get_name()
+def format_name(name_tuple):
+    """Format a (given_name, surname) tuple as "surname, given_name"."""
     if not name_tuple or name_tuple == ("", ""):
         return "Unknown"
 
@@ -26,9 +26,8 @@ def get_name(individual):
     # If we can't parse the name, return it as is
     return str(name_tuple)
 
-def get_gender(individual):
-    """Extract the gender from an individual element."""
-    gender = individual.get_gender()
+def format_gender(gender):
+    """Convert a GEDCOM SEX value to "male", "female" or "unknown"."""
     if gender == "M":
         return "male"
     elif gender == "F":
@@ -36,116 +35,35 @@ def get_gender(individual):
     else:
         return "unknown"
 
-def get_birth_data(individual):
-    """Extract birth date from an individual element."""
-    birth_data = individual.get_birth_data()
-    birth_date = ""
-
-    if birth_data:
-        # The python-gedcom library returns a tuple (date, place, sources)
-        if isinstance(birth_data, tuple):
-            if birth_data[0]:  # date
-                birth_date = birth_data[0]
-        # For backward compatibility, also handle dictionary format
-        elif isinstance(birth_data, dict):
-            if 'date' in birth_data:
-                birth_date = birth_data['date']
-
-    return birth_date
-
-def get_death_data(individual):
-    """Extract death date from an individual element."""
-    death_data = individual.get_death_data()
-    death_date = ""
-
-    if death_data:
-        # The python-gedcom library returns a tuple (date, place, sources)
-        if isinstance(death_data, tuple):
-            if death_data[0]:  # date
-                death_date = death_data[0]
-        # For backward compatibility, also handle dictionary format
-        elif isinstance(death_data, dict):
-            if 'date' in death_data:
-                death_date = death_data['date']
-
-    return death_date
-
-def get_occupation(individual):
-    """Extract occupation from an individual element."""
-    occupation = individual.get_occupation()
-    return occupation if occupation else "&nbsp;"
-
-def get_attributes(individual):
-    """Extract attributes from an individual element."""
-    attributes = []
-
-    # Get RFN if available
-    rfn = None
-    for child in individual.get_child_elements():
-        if child.get_tag() == "RFN":
-            rfn = child.get_value()
-
-    if rfn:
-        attributes.append({
-            'type': 'RFN',
-            'value': rfn,
-            'notes': '',
-            'sources': '&nbsp;'
-        })
-
-    return attributes
-
-def get_parents(gedcom_parser, individual):
-    """Get parents information for an individual."""
-    families = gedcom_parser.get_families(individual, "FAMC")
+def get_parents(family_graph, pointer):
+    """Get the pointers of an individual's parents and siblings."""
+    run_stats.count('family lookups')
+    families = family_graph.get_child_families(pointer)
     if not families:
         return None
 
     # Get the first family where the individual is a child
     family = families[0]
 
-    # Get parents
-    fathers = gedcom_parser.get_family_members(family, "HUSB")
-    father = fathers[0] if fathers else None
-
-    mothers = gedcom_parser.get_family_members(family, "WIFE")
-    mother = mothers[0] if mothers else None
-
     # Get siblings
-    all_children = gedcom_parser.get_family_members(family, "CHIL")
-    siblings = [child for child in all_children if child != individual]
+    siblings = [child for child in family['children'] if child != pointer]
 
     return {
-        'father': father,
-        'mother': mother,
+        'father': family['husband'],
+        'mother': family['wife'],
         'siblings': siblings
     }
 
-def get_families(gedcom_parser, individual):
-    """Get families information for an individual."""
+def get_families(family_graph, pointer):
+    """Get the pointers of the members of each family an individual is a spouse in."""
+    run_stats.count('family lookups')
     families = []
-    family_elements = gedcom_parser.get_families(individual, "FAMS")
-
-    for family in family_elements:
-        husband = None
-        wife = None
-
-        # Get husband and wife
-        husbands = gedcom_parser.get_family_members(family, "HUSB")
-        if husbands:
-            husband = husbands[0]
-
-        wives = gedcom_parser.get_family_members(family, "WIFE")
-        if wives:
-            wife = wives[0]
-
-        # Get children
-        children = gedcom_parser.get_family_members(family, "CHIL")
 
+    for family in family_graph.get_spouse_families(pointer):
         families.append({
-            'husband': husband,
-            'wife': wife,
-            'children': children
+            'husband': family['husband'],
+            'wife': family['wife'],
+            'children': list(family['children'])
         })
 
     return families
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Descendant charts: the children of an individual, their children and so on, as nested lists
+down to a given number of generations.
+
+The chart of an individual is built from the charts of their children, one generation shorter,
+so each chart is rendered once per build and shared by the charts of all the ancestors that
+include it, instead of walking the whole subtree again for every page.
+"""
+
+from constants import DESCENDANT_DEPTH
+from instrumentation import run_stats
+
+class DescendantResolver:
+    """Caches the descendant chart of each individual, by the number of generations it shows."""
+
+    def __init__(self, family_graph, individuals_data, depth=DESCENDANT_DEPTH):
+        self.family_graph = family_graph
+        self.individuals_data = individuals_data
+        self.depth = depth
+        # (pointer, generations) -> markup of the chart, for the charts shorter than depth shared between pages
+        self._charts = {}
+
+    def get_children(self, pointer):
+        """Return the pointers of an individual's children, family by family, each child once."""
+        children = {}
+        for family in self.family_graph.get_spouse_families(pointer):
+            children.update(dict.fromkeys(family['children']))
+        return list(children)
+
+    def get_chart(self, pointer, generations=None):
+        """Return the list items of the descendants of an individual over `generations` generations (the depth
+        of the resolver by default), or '' if they have no known children."""
+        if generations is None:
+            generations = self.depth
+        if generations <= 0:
+            return ""
+
+        key = (pointer, generations)
+        if key in self._charts:
+            run_stats.count('descendant cache hits')
+            return self._charts[key]
+
+        run_stats.count('descendant cache misses')
+        items = []
+        for child in self.get_children(pointer):
+            person = self.individuals_data[self.family_graph.ids[child]]
+            # Post-order: the chart of each child is complete, and cached, before it is nested in this one
+            child_chart = self.get_chart(child, generations - 1)
+            items.append(f'<li>\n<a href="../../{person.path}">{person.name}</a>')
+            if child_chart:
+                items.append(f'\n<ol>\n{child_chart}</ol>')
+            items.append('</li>\n')
+        chart = ''.join(items)
+
+        # The full-depth chart of an individual is only shown on their own page
+        if generations < self.depth:
+            self._charts[key] = chart
+        return chart
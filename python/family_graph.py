@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+In-memory index of the family relationships found in a GEDCOM file.
+"""
+
+from utils import get_ids_from_pointers
+
+class FamilyGraph:
+    """Parent, child and spouse adjacency keyed by GEDCOM pointer.
+
+    The graph only holds pointers, so it can be pickled and shipped to worker processes.
+    """
+
+    def __init__(self):
+        # Pointers of all individuals in the tree
+        self.individuals = set()
+        # Individual pointer -> individual ID, the key of individuals_data
+        self.ids = {}
+        # Family pointer -> {'husband': pointer, 'wife': pointer, 'children': [pointers]}
+        self.families = {}
+        # Individual pointer -> pointers of the families they are a child in (FAMC)
+        self.child_families = {}
+        # Individual pointer -> pointers of the families they are a spouse in (FAMS)
+        self.spouse_families = {}
+
+    def get_child_families(self, pointer):
+        """Return the families an individual is a child in."""
+        return [self.families[family_pointer] for family_pointer in self.child_families.get(pointer, [])]
+
+    def get_spouse_families(self, pointer):
+        """Return the families an individual is a spouse in."""
+        return [self.families[family_pointer] for family_pointer in self.spouse_families.get(pointer, [])]
+
+def build_family_graph(individual_records, family_records, ids=None):
+    """Build a FamilyGraph from the IndividualRecords and FamilyRecords of a GEDCOM file.
+
+    ids maps each individual pointer to its ID, and is computed if not given.
+    """
+    graph = FamilyGraph()
+    graph.individuals.update(record.pointer for record in individual_records)
+    graph.ids = ids if ids is not None else get_ids_from_pointers(record.pointer for record in individual_records)
+
+    # Resolve family members, keeping only pointers that refer to known individuals
+    for record in family_records:
+        graph.families[record.pointer] = {
+            'husband': record.husband if record.husband in graph.individuals else None,
+            'wife': record.wife if record.wife in graph.individuals else None,
+            'children': [child for child in record.children if child in graph.individuals]
+        }
+
+    # Resolve the FAMC/FAMS links, keeping only pointers that refer to known families
+    for record in individual_records:
+        child_families = [family for family in record.famc if family in graph.families]
+        if child_families:
+            graph.child_families[record.pointer] = child_families
+        spouse_families = [family for family in record.fams if family in graph.families]
+        if spouse_families:
+            graph.spouse_families[record.pointer] = spouse_families
+
+    return graph
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Streaming reader that turns a GEDCOM file into compact individual and family records.
+
+Only one record's lines are held in memory at a time, so memory use scales with the
+records kept by the caller rather than with the number of lines in the file.
+"""
+
+import re
+from collections import namedtuple
+
+# level + ' ' + [pointer + ' ' +] tag + [' ' + line_value], as accepted by python-gedcom
+GEDCOM_LINE_REGEX = re.compile(r'^(0|[1-9]+[0-9]*) (@[^@]+@ |)([A-Za-z0-9_]+)( [^\n\r]*|)$')
+
+# name is a (given_name, surname) tuple, matching IndividualElement.get_name()
+IndividualRecord = namedtuple(
+    'IndividualRecord',
+    ['pointer', 'name', 'gender', 'birth_date', 'death_date', 'occupation', 'rfn', 'famc', 'fams']
+)
+
+FamilyRecord = namedtuple('FamilyRecord', ['pointer', 'husband', 'wife', 'children'])
+
+def parse_line(line_number, line):
+    """Split a GEDCOM line into its (level, pointer, tag, value) parts."""
+    regex_match = GEDCOM_LINE_REGEX.match(line.rstrip('\r\n'))
+    if regex_match is None:
+        raise ValueError(f"Line {line_number} of the GEDCOM file violates GEDCOM format 5.5: {line!r}")
+
+    level, pointer, tag, value = regex_match.groups()
+    return int(level), pointer.rstrip(' '), tag, value[1:]
+
+def read_individual(pointer, lines):
+    """Build an IndividualRecord from the (level, tag, value) lines of an INDI record."""
+    name = None
+    given_name = ""
+    surname = ""
+    found_given_name = False
+    found_surname = False
+    in_name = False
+
+    gender = ""
+    birth_date = ""
+    death_date = ""
+    occupation = ""
+    rfn = ""
+    famc = []
+    fams = []
+
+    parent_tag = None
+    for level, tag, value in lines:
+        if level == 1:
+            # The first NAME with a value wins; otherwise the first one with both GIVN and SURN
+            if in_name and found_given_name and found_surname:
+                name = (given_name, surname)
+            in_name = False
+
+            parent_tag = tag
+            if tag == "NAME" and name is None:
+                if value != "":
+                    parts = value.split('/')
+                    given_name = parts[0].strip()
+                    if len(parts) > 1:
+                        surname = parts[1].strip()
+                    name = (given_name, surname)
+                else:
+                    in_name = True
+            elif tag == "SEX":
+                gender = value
+            elif tag == "OCCU":
+                occupation = value
+            elif tag == "RFN":
+                rfn = value
+            elif tag == "FAMC":
+                famc.append(value)
+            elif tag == "FAMS":
+                fams.append(value)
+        elif level == 2:
+            if in_name and tag == "GIVN":
+                given_name = value
+                found_given_name = True
+            elif in_name and tag == "SURN":
+                surname = value
+                found_surname = True
+            elif tag == "DATE" and parent_tag == "BIRT":
+                birth_date = value
+            elif tag == "DATE" and parent_tag == "DEAT":
+                death_date = value
+
+    if name is None:
+        name = (given_name, surname)
+
+    return IndividualRecord(pointer, name, gender, birth_date, death_date, occupation, rfn, famc, fams)
+
+def read_family(pointer, lines):
+    """Build a FamilyRecord from the (level, tag, value) lines of a FAM record."""
+    husband = None
+    wife = None
+    children = []
+
+    for level, tag, value in lines:
+        if level != 1:
+            continue
+        if tag == "HUSB" and husband is None:
+            husband = value
+        elif tag == "WIFE" and wife is None:
+            wife = value
+        elif tag == "CHIL":
+            children.append(value)
+
+    return FamilyRecord(pointer, husband, wife, children)
+
+def read_record(pointer, tag, lines):
+    """Build the record for a level 0 GEDCOM record, or None if it is not an INDI or FAM record."""
+    if tag == "INDI":
+        return read_individual(pointer, lines)
+    if tag == "FAM":
+        return read_family(pointer, lines)
+    return None
+
+def read_gedcom(file_path):
+    """Yield an IndividualRecord or FamilyRecord for each INDI and FAM record, in file order."""
+    record_pointer = None
+    record_tag = None
+    record_lines = []
+
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        for line_number, line in enumerate(f, 1):
+            level, pointer, tag, value = parse_line(line_number, line)
+
+            if level == 0:
+                record = read_record(record_pointer, record_tag, record_lines)
+                if record is not None:
+                    yield record
+                record_pointer = pointer
+                record_tag = tag
+                record_lines = []
+            elif record_tag in ("INDI", "FAM") and level <= 2:
+                record_lines.append((level, tag, value))
+
+    record = read_record(record_pointer, record_tag, record_lines)
+    if record is not None:
+        yield record
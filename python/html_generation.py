@@ -4,17 +4,19 @@ Functions for generating HTML content from GEDCOM data with new directory struct
 """
 
 import os
-from utils import generate_id_from_pointer
-from data_extraction import (
-    get_name, get_gender, get_birth_data, get_death_data, get_parents, get_families
-)
-from constants import (
-    HTML_TEMPLATE, PARENTS_TEMPLATE,
+import re
+from ancestors import AncestorResolver, get_box_frame, get_chart_start
+from data_extraction import get_parents, get_families
+from instrumentation import run_stats
+from output import DirectoryWriter
+from constants import SURNAMES_DIR
+from templates import (
+    HTML_TEMPLATE, RELATIONSHIP_TEMPLATE, PARENTS_TEMPLATE,
     PARENT_ROW_TEMPLATE, SIBLING_ROW_TEMPLATE, FAMILIES_TEMPLATE,
     FAMILY_ROW_TEMPLATE, CHILD_ROW_TEMPLATE, PEDIGREE_TEMPLATE,
-    ANCESTORS_TEMPLATE, INDEX_HTML_TEMPLATE, INDIVIDUALS_HTML_TEMPLATE,
+    ANCESTORS_TEMPLATE, DESCENDANTS_TEMPLATE, INDEX_HTML_TEMPLATE, INDIVIDUALS_HTML_TEMPLATE,
     SURNAME_ENTRY_TEMPLATE, INDIVIDUAL_ENTRY_TEMPLATE, SURNAME_PAGE_TEMPLATE,
-    SURNAME_INDIVIDUAL_ENTRY_TEMPLATE, SURNAMES_DIR
+    SURNAME_INDIVIDUAL_ENTRY_TEMPLATE, SHARD_NAVIGATION_TEMPLATE, SHARD_LINK_TEMPLATE, PageWriter
 )
 
 def extract_name_parts(name):
@@ -28,16 +30,16 @@ def extract_name_parts(name):
 
 def get_path_for_individual(individual_id, individuals_data):
     """Get the path for an individual using the new structure."""
-    if individual_id in individuals_data and 'path' in individuals_data[individual_id]:
-        return individuals_data[individual_id]['path']
+    if individual_id in individuals_data:
+        return individuals_data[individual_id].path
     else:
         # Fallback to old path structure if not found
         print(f"Warning: Could not find path for individual {individual_id}")
         return f"ppl/{individual_id[0]}/{individual_id[1]}/{individual_id}.html"
 
-def generate_parents_section(gedcom_parser, individual, individual_id, individuals_data):
+def generate_parents_section(family_graph, pointer, individual_id, individuals_data):
     """Generate the HTML for the parents section."""
-    parents_info = get_parents(gedcom_parser, individual)
+    parents_info = get_parents(family_graph, pointer)
     if not parents_info:
         return ""
 
@@ -46,13 +48,13 @@ def generate_parents_section(gedcom_parser, individual, individual_id, individua
     # Add father row
     if parents_info['father']:
         father = parents_info['father']
-        father_id = generate_id_from_pointer(father.get_pointer())
+        father_id = family_graph.ids[father]
         father_path = get_path_for_individual(father_id, individuals_data)
-        father_name = get_name(father)
-        father_birth = get_birth_data(father)
-        father_death = get_death_data(father)
+        father_name = individuals_data[father_id].name
+        father_birth = individuals_data[father_id].birth_date
+        father_death = individuals_data[father_id].death_date
 
-        parents_rows.append(PARENT_ROW_TEMPLATE.format(
+        parents_rows.append(PARENT_ROW_TEMPLATE.render(
             relation="Father",
             parent_path=father_path,
             parent_name=father_name,
@@ -63,13 +65,13 @@ def generate_parents_section(gedcom_parser, individual, individual_id, individua
     # Add mother row
     if parents_info['mother']:
         mother = parents_info['mother']
-        mother_id = generate_id_from_pointer(mother.get_pointer())
+        mother_id = family_graph.ids[mother]
         mother_path = get_path_for_individual(mother_id, individuals_data)
-        mother_name = get_name(mother)
-        mother_birth = get_birth_data(mother)
-        mother_death = get_death_data(mother)
+        mother_name = individuals_data[mother_id].name
+        mother_birth = individuals_data[mother_id].birth_date
+        mother_death = individuals_data[mother_id].death_date
 
-        parents_rows.append(PARENT_ROW_TEMPLATE.format(
+        parents_rows.append(PARENT_ROW_TEMPLATE.render(
             relation="Mother",
             parent_path=mother_path,
             parent_name=mother_name,
@@ -78,9 +80,9 @@ def generate_parents_section(gedcom_parser, individual, individual_id, individua
         ))
 
     # Add self row
-    individual_name = get_name(individual)
-    individual_birth = get_birth_data(individual)
-    individual_death = get_death_data(individual)
+    individual_name = individuals_data[individual_id].name
+    individual_birth = individuals_data[individual_id].birth_date
+    individual_death = individuals_data[individual_id].death_date
 
     parents_rows.append(f"""
 <tr>
@@ -94,34 +96,34 @@ def generate_parents_section(gedcom_parser, individual, individual_id, individua
 
     # Add siblings rows
     for sibling in parents_info['siblings']:
-        sibling_id = generate_id_from_pointer(sibling.get_pointer())
+        sibling_id = family_graph.ids[sibling]
         sibling_path = get_path_for_individual(sibling_id, individuals_data)
-        sibling_name = get_name(sibling)
-        sibling_birth = get_birth_data(sibling)
-        sibling_death = get_death_data(sibling)
-        sibling_gender = get_gender(sibling)
+        sibling_name = individuals_data[sibling_id].name
+        sibling_birth = individuals_data[sibling_id].birth_date
+        sibling_death = individuals_data[sibling_id].death_date
+        sibling_gender = individuals_data[sibling_id].gender
 
         relation = "Sister" if sibling_gender == "female" else "Brother"
 
         sibling_link = f'<a href="../../{sibling_path}">{sibling_name}</a>'
 
-        parents_rows.append(SIBLING_ROW_TEMPLATE.format(
+        parents_rows.append(SIBLING_ROW_TEMPLATE.render(
             relation=relation,
             sibling_link=sibling_link,
             sibling_birth=sibling_birth,
             sibling_death=sibling_death
         ))
 
-    return PARENTS_TEMPLATE.format(parents_rows=''.join(parents_rows))
+    return PARENTS_TEMPLATE.render(parents_rows=''.join(parents_rows))
 
-def generate_families_section(gedcom_parser, individual, individual_id, individuals_data):
+def generate_families_section(family_graph, pointer, individual_id, individuals_data):
     """Generate the HTML for the families section."""
-    families_info = get_families(gedcom_parser, individual)
+    families_info = get_families(family_graph, pointer)
     if not families_info:
         return ""
 
     families_rows = []
-    individual_gender = get_gender(individual)
+    individual_gender = individuals_data[individual_id].gender
 
     for family in families_info:
         husband = family['husband']
@@ -140,22 +142,22 @@ def generate_families_section(gedcom_parser, individual, individual_id, individu
         if not spouse:
             continue
 
-        spouse_id = generate_id_from_pointer(spouse.get_pointer())
+        spouse_id = family_graph.ids[spouse]
         spouse_path = get_path_for_individual(spouse_id, individuals_data)
-        spouse_name = get_name(spouse)
-        spouse_birth = get_birth_data(spouse)
-        spouse_death = get_death_data(spouse)
+        spouse_name = individuals_data[spouse_id].name
+        spouse_birth = individuals_data[spouse_id].birth_date
+        spouse_death = individuals_data[spouse_id].death_date
 
         # Generate children rows
         children_rows = []
         for child in children:
-            child_id = generate_id_from_pointer(child.get_pointer())
+            child_id = family_graph.ids[child]
             child_path = get_path_for_individual(child_id, individuals_data)
-            child_name = get_name(child)
-            child_birth = get_birth_data(child)
-            child_death = get_death_data(child)
+            child_name = individuals_data[child_id].name
+            child_birth = individuals_data[child_id].birth_date
+            child_death = individuals_data[child_id].death_date
 
-            children_rows.append(CHILD_ROW_TEMPLATE.format(
+            children_rows.append(CHILD_ROW_TEMPLATE.render(
                 child_path=child_path,
                 child_name=child_name,
                 child_birth=child_birth,
@@ -163,10 +165,10 @@ def generate_families_section(gedcom_parser, individual, individual_id, individu
             ))
 
         # Get husband and wife names for the family title
-        husband_name = get_name(husband) if husband else "Unknown"
-        wife_name = get_name(wife) if wife else "Unknown"
+        husband_name = individuals_data[family_graph.ids[husband]].name if husband else "Unknown"
+        wife_name = individuals_data[family_graph.ids[wife]].name if wife else "Unknown"
 
-        families_rows.append(FAMILY_ROW_TEMPLATE.format(
+        families_rows.append(FAMILY_ROW_TEMPLATE.render(
             husband_name=husband_name,
             wife_name=wife_name,
             spouse_relation=spouse_relation,
@@ -177,49 +179,151 @@ def generate_families_section(gedcom_parser, individual, individual_id, individu
             children_rows=''.join(children_rows)
         ))
 
-    return FAMILIES_TEMPLATE.format(families_rows=''.join(families_rows))
+    return FAMILIES_TEMPLATE.render(families_rows=''.join(families_rows))
+
+def generate_relationship_section(family_graph, pointer, individuals_data, relationships):
+    """Generate the row giving how an individual is related to the home person, if they are."""
+    if not relationships or pointer not in relationships:
+        return ""
 
-def generate_html_for_individual(gedcom_parser, element, individuals_data):
-    """Generate HTML content for an individual"""
-    individual_id = generate_id_from_pointer(element.get_pointer())
-    name = get_name(element)
-    gender = get_gender(element)
-    birth_date = get_birth_data(element)
-    death_date = get_death_data(element)
+    relationship, home = relationships[pointer]
+    home_id = family_graph.ids[home]
+    return RELATIONSHIP_TEMPLATE.render(
+        relationship=relationship,
+        home_path=get_path_for_individual(home_id, individuals_data),
+        home_name=individuals_data[home_id].name
+    )
+
+def generate_html_for_individual(family_graph, pointer, individuals_data, ancestor_resolver=None, relationships=None,
+                                 descendant_resolver=None):
+    """Generate HTML content for an individual.
+
+    Passing the same AncestorResolver for every page of a build shares its ancestor lookups, and the same
+    DescendantResolver the descendant charts. relationships maps the pointers of the relatives of the home
+    person to (relationship, home pointer).
+    """
+    individual_id = family_graph.ids[pointer]
+    individual_data = individuals_data[individual_id]
+    name = individual_data.name
+    gender = individual_data.gender
+    birth_date = individual_data.birth_date
 
     # Generate parents section
-    parents_section = generate_parents_section(gedcom_parser, element, individual_id, individuals_data)
+    with run_stats.phase('render parents'):
+        parents_section = generate_parents_section(family_graph, pointer, individual_id, individuals_data)
 
     # Generate families section
-    families_section = generate_families_section(gedcom_parser, element, individual_id, individuals_data)
+    with run_stats.phase('render families'):
+        families_section = generate_families_section(family_graph, pointer, individual_id, individuals_data)
 
     # Generate pedigree section
-    pedigree_section = generate_pedigree_section(gedcom_parser, element, individual_id, individuals_data)
+    with run_stats.phase('render pedigree'):
+        pedigree_section = generate_pedigree_section(family_graph, pointer, individual_id, individuals_data)
 
     # Generate ancestors section
-    ancestors_section = generate_ancestors_section(gedcom_parser, element, individual_id, individuals_data)
+    with run_stats.phase('render ancestors'):
+        ancestors_section = generate_ancestors_section(
+            family_graph, pointer, individual_id, individuals_data, ancestor_resolver
+        )
+
+    # Generate descendants section
+    with run_stats.phase('render descendants'):
+        descendants_section = generate_descendants_section(pointer, descendant_resolver)
 
     # Fill in the HTML template
-    html_content = HTML_TEMPLATE.format(
+    html_content = HTML_TEMPLATE.render(
         name=name,
         gender=gender,
         birth_date=birth_date,
         married_name_section="",
+        relationship_section=generate_relationship_section(family_graph, pointer, individuals_data, relationships),
         parents_section=parents_section,
         families_section=families_section,
         attributes_section="",
         pedigree_section=pedigree_section,
         ancestors_section=ancestors_section,
+        descendants_section=descendants_section,
     )
 
     return html_content
 
-def generate_index_html(individuals_data):
-    """Generate the index.html file with surname index."""
+def split_into_shards(weights, shard_size):
+    """Split consecutive entries into (start, end) ranges weighing at most shard_size each.
+
+    An entry heavier than shard_size gets a shard of its own, and a shard_size of 0 keeps all entries together.
+    """
+    if shard_size <= 0:
+        return [(0, len(weights))]
+
+    shards = []
+    start = 0
+    shard_weight = 0
+    for index, weight in enumerate(weights):
+        if index > start and shard_weight + weight > shard_size:
+            shards.append((start, index))
+            start = index
+            shard_weight = 0
+        shard_weight += weight
+    if start < len(weights) or not shards:
+        shards.append((start, len(weights)))
+    return shards
+
+def get_shard_file_name(base_name, number):
+    """Return the file name of a listing shard; the first shard keeps the name of the listing."""
+    return f"{base_name}.html" if number == 0 else f"{base_name}_{number + 1}.html"
+
+def get_distinct_prefix(key, neighbour, length=3):
+    """Return the shortest prefix of key, of at least `length` characters, that neighbour doesn't start with."""
+    while length < len(key) and key[:length] == neighbour[:length]:
+        length += 1
+    return key[:length].rstrip(', ')
+
+def generate_shard_navigation(base_name, keys, shards):
+    """Return the navigation header of each shard of a listing sorted by keys, or '' for unsharded listings."""
+    if len(shards) == 1:
+        return ['']
+
+    # Label each shard by the range of keys it holds, with prefixes long enough to tell neighbours apart
+    links = []
+    for number, (start, end) in enumerate(shards):
+        previous_key = keys[start - 1] if start > 0 else ''
+        next_key = keys[end] if end < len(keys) else ''
+        links.append({
+            'file_name': get_shard_file_name(base_name, number),
+            'first': get_distinct_prefix(keys[start], previous_key),
+            'last': get_distinct_prefix(keys[end - 1], next_key)
+        })
+
+    navigation = []
+    for current in range(len(shards)):
+        shard_links = []
+        for number, link in enumerate(links):
+            SHARD_LINK_TEMPLATE.render_into(
+                shard_links, dict(link, current=' class="CurrentSection"' if number == current else '')
+            )
+        navigation.append(SHARD_NAVIGATION_TEMPLATE.render(shard_links=''.join(shard_links)))
+    return navigation
+
+def remove_stale_shards(base_name, shard_count):
+    """Delete the shards of a listing, and their sidecars, left over from a build that split it into more pages."""
+    shard_regex = re.compile(rf'{re.escape(base_name)}_(\d+)\.html(\.gz|\.br)?')
+    for file_name in os.listdir('.'):
+        regex_match = shard_regex.fullmatch(file_name)
+        if regex_match and int(regex_match.group(1)) > shard_count:
+            os.remove(file_name)
+
+def generate_index_html(individuals_data, shard_size=0, site_writer=None):
+    """Generate the index.html file with surname index, split in pages of about shard_size individuals if set.
+
+    Pages are written with site_writer, into the site directory by default. Returns the paths of the files written.
+    """
+    if site_writer is None:
+        site_writer = DirectoryWriter()
+
     # Group individuals by surname
     surnames = {}
     for individual_id, data in individuals_data.items():
-        surname = data.get('surname', 'Unknown')
+        surname = data.surname
         if surname and surname != '___':
             if surname not in surnames:
                 surnames[surname] = []
@@ -228,133 +332,158 @@ def generate_index_html(individuals_data):
     # Sort surnames
     sorted_surnames = sorted(surnames.keys())
 
-    # Generate surname entries
-    surname_entries = ""
-    for surname in sorted_surnames:
-        # Sort individuals by given name
-        individuals = sorted(surnames[surname], key=lambda x: x[1]['name'])
+    # Split the surnames in pages, weighing each surname by its number of individuals
+    shards = split_into_shards([len(surnames[surname]) for surname in sorted_surnames], shard_size)
+    navigation = generate_shard_navigation('index', sorted_surnames, shards)
 
-        # Generate given names HTML
-        given_names_html = ""
-        for individual_id, data in individuals:
-            given_name = data.get('given_name', '')
-            path = data.get('path', '')
-            name = data.get('name', '')
-            given_names_html += f'<a href="{path}" title="{name}">{given_name}</a>, '
+    file_paths = []
+    for number, (start, end) in enumerate(shards):
+        # Stream the page and its surname entries straight to the file
+        file_path = get_shard_file_name('index', number)
+        with site_writer.open(file_path) as f, PageWriter(f) as writer:
+            INDEX_HTML_TEMPLATE.write_to(writer, {
+                'shard_navigation': navigation[number],
+                'surname_entries': lambda writer: write_surname_entries(writer, surnames, sorted_surnames[start:end])
+            })
+        file_paths.append(file_path)
 
-        # Remove trailing comma and space
-        given_names_html = given_names_html.rstrip(', ')
+    if site_writer.in_place:
+        remove_stale_shards('index', len(shards))
+
+    print("Generated index.html with new paths")
+    return file_paths
+
+def write_surname_entries(writer, surnames, sorted_surnames):
+    """Write the index.html rows of the given surnames, each listing the given names of its individuals."""
+    for surname in sorted_surnames:
+        # Sort individuals by given name
+        individuals = sorted(surnames[surname], key=lambda x: x[1].name)
 
         # Get the surname page path
         surname_path = f"surnames/{surname.lower().replace(' ', '_')}.html"
 
         # Add surname entry
-        surname_entries += SURNAME_ENTRY_TEMPLATE.format(
-            surname=surname,
-            surname_path=surname_path,
-            given_names=given_names_html
-        )
+        SURNAME_ENTRY_TEMPLATE.write_to(writer, {
+            'surname': surname,
+            'surname_path': surname_path,
+            'given_names': lambda writer: write_given_names(writer, individuals)
+        })
+
+def write_given_names(writer, individuals):
+    """Write the comma separated links to the pages of the given individuals."""
+    parts = writer.parts
+    separator = ''
+    for individual_id, data in individuals:
+        parts.append(f'{separator}<a href="{data.path}" title="{data.name}">{data.given_name}</a>')
+        separator = ', '
+
+def write_individual_entries(writer, individuals):
+    """Write the individuals.html rows of the given individuals."""
+    for data in individuals:
+        INDIVIDUAL_ENTRY_TEMPLATE.write_to(writer, {
+            'path': data.path,
+            'name': data.name,
+            'birth_date': data.birth_date,
+            'death_date': data.death_date
+        })
+
+def generate_individuals_html(individuals_data, shard_size=0, site_writer=None):
+    """Generate the individuals.html file with all individuals, split in pages of shard_size individuals if set.
+
+    Pages are written with site_writer, into the site directory by default. Returns the paths of the files written.
+    """
+    if site_writer is None:
+        site_writer = DirectoryWriter()
 
-    # Fill in the template
-    html_content = INDEX_HTML_TEMPLATE.format(
-        surname_entries=surname_entries
-    )
+    # Sort individuals by name
+    sorted_individuals = sorted(individuals_data.values(), key=lambda x: x.name)
 
-    # Write to file
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    shards = split_into_shards([1] * len(sorted_individuals), shard_size)
+    navigation = generate_shard_navigation('individuals', [data.name for data in sorted_individuals], shards)
 
-    print("Generated index.html with new paths")
+    file_paths = []
+    for number, (start, end) in enumerate(shards):
+        # Stream the page and its individual entries straight to the file
+        file_path = get_shard_file_name('individuals', number)
+        with site_writer.open(file_path) as f, PageWriter(f) as writer:
+            INDIVIDUALS_HTML_TEMPLATE.write_to(writer, {
+                'shard_navigation': navigation[number],
+                'individual_entries': lambda writer: write_individual_entries(writer, sorted_individuals[start:end])
+            })
+        file_paths.append(file_path)
 
-def generate_individuals_html(individuals_data):
-    """Generate the individuals.html file with all individuals."""
-    # Sort individuals by name
-    sorted_individuals = sorted(individuals_data.items(), key=lambda x: x[1]['name'])
-
-    # Generate individual entries
-    individual_entries = ""
-    for individual_id, data in sorted_individuals:
-        name = data.get('name', '')
-        birth_date = data.get('birth_date', '')
-        death_date = data.get('death_date', '')
-        path = data.get('path', '')
-
-        individual_entries += INDIVIDUAL_ENTRY_TEMPLATE.format(
-            path=path,
-            name=name,
-            birth_date=birth_date,
-            death_date=death_date
-        )
+    if site_writer.in_place:
+        remove_stale_shards('individuals', len(shards))
 
-    # Fill in the template
-    html_content = INDIVIDUALS_HTML_TEMPLATE.format(
-        individual_entries=individual_entries
-    )
+    print("Generated individuals.html with new paths")
+    return file_paths
 
-    # Write to file
-    with open('individuals.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+def generate_surname_pages(individuals_data, site_writer=None):
+    """Generate HTML files for each surname and return the paths of the files written.
 
-    print("Generated individuals.html with new paths")
+    Pages are written with site_writer, into the site directory by default.
+    """
+    if site_writer is None:
+        site_writer = DirectoryWriter()
 
-def generate_surname_pages(individuals_data):
-    """Generate HTML files for each surname."""
-    # Create the surnames directory if it doesn't exist
-    os.makedirs(SURNAMES_DIR, exist_ok=True)
+    # Generate a page for each surname
+    file_paths = []
+    for surname, individuals in group_by_surname(individuals_data).items():
+        file_paths.append(write_surname_page(surname, individuals, site_writer))
 
-    # Group individuals by surname
+    print(f"Generated {len(file_paths)} surname pages in {SURNAMES_DIR}")
+    return file_paths
+
+def group_by_surname(individuals_data):
+    """Return the individuals of each surname, in the order of individuals_data."""
     surnames = {}
     for individual_id, data in individuals_data.items():
-        surname = data.get('surname', '___')
+        surname = data.surname
         if surname not in surnames:
             surnames[surname] = []
         surnames[surname].append(data)
-
-    # Generate a page for each surname
-    for surname, individuals in surnames.items():
-        # Sort individuals by given name
-        sorted_individuals = sorted(individuals, key=lambda x: x.get('given_name', ''))
-
-        # Generate individual entries
-        individual_entries = ""
-        for data in sorted_individuals:
-            given_name = data.get('given_name', '')
-            birth_date = data.get('birth_date', '')
-            path = data.get('path', '')
-
-            individual_entries += SURNAME_INDIVIDUAL_ENTRY_TEMPLATE.format(
-                path=path,
-                given_name=given_name,
-                birth_date=birth_date
-            )
-
-        # Fill in the template
-        html_content = SURNAME_PAGE_TEMPLATE.format(
-            surname=surname,
-            individual_entries=individual_entries
-        )
-
-        # Create a safe filename
-        safe_surname = surname.lower().replace(' ', '_')
-        file_path = os.path.join(SURNAMES_DIR, f"{safe_surname}.html")
-
-        # Write to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        print(f"Generated surname page for {surname} at {file_path}")
-
-def generate_pedigree_section(gedcom_parser, element, individual_id, individuals_data):
+    return surnames
+
+def get_surname_page_file_path(surname):
+    """Return the file path of the page of a surname."""
+    # Create a safe filename
+    safe_surname = surname.lower().replace(' ', '_')
+    return os.path.join(SURNAMES_DIR, f"{safe_surname}.html")
+
+def write_surname_page(surname, individuals, site_writer):
+    """Write the page listing the individuals of a surname with site_writer and return its file path."""
+    # Sort individuals by given name
+    sorted_individuals = sorted(individuals, key=lambda x: x.given_name)
+    file_path = get_surname_page_file_path(surname)
+
+    # Stream the page and its individual entries straight to the file
+    with site_writer.open(file_path) as f, PageWriter(f) as writer:
+        SURNAME_PAGE_TEMPLATE.write_to(writer, {
+            'surname': surname,
+            'individual_entries': lambda writer: write_surname_individual_entries(writer, sorted_individuals)
+        })
+    return file_path
+
+def write_surname_individual_entries(writer, individuals):
+    """Write the surname page rows of the given individuals."""
+    for data in individuals:
+        SURNAME_INDIVIDUAL_ENTRY_TEMPLATE.write_to(writer, {
+            'path': data.path,
+            'given_name': data.given_name,
+            'birth_date': data.birth_date
+        })
+
+def generate_pedigree_section(family_graph, pointer, individual_id, individuals_data):
     """Generate the HTML for the pedigree section."""
-    name = get_name(element)
+    name = individuals_data[individual_id].name
 
     # Get families information
-    families_info = get_families(gedcom_parser, element)
+    families_info = get_families(family_graph, pointer)
     if not families_info:
         return ""
 
     # Start with the current individual
-    pedigree_content = f'<li class="thisperson">\n            {name}'
+    pedigree_content = [f'<li class="thisperson">\n            {name}']
 
     # Add spouses and children if any
     spouses_list = []
@@ -364,7 +493,7 @@ def generate_pedigree_section(gedcom_parser, element, individual_id, individuals
         children = family['children']
 
         # Determine spouse based on individual's gender
-        individual_gender = get_gender(element)
+        individual_gender = individuals_data[individual_id].gender
         if individual_gender == "male":
             spouse = wife
         else:
@@ -374,360 +503,74 @@ def generate_pedigree_section(gedcom_parser, element, individual_id, individuals
         if not spouse:
             continue
 
-        spouse_id = generate_id_from_pointer(spouse.get_pointer())
+        spouse_id = family_graph.ids[spouse]
         spouse_path = get_path_for_individual(spouse_id, individuals_data)
-        spouse_name = get_name(spouse)
+        spouse_name = individuals_data[spouse_id].name
 
         # Create spouse entry
-        spouse_entry = f'<li class="spouse">\n                    <a href="../../../FamilyTree/{spouse_path}">{spouse_name}</a>'
+        spouses_list.append(
+            f'<li class="spouse">\n                    <a href="../../../FamilyTree/{spouse_path}">{spouse_name}</a>'
+        )
 
         # Add children if any
         if children:
             children_list = []
             for child in children:
-                child_id = generate_id_from_pointer(child.get_pointer())
+                child_id = family_graph.ids[child]
                 child_path = get_path_for_individual(child_id, individuals_data)
-                child_name = get_name(child)
+                child_name = individuals_data[child_id].name
 
                 children_list.append(f'<li>\n                            <a href="../../../FamilyTree/{child_path}">{child_name}</a>\n                        </li>')
 
             if children_list:
-                spouse_entry += '<ol>' + ''.join(children_list) + '</ol>'
+                spouses_list.append('<ol>')
+                spouses_list += children_list
+                spouses_list.append('</ol>')
 
-        spouse_entry += '</li>'
-        spouses_list.append(spouse_entry)
+        spouses_list.append('</li>')
 
     # Add spouses list if any
     if spouses_list:
-        pedigree_content += '<ol class="spouselist">' + ''.join(spouses_list) + '</ol>'
+        pedigree_content.append('<ol class="spouselist">')
+        pedigree_content += spouses_list
+        pedigree_content.append('</ol>')
 
-    pedigree_content += '</li>'
+    pedigree_content.append('</li>')
 
-    return PEDIGREE_TEMPLATE.format(pedigree_content=pedigree_content)
+    return PEDIGREE_TEMPLATE.render(pedigree_content=''.join(pedigree_content))
 
-def generate_ancestors_section(gedcom_parser, element, individual_id, individuals_data):
+def generate_ancestors_section(family_graph, pointer, individual_id, individuals_data, ancestor_resolver=None):
     """Generate the HTML for the ancestors section."""
-    name = get_name(element)
-    birth_date = get_birth_data(element)
-    death_date = get_death_data(element)
-    gender_class = "male" if get_gender(element) == "male" else "female"
+    if ancestor_resolver is None:
+        ancestor_resolver = AncestorResolver(family_graph, individuals_data)
 
-    # Get parents information
-    parents_info = get_parents(gedcom_parser, element)
+    # Get the known ancestors, by Ahnentafel number
+    ancestors = ancestor_resolver.get_ancestors(pointer)
 
     # If no parents, return empty string
-    if not parents_info or (not parents_info['father'] and not parents_info['mother']):
+    if len(ancestors) == 1:
         return ""
 
     # Start with the current individual
-    ancestors_content = f'''
-    <div id="treeContainer" style="width:1234px; height:1200px; top: 0px">
-    <div class="boxbg {gender_class} AncCol0" style="top: 530px; left: 6px;">
-        <a class="noThumb" href="../../{get_path_for_individual(individual_id, individuals_data)}">
-        {name}<br/>*{birth_date or ''}<br/>+{death_date or '...'}
-        </a>
-    </div>
-    <div class="shadow" style="top: 535px; left: 10px;"></div>
-    '''
-
-    # Add father if available
-    if parents_info['father']:
-        father = parents_info['father']
-        father_id = generate_id_from_pointer(father.get_pointer())
-        father_path = get_path_for_individual(father_id, individuals_data)
-        father_name = get_name(father)
-        father_birth = get_birth_data(father)
-        father_death = get_death_data(father)
-
-        ancestors_content += f'''
-        <div class="bvline" style="top: 550px; left: 285px; width: 15px"></div>
-        <div class="gvline" style="top: 555px; left: 285px; width: 20px"></div>
-        <div class="boxbg male AncCol1" style="top: 230px; left: 316px;">
-            <a class="noThumb" href="../../../FamilyTree/{father_path}">
-            {father_name}<br/>*{father_birth or ''}<br/>+{father_death or '...'}
-            </a>
-        </div>
-        <div class="shadow" style="top: 235px; left: 320px;"></div>
-        <div class="bvline" style="top: 250px; left: 300px; width: 15px;"></div>
-        <div class="bhline" style="top: 250px; left: 300px; height: 301px;"></div>
-        '''
-
-        # Add paternal grandfather (father's father) if available
-        father_parents_info = get_parents(gedcom_parser, father)
-        if father_parents_info and father_parents_info['father']:
-            paternal_grandfather = father_parents_info['father']
-            paternal_grandfather_id = generate_id_from_pointer(paternal_grandfather.get_pointer())
-            paternal_grandfather_path = get_path_for_individual(paternal_grandfather_id, individuals_data)
-            paternal_grandfather_name = get_name(paternal_grandfather)
-            paternal_grandfather_birth = get_birth_data(paternal_grandfather)
-            paternal_grandfather_death = get_death_data(paternal_grandfather)
-
-            ancestors_content += f'''
-            <div class="bvline" style="top: 250px; left: 595px; width: 15px"></div>
-            <div class="gvline" style="top: 255px; left: 595px; width: 20px"></div>
-            <div class="boxbg male AncCol2" style="top: 80px; left: 626px;">
-                <a class="noThumb" href="../../../FamilyTree/{paternal_grandfather_path}">
-                {paternal_grandfather_name}<br/>*{paternal_grandfather_birth or ''}<br/>+{paternal_grandfather_death or '...'}
-                </a>
-            </div>
-            <div class="shadow" style="top: 85px; left: 630px;"></div>
-            <div class="bvline" style="top: 100px; left: 610px; width: 15px;"></div>
-            <div class="bhline" style="top: 100px; left: 610px; height: 151px;"></div>
-            '''
-
-            # Add paternal great-grandfather (father's father's father) if available
-            paternal_grandfather_parents_info = get_parents(gedcom_parser, paternal_grandfather)
-            if paternal_grandfather_parents_info and paternal_grandfather_parents_info['father']:
-                paternal_great_grandfather = paternal_grandfather_parents_info['father']
-                paternal_great_grandfather_id = generate_id_from_pointer(paternal_great_grandfather.get_pointer())
-                paternal_great_grandfather_path = get_path_for_individual(paternal_great_grandfather_id, individuals_data)
-                paternal_great_grandfather_name = get_name(paternal_great_grandfather)
-                paternal_great_grandfather_birth = get_birth_data(paternal_great_grandfather)
-                paternal_great_grandfather_death = get_death_data(paternal_great_grandfather)
-
-                ancestors_content += f'''
-                <div class="bvline" style="top: 100px; left: 905px; width: 15px"></div>
-                <div class="gvline" style="top: 105px; left: 905px; width: 20px"></div>
-                <div class="boxbg male AncCol3" style="top: 5px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{paternal_great_grandfather_path}">
-                    {paternal_great_grandfather_name}<br/>*{paternal_great_grandfather_birth or ''}<br/>+{paternal_great_grandfather_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 10px; left: 940px;"></div>
-                <div class="bvline" style="top: 25px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 25px; left: 920px; height: 76px;"></div>
-                '''
-
-            # Add paternal great-grandmother (father's father's mother) if available
-            if paternal_grandfather_parents_info and paternal_grandfather_parents_info['mother']:
-                paternal_great_grandmother = paternal_grandfather_parents_info['mother']
-                paternal_great_grandmother_id = generate_id_from_pointer(paternal_great_grandmother.get_pointer())
-                paternal_great_grandmother_path = get_path_for_individual(paternal_great_grandmother_id, individuals_data)
-                paternal_great_grandmother_name = get_name(paternal_great_grandmother)
-                paternal_great_grandmother_birth = get_birth_data(paternal_great_grandmother)
-                paternal_great_grandmother_death = get_death_data(paternal_great_grandmother)
-
-                ancestors_content += f'''
-                <div class="boxbg female AncCol3" style="top: 155px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{paternal_great_grandmother_path}">
-                    {paternal_great_grandmother_name}<br/>*{paternal_great_grandmother_birth or ''}<br/>+{paternal_great_grandmother_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 160px; left: 940px;"></div>
-                <div class="bvline" style="top: 175px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 100px; left: 920px; height: 76px;"></div>
-                '''
-
-        # Add paternal grandmother (father's mother) if available
-        if father_parents_info and father_parents_info['mother']:
-            paternal_grandmother = father_parents_info['mother']
-            paternal_grandmother_id = generate_id_from_pointer(paternal_grandmother.get_pointer())
-            paternal_grandmother_path = get_path_for_individual(paternal_grandmother_id, individuals_data)
-            paternal_grandmother_name = get_name(paternal_grandmother)
-            paternal_grandmother_birth = get_birth_data(paternal_grandmother)
-            paternal_grandmother_death = get_death_data(paternal_grandmother)
-
-            ancestors_content += f'''
-            <div class="boxbg female AncCol2" style="top: 380px; left: 626px;">
-                <a class="noThumb" href="../../../FamilyTree/{paternal_grandmother_path}">
-                {paternal_grandmother_name}<br/>*{paternal_grandmother_birth or ''}<br/>+{paternal_grandmother_death or '...'}
-                </a>
-            </div>
-            <div class="shadow" style="top: 385px; left: 630px;"></div>
-            <div class="bvline" style="top: 400px; left: 610px; width: 15px;"></div>
-            <div class="bhline" style="top: 250px; left: 610px; height: 151px;"></div>
-            '''
-
-            # Add paternal great-grandfather (father's mother's father) if available
-            paternal_grandmother_parents_info = get_parents(gedcom_parser, paternal_grandmother)
-            if paternal_grandmother_parents_info and paternal_grandmother_parents_info['father']:
-                paternal_great_grandfather2 = paternal_grandmother_parents_info['father']
-                paternal_great_grandfather2_id = generate_id_from_pointer(paternal_great_grandfather2.get_pointer())
-                paternal_great_grandfather2_path = get_path_for_individual(paternal_great_grandfather2_id, individuals_data)
-                paternal_great_grandfather2_name = get_name(paternal_great_grandfather2)
-                paternal_great_grandfather2_birth = get_birth_data(paternal_great_grandfather2)
-                paternal_great_grandfather2_death = get_death_data(paternal_great_grandfather2)
-
-                ancestors_content += f'''
-                <div class="bvline" style="top: 400px; left: 905px; width: 15px"></div>
-                <div class="gvline" style="top: 405px; left: 905px; width: 20px"></div>
-                <div class="boxbg male AncCol3" style="top: 305px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{paternal_great_grandfather2_path}">
-                    {paternal_great_grandfather2_name}<br/>*{paternal_great_grandfather2_birth or ''}<br/>+{paternal_great_grandfather2_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 310px; left: 940px;"></div>
-                <div class="bvline" style="top: 325px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 325px; left: 920px; height: 76px;"></div>
-                '''
-
-            # Add paternal great-grandmother (father's mother's mother) if available
-            if paternal_grandmother_parents_info and paternal_grandmother_parents_info['mother']:
-                paternal_great_grandmother2 = paternal_grandmother_parents_info['mother']
-                paternal_great_grandmother2_id = generate_id_from_pointer(paternal_great_grandmother2.get_pointer())
-                paternal_great_grandmother2_path = get_path_for_individual(paternal_great_grandmother2_id, individuals_data)
-                paternal_great_grandmother2_name = get_name(paternal_great_grandmother2)
-                paternal_great_grandmother2_birth = get_birth_data(paternal_great_grandmother2)
-                paternal_great_grandmother2_death = get_death_data(paternal_great_grandmother2)
-
-                ancestors_content += f'''
-                <div class="boxbg female AncCol3" style="top: 455px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{paternal_great_grandmother2_path}">
-                    {paternal_great_grandmother2_name}<br/>*{paternal_great_grandmother2_birth or ''}<br/>+{paternal_great_grandmother2_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 460px; left: 940px;"></div>
-                <div class="bvline" style="top: 475px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 400px; left: 920px; height: 76px;"></div>
-                '''
-
-    # Add mother if available
-    if parents_info['mother']:
-        mother = parents_info['mother']
-        mother_id = generate_id_from_pointer(mother.get_pointer())
-        mother_path = get_path_for_individual(mother_id, individuals_data)
-        mother_name = get_name(mother)
-        mother_birth = get_birth_data(mother)
-        mother_death = get_death_data(mother)
-
-        ancestors_content += f'''
-        <div class="boxbg female AncCol1" style="top: 830px; left: 316px;">
-            <a class="noThumb" href="../../../FamilyTree/{mother_path}">
-            {mother_name}<br/>*{mother_birth or ''}<br/>+{mother_death or '...'}
-            </a>
-        </div>
-        <div class="shadow" style="top: 835px; left: 320px;"></div>
-        <div class="bvline" style="top: 850px; left: 300px; width: 15px;"></div>
-        <div class="bhline" style="top: 550px; left: 300px; height: 301px;"></div>
-        '''
-
-        # Add maternal grandfather (mother's father) if available
-        mother_parents_info = get_parents(gedcom_parser, mother)
-        if mother_parents_info and mother_parents_info['father']:
-            maternal_grandfather = mother_parents_info['father']
-            maternal_grandfather_id = generate_id_from_pointer(maternal_grandfather.get_pointer())
-            maternal_grandfather_path = get_path_for_individual(maternal_grandfather_id, individuals_data)
-            maternal_grandfather_name = get_name(maternal_grandfather)
-            maternal_grandfather_birth = get_birth_data(maternal_grandfather)
-            maternal_grandfather_death = get_death_data(maternal_grandfather)
-
-            ancestors_content += f'''
-            <div class="bvline" style="top: 850px; left: 595px; width: 15px"></div>
-            <div class="gvline" style="top: 855px; left: 595px; width: 20px"></div>
-            <div class="boxbg male AncCol2" style="top: 680px; left: 626px;">
-                <a class="noThumb" href="../../../FamilyTree/{maternal_grandfather_path}">
-                {maternal_grandfather_name}<br/>*{maternal_grandfather_birth or ''}<br/>+{maternal_grandfather_death or '...'}
-                </a>
-            </div>
-            <div class="shadow" style="top: 685px; left: 630px;"></div>
-            <div class="bvline" style="top: 700px; left: 610px; width: 15px;"></div>
-            <div class="bhline" style="top: 700px; left: 610px; height: 151px;"></div>
-            '''
-
-            # Add maternal great-grandfather (mother's father's father) if available
-            maternal_grandfather_parents_info = get_parents(gedcom_parser, maternal_grandfather)
-            if maternal_grandfather_parents_info and maternal_grandfather_parents_info['father']:
-                maternal_great_grandfather = maternal_grandfather_parents_info['father']
-                maternal_great_grandfather_id = generate_id_from_pointer(maternal_great_grandfather.get_pointer())
-                maternal_great_grandfather_path = get_path_for_individual(maternal_great_grandfather_id, individuals_data)
-                maternal_great_grandfather_name = get_name(maternal_great_grandfather)
-                maternal_great_grandfather_birth = get_birth_data(maternal_great_grandfather)
-                maternal_great_grandfather_death = get_death_data(maternal_great_grandfather)
-
-                ancestors_content += f'''
-                <div class="bvline" style="top: 700px; left: 905px; width: 15px"></div>
-                <div class="gvline" style="top: 705px; left: 905px; width: 20px"></div>
-                <div class="boxbg male AncCol3" style="top: 605px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{maternal_great_grandfather_path}">
-                    {maternal_great_grandfather_name}<br/>*{maternal_great_grandfather_birth or ''}<br/>+{maternal_great_grandfather_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 610px; left: 940px;"></div>
-                <div class="bvline" style="top: 625px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 625px; left: 920px; height: 76px;"></div>
-                '''
-
-            # Add maternal great-grandmother (mother's father's mother) if available
-            if maternal_grandfather_parents_info and maternal_grandfather_parents_info['mother']:
-                maternal_great_grandmother = maternal_grandfather_parents_info['mother']
-                maternal_great_grandmother_id = generate_id_from_pointer(maternal_great_grandmother.get_pointer())
-                maternal_great_grandmother_path = get_path_for_individual(maternal_great_grandmother_id, individuals_data)
-                maternal_great_grandmother_name = get_name(maternal_great_grandmother)
-                maternal_great_grandmother_birth = get_birth_data(maternal_great_grandmother)
-                maternal_great_grandmother_death = get_death_data(maternal_great_grandmother)
-
-                ancestors_content += f'''
-                <div class="boxbg female AncCol3" style="top: 755px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{maternal_great_grandmother_path}">
-                    {maternal_great_grandmother_name}<br/>*{maternal_great_grandmother_birth or ''}<br/>+{maternal_great_grandmother_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 760px; left: 940px;"></div>
-                <div class="bvline" style="top: 775px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 700px; left: 920px; height: 76px;"></div>
-                '''
-
-        # Add maternal grandmother (mother's mother) if available
-        if mother_parents_info and mother_parents_info['mother']:
-            maternal_grandmother = mother_parents_info['mother']
-            maternal_grandmother_id = generate_id_from_pointer(maternal_grandmother.get_pointer())
-            maternal_grandmother_path = get_path_for_individual(maternal_grandmother_id, individuals_data)
-            maternal_grandmother_name = get_name(maternal_grandmother)
-            maternal_grandmother_birth = get_birth_data(maternal_grandmother)
-            maternal_grandmother_death = get_death_data(maternal_grandmother)
-
-            ancestors_content += f'''
-            <div class="boxbg female AncCol2" style="top: 980px; left: 626px;">
-                <a class="noThumb" href="../../../FamilyTree/{maternal_grandmother_path}">
-                {maternal_grandmother_name}<br/>*{maternal_grandmother_birth or ''}<br/>+{maternal_grandmother_death or '...'}
-                </a>
-            </div>
-            <div class="shadow" style="top: 985px; left: 630px;"></div>
-            <div class="bvline" style="top: 1000px; left: 610px; width: 15px;"></div>
-            <div class="bhline" style="top: 850px; left: 610px; height: 151px;"></div>
-            '''
-
-            # Add maternal great-grandfather (mother's mother's father) if available
-            maternal_grandmother_parents_info = get_parents(gedcom_parser, maternal_grandmother)
-            if maternal_grandmother_parents_info and maternal_grandmother_parents_info['father']:
-                maternal_great_grandfather2 = maternal_grandmother_parents_info['father']
-                maternal_great_grandfather2_id = generate_id_from_pointer(maternal_great_grandfather2.get_pointer())
-                maternal_great_grandfather2_path = get_path_for_individual(maternal_great_grandfather2_id, individuals_data)
-                maternal_great_grandfather2_name = get_name(maternal_great_grandfather2)
-                maternal_great_grandfather2_birth = get_birth_data(maternal_great_grandfather2)
-                maternal_great_grandfather2_death = get_death_data(maternal_great_grandfather2)
-
-                ancestors_content += f'''
-                <div class="bvline" style="top: 1000px; left: 905px; width: 15px"></div>
-                <div class="gvline" style="top: 1005px; left: 905px; width: 20px"></div>
-                <div class="boxbg male AncCol3" style="top: 905px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{maternal_great_grandfather2_path}">
-                    {maternal_great_grandfather2_name}<br/>*{maternal_great_grandfather2_birth or ''}<br/>+{maternal_great_grandfather2_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 910px; left: 940px;"></div>
-                <div class="bvline" style="top: 925px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 925px; left: 920px; height: 76px;"></div>
-                '''
-
-            # Add maternal great-grandmother (mother's mother's mother) if available
-            if maternal_grandmother_parents_info and maternal_grandmother_parents_info['mother']:
-                maternal_great_grandmother2 = maternal_grandmother_parents_info['mother']
-                maternal_great_grandmother2_id = generate_id_from_pointer(maternal_great_grandmother2.get_pointer())
-                maternal_great_grandmother2_path = get_path_for_individual(maternal_great_grandmother2_id, individuals_data)
-                maternal_great_grandmother2_name = get_name(maternal_great_grandmother2)
-                maternal_great_grandmother2_birth = get_birth_data(maternal_great_grandmother2)
-                maternal_great_grandmother2_death = get_death_data(maternal_great_grandmother2)
-
-                ancestors_content += f'''
-                <div class="boxbg female AncCol3" style="top: 1055px; left: 936px;">
-                    <a class="noThumb" href="../../../FamilyTree/{maternal_great_grandmother2_path}">
-                    {maternal_great_grandmother2_name}<br/>*{maternal_great_grandmother2_birth or ''}<br/>+{maternal_great_grandmother2_death or '...'}
-                    </a>
-                </div>
-                <div class="shadow" style="top: 1060px; left: 940px;"></div>
-                <div class="bvline" style="top: 1075px; left: 920px; width: 15px;"></div>
-                <div class="bhline" style="top: 1000px; left: 920px; height: 76px;"></div>
-                '''
-
-    return ANCESTORS_TEMPLATE.format(ancestors_content=ancestors_content)
+    path, label = ancestor_resolver.get_box(pointer)
+    gender_class = "male" if individuals_data[individual_id].gender == "male" else "female"
+    parts = [get_chart_start(ancestor_resolver.depth, gender_class, path, label)]
+
+    # Add each known ancestor, using the precomputed markup around its box
+    for number, ancestor in ancestors.items():
+        if number > 1:
+            before_path, before_label, after_label = get_box_frame(ancestor_resolver.depth, number)
+            ancestor_path, ancestor_label = ancestor_resolver.get_box(ancestor)
+            parts += (before_path, ancestor_path, before_label, ancestor_label, after_label)
+
+    return ANCESTORS_TEMPLATE.render(ancestors_content=''.join(parts))
+
+def generate_descendants_section(pointer, descendant_resolver=None):
+    """Generate the HTML for the descendants section, left out without a DescendantResolver or known children."""
+    if descendant_resolver is None:
+        return ""
+
+    descendants_content = descendant_resolver.get_chart(pointer)
+    if not descendants_content:
+        return ""
+    return DESCENDANTS_TEMPLATE.render(descendants_content=descendants_content)
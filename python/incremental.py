@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Build manifest used to only regenerate the pages whose inputs changed since the last run.
+"""
+
+import hashlib
+import json
+import os
+
+from constants import MANIFEST_FILE
+from data_extraction import get_parents, get_families
+from output import remove_sidecars
+
+# Fields of an individual that can appear on a page
+PERSON_FIELDS = ('pointer', 'name', 'surname', 'given_name', 'gender', 'birth_date', 'death_date', 'path')
+
+# Modules whose contents shape every generated page
+GENERATOR_MODULES = ('constants.py', 'templates.py', 'html_generation.py', 'ancestors.py', 'descendants.py')
+
+def get_generator_fingerprint(sidecars=()):
+    """Hash the templates, rendering code and sidecar extensions, so any change to them rebuilds every page."""
+    hash_obj = hashlib.sha1(repr(tuple(sidecars)).encode('utf-8'))
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    for module in GENERATOR_MODULES:
+        with open(os.path.join(module_dir, module), 'rb') as f:
+            hash_obj.update(f.read())
+    return hash_obj.hexdigest()
+
+def get_person_fields(person):
+    """Return the fields of a Person that can appear on a page."""
+    return [getattr(person, field) for field in PERSON_FIELDS]
+
+def compute_page_hash(family_graph, pointer, individuals_data, ancestor_resolver, relationships=None,
+                      descendant_resolver=None):
+    """Hash everything rendered into an individual's page, including the relatives it shows."""
+    parents_info = get_parents(family_graph, pointer)
+    families_info = get_families(family_graph, pointer)
+    ancestors = ancestor_resolver.get_ancestors(pointer)
+
+    relatives = {pointer}
+    relatives.update(ancestors.values())
+    if parents_info:
+        relatives.update([parents_info['father'], parents_info['mother']])
+        relatives.update(parents_info['siblings'])
+    for family in families_info:
+        relatives.update([family['husband'], family['wife']])
+        relatives.update(family['children'])
+    if relationships and pointer in relationships:
+        # The relationship line links to the home person
+        relatives.add(relationships[pointer][1])
+    relatives.discard(None)
+
+    page_inputs = {
+        'pointer': pointer,
+        'parents': parents_info,
+        'families': families_info,
+        'ancestors': ancestors,
+        'people': {
+            relative: get_person_fields(individuals_data[family_graph.ids[relative]])
+            for relative in relatives
+        }
+    }
+    if relationships and pointer in relationships:
+        page_inputs['relationship'] = relationships[pointer]
+    if descendant_resolver is not None and descendant_resolver.depth > 0:
+        # The chart holds the names and paths of all the descendants it shows
+        page_inputs['descendants'] = descendant_resolver.get_chart(pointer)
+    return hashlib.sha1(json.dumps(page_inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """Load the manifest of the previous build, or an empty one if there is none."""
+    if not os.path.exists(manifest_file):
+        return {'generator': None, 'pages': {}, 'surname_pages': []}
+
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(manifest, manifest_file=MANIFEST_FILE):
+    """Write the manifest of the current build."""
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+def remove_manifest(manifest_file=MANIFEST_FILE):
+    """Delete the manifest, so the next incremental build rewrites every page instead of trusting its hashes."""
+    if os.path.exists(manifest_file):
+        os.remove(manifest_file)
+
+def find_changed_pages(manifest, pages, generator):
+    """Return the pointers of the pages that must be (re)written.
+
+    `pages` maps each pointer to {'hash': ..., 'path': ...} for the current build.
+    """
+    if manifest['generator'] != generator:
+        return list(pages)
+
+    changed = []
+    for pointer, page in pages.items():
+        previous = manifest['pages'].get(pointer)
+        if previous != page or not os.path.exists(page['path']):
+            changed.append(pointer)
+    return changed
+
+def remove_stale_files(previous_paths, current_paths):
+    """Delete files written by the previous build that the current build no longer produces."""
+    removed = []
+    for path in sorted(set(previous_paths) - set(current_paths)):
+        if os.path.exists(path):
+            os.remove(path)
+            remove_sidecars([path])
+            removed.append(path)
+
+            # Drop the surname directory once its last page is gone
+            directory = os.path.dirname(path)
+            if directory and not os.listdir(directory):
+                os.rmdir(directory)
+    return removed
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Timers and counters collected during a build, and the JSON run report they are written to.
+
+Phases can be nested: each phase is credited with its own time only, so the phase timers of a
+build add up to the time spent inside them.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+class RunStats:
+    """Seconds spent in each phase and totals of each counter for the current process."""
+
+    def __init__(self):
+        self.timers = {}
+        self.counters = {}
+        # Time spent in the nested phases of each phase being timed, innermost last
+        self._child_seconds = []
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block, leaving out the time of the phases nested in it."""
+        self._child_seconds.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            child_seconds = self._child_seconds.pop()
+            self.timers[name] = self.timers.get(name, 0.0) + elapsed - child_seconds
+            if self._child_seconds:
+                self._child_seconds[-1] += elapsed
+
+    def timed_iter(self, name, iterable):
+        """Yield the items of iterable, timing the work of producing them as the phase `name`."""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, name, amount=1):
+        """Add amount to the counter `name`."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self):
+        """Return the timers and counters as plain dicts."""
+        return {'timers': dict(self.timers), 'counters': dict(self.counters)}
+
+    def merge(self, stats):
+        """Add the timers and counters of another process, as returned by as_dict or take."""
+        for name, seconds in stats['timers'].items():
+            self.timers[name] = self.timers.get(name, 0.0) + seconds
+        for name, amount in stats['counters'].items():
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def take(self):
+        """Return the timers and counters collected so far and start again from zero."""
+        stats = self.as_dict()
+        self.reset()
+        return stats
+
+    def reset(self):
+        """Forget all timers and counters."""
+        self.timers.clear()
+        self.counters.clear()
+
+# Stats of the running build, shared by every module of the generator
+run_stats = RunStats()
+
+def write_run_report(report_file, wall_seconds, arguments, profile=None):
+    """Write the timers and counters of the build, and its profile if one was taken, as JSON."""
+    report = {
+        'wall_seconds': wall_seconds,
+        'arguments': arguments,
+        'phases': dict(sorted(run_stats.timers.items(), key=lambda item: -item[1])),
+        'counters': dict(sorted(run_stats.counters.items())),
+    }
+    if profile is not None:
+        report['profile'] = profile
+
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=1)
@@ -4,16 +4,39 @@ Main script to generate HTML files from a GEDCOM file with a new directory struc
 The HTML files will be saved in the ppl directory organized by surname.
 """
 
-import os
+import argparse
+import cProfile
+import pstats
 import re
-from gedcom.element.individual import IndividualElement
-from gedcom.parser import Parser
+import sys
+import time
+import tracemalloc
+from multiprocessing import Pool
 
-from constants import GEDCOM_FILE
-from utils import (
-    generate_id_from_pointer, get_individual_file_path, get_individual_relative_path
+from ancestors import AncestorResolver
+from constants import (
+    GEDCOM_FILE, ANCESTOR_DEPTH, MAX_ANCESTOR_DEPTH, DESCENDANT_DEPTH, REPORT_FILE, PROFILE_FILE, STATIC_SITE_FILES, OUTPUT_DIR, SURNAMES_DIR, SNAPSHOT_FILE
 )
-from data_extraction import get_name, get_birth_data, get_death_data
+from descendants import DescendantResolver
+from family_graph import build_family_graph
+from gedcom_reader import IndividualRecord, read_gedcom
+from incremental import (
+    compute_page_hash, find_changed_pages, get_generator_fingerprint, load_manifest, remove_manifest,
+    remove_stale_files, save_manifest
+)
+from instrumentation import run_stats, write_run_report
+from output import (
+    ARCHIVE_FORMATS, PENDING_WRITES_PER_THREAD, ArchiveWriter, DirectoryWriter, ProgressCounter,
+    get_sidecar_extensions, remove_files_not_written, remove_sidecars
+)
+from person import Person
+from preview import PREVIEW_CACHE_SIZE, PreviewSite, serve_preview
+from relationships import get_home_relationships
+from search_index import generate_search_index
+from watch import SiteWatcher
+from snapshot import get_snapshot_key, load_snapshot, save_snapshot
+from utils import get_ids_from_pointers, get_individual_relative_paths
+from data_extraction import format_name, format_gender
 from html_generation import (
     generate_html_for_individual, generate_index_html, generate_individuals_html, generate_surname_pages
 )
@@ -32,61 +55,451 @@ def create_safe_filename(text):
     # Replace spaces with underscores and remove special characters
     return re.sub(r'[^\w\s]', '', text).lower().replace(' ', '_')
 
-def main():
-    """Main function to parse GEDCOM and generate HTML files with new structure."""
-    # Parse the GEDCOM file
-    gedcom_parser = Parser()
-    gedcom_parser.parse_file(GEDCOM_FILE)
+def parse_arguments(argv=None):
+    """Parse the command line options for the generator."""
+    parser = argparse.ArgumentParser(description="Generate the family tree website from a GEDCOM file.")
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1,
+        help="number of worker processes used to render individual pages (default: 1)"
+    )
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="only rewrite the pages whose inputs changed since the last incremental build"
+    )
+    parser.add_argument(
+        '--archive', metavar='FILE',
+        help="write the whole site into this zip or tar archive (.zip, .tar, .tar.gz, .tar.bz2, .tar.xz) "
+             "instead of the site directories"
+    )
+    parser.add_argument(
+        '--archive-format', choices=list(ARCHIVE_FORMATS),
+        help="format of the --archive file, when its extension doesn't tell"
+    )
+    parser.add_argument(
+        '--precompress', action='store_true',
+        help="also write a .gz copy of every generated file, and a .br copy if the brotli package is installed"
+    )
+    parser.add_argument(
+        '--writer-threads', type=int, default=4,
+        help="number of threads writing the individual pages to disk while the next ones are rendered, "
+             "0 to write them in turn; with --archive, any value above 0 adds the pages from a writer thread (default: 4)"
+    )
+    parser.add_argument(
+        '--ancestor-depth', type=int, default=ANCESTOR_DEPTH,
+        help=f"number of generations shown in the ancestor charts, at most {MAX_ANCESTOR_DEPTH} "
+             f"(default: {ANCESTOR_DEPTH})"
+    )
+    parser.add_argument(
+        '--descendant-depth', type=int, default=DESCENDANT_DEPTH,
+        help="number of generations shown in the descendant charts, 0 to leave them out "
+             f"(default: {DESCENDANT_DEPTH})"
+    )
+    parser.add_argument(
+        '--shard-size', type=int, default=0,
+        help="split index.html and individuals.html into pages of about this many individuals (default: no split)"
+    )
+    parser.add_argument(
+        '--home-person', metavar='INDIVIDUAL',
+        help="show on each page how the individual is related to this one, given by pointer, ID or name"
+    )
+    parser.add_argument(
+        '--no-search-index', dest='search_index', action='store_false',
+        help="don't write the search index used by search.html"
+    )
+    parser.add_argument(
+        '--serve', action='store_true',
+        help="instead of building the site, serve a preview of it that renders each page when it is requested"
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help="build the site, then keep updating it each time the GEDCOM file or the templates are saved"
+    )
+    parser.add_argument(
+        '--port', type=int, default=8000,
+        help="port of the --serve preview server (default: 8000)"
+    )
+    parser.add_argument(
+        '--cache-size', type=int, default=PREVIEW_CACHE_SIZE,
+        help=f"number of rendered pages the --serve preview server keeps in memory (default: {PREVIEW_CACHE_SIZE})"
+    )
+    parser.add_argument(
+        '--no-snapshot', dest='snapshot', action='store_false',
+        help=f"always parse the GEDCOM file, instead of loading the tree from {SNAPSHOT_FILE} when the file is unchanged"
+    )
+    parser.add_argument(
+        '--report', default=REPORT_FILE,
+        help=f"JSON file the timers and counters of the run are written to (default: {REPORT_FILE})"
+    )
+    parser.add_argument(
+        '--profile', choices=['cpu', 'memory'],
+        help=f"profile the run with cProfile (saved to {PROFILE_FILE}) or tracemalloc, and add it to the report"
+    )
+    args = parser.parse_args(argv)
+
+    if args.ancestor_depth < 1:
+        parser.error("--ancestor-depth must be at least 1, the parents of the individual")
+    if args.ancestor_depth > MAX_ANCESTOR_DEPTH:
+        parser.error(f"--ancestor-depth can be at most {MAX_ANCESTOR_DEPTH}, as the chart doubles in height "
+                     "with each generation")
+    if args.archive and args.incremental:
+        parser.error("--incremental updates the site directories, it cannot be used with --archive")
+    if args.archive_format and not args.archive:
+        parser.error("--archive-format needs --archive")
+    if args.serve and (args.archive or args.incremental):
+        parser.error("--serve doesn't write the site, it cannot be used with --archive or --incremental")
+    if args.watch and (args.archive or args.incremental or args.serve):
+        parser.error("--watch keeps the site directories up to date itself, "
+                     "it cannot be used with --archive, --incremental or --serve")
+    if args.archive and args.precompress:
+        parser.error("--precompress writes files next to the pages in the site directories, it cannot be used with --archive")
+    return args
+
+def render_individual_page(family_graph, individual_id, individuals_data, ancestor_resolver=None,
+                           relationships=None, descendant_resolver=None):
+    """Render the page of an individual and return its (file_path, html_content)."""
+    data = individuals_data[individual_id]
+
+    # Generate HTML content
+    with run_stats.phase('render'):
+        html_content = generate_html_for_individual(
+            family_graph, data.pointer, individuals_data, ancestor_resolver, relationships, descendant_resolver
+        )
+
+    return data.file_path, html_content
+
+def write_individual_page(family_graph, individual_id, individuals_data, site_writer, ancestor_resolver=None,
+                          relationships=None, descendant_resolver=None):
+    """Render the page of an individual, write it with site_writer and return its file path."""
+    file_path, html_content = render_individual_page(
+        family_graph, individual_id, individuals_data, ancestor_resolver, relationships, descendant_resolver
+    )
+
+    with run_stats.phase('write'):
+        site_writer.write(file_path, html_content)
+    return file_path
+
+# Tree snapshot held by each worker process, set once by init_render_worker
+_worker_tree = None
+
+def init_render_worker(family_graph, individuals_data, ancestor_depth, write_pages, sidecars=(), relationships=None,
+                       descendant_depth=DESCENDANT_DEPTH):
+    """Store the tree snapshot shipped to a worker process when the pool starts.
+
+    Workers write their pages, and their sidecars, into the site directories if write_pages is set,
+    and otherwise send them back to the parent process, the only one holding the archive being written.
+    """
+    global _worker_tree
+    _worker_tree = (
+        family_graph, individuals_data, AncestorResolver(family_graph, individuals_data, ancestor_depth),
+        DirectoryWriter(sidecars=sidecars) if write_pages else None, relationships,
+        DescendantResolver(family_graph, individuals_data, descendant_depth)
+    )
+
+    # Forked workers inherit the stats of the parent, which already counts them
+    run_stats.reset()
+
+def write_individual_page_in_worker(individual_id):
+    """Write the page of an individual using the worker's tree snapshot, returning the stats of the page.
+
+    Returns (individual_id, file_path, html_content, stats), where html_content is None once the page is written.
+    """
+    family_graph, individuals_data, ancestor_resolver, site_writer, relationships, descendant_resolver = _worker_tree
+    if site_writer is None:
+        file_path, html_content = render_individual_page(
+            family_graph, individual_id, individuals_data, ancestor_resolver, relationships, descendant_resolver
+        )
+        return individual_id, file_path, html_content, run_stats.take()
+
+    file_path = write_individual_page(
+        family_graph, individual_id, individuals_data, site_writer, ancestor_resolver, relationships,
+        descendant_resolver
+    )
+    return individual_id, file_path, None, run_stats.take()
+
+def write_individual_pages(family_graph, individuals_data, jobs=1, individual_ids=None,
+                           ancestor_depth=ANCESTOR_DEPTH, site_writer=None, relationships=None,
+                           descendant_depth=DESCENDANT_DEPTH):
+    """Write the pages of the given individuals (all by default), yielding (individual_id, file_path).
+
+    Pages are written with site_writer, into the site directories by default, and show the relationships
+    to the home person given (see relationships.get_home_relationships).
+    """
+    if individual_ids is None:
+        individual_ids = list(individuals_data)
+    if site_writer is None:
+        site_writer = DirectoryWriter()
+
+    # Create every surname directory once, before any page is written
+    with run_stats.phase('make directories'):
+        site_writer.make_directories([individuals_data[individual_id].file_path for individual_id in individual_ids])
+
+    if jobs <= 1:
+        # Share the ancestor lookups and descendant charts between all pages of the build
+        ancestor_resolver = AncestorResolver(family_graph, individuals_data, ancestor_depth)
+        descendant_resolver = DescendantResolver(family_graph, individuals_data, descendant_depth)
+        for individual_id in individual_ids:
+            yield individual_id, write_individual_page(
+                family_graph, individual_id, individuals_data, site_writer, ancestor_resolver, relationships,
+                descendant_resolver
+            )
+        return
+
+    # The graph and individuals_data only hold plain values, so they are pickled once per worker
+    chunksize = max(1, len(individual_ids) // (jobs * 4))
+    initargs = (
+        family_graph, individuals_data, ancestor_depth, site_writer.in_place, getattr(site_writer, 'sidecars', ()),
+        relationships, descendant_depth
+    )
+    with Pool(jobs, initializer=init_render_worker, initargs=initargs) as pool:
+        for individual_id, file_path, html_content, stats in pool.imap_unordered(
+            write_individual_page_in_worker, individual_ids, chunksize
+        ):
+            # Worker timers add up the time of all the processes
+            run_stats.merge(stats)
+            if html_content is not None:
+                with run_stats.phase('write'):
+                    site_writer.write(file_path, html_content)
+            yield individual_id, file_path
+
+def load_tree(gedcom_file=GEDCOM_FILE, snapshot_file=None):
+    """Read a GEDCOM file into its family graph and individuals_data.
+
+    With a snapshot_file, the tree is loaded from it if it was saved from the same GEDCOM file,
+    and saved to it otherwise.
+    """
+    if snapshot_file is None:
+        with run_stats.phase('extract'):
+            return collect_tree(run_stats.timed_iter('parse', read_gedcom(gedcom_file)))
+
+    with run_stats.phase('load snapshot'):
+        key = get_snapshot_key(gedcom_file)
+        tree = load_snapshot(snapshot_file, key)
+    if tree is not None:
+        print(f"Loaded the tree from {snapshot_file}, {gedcom_file} is unchanged")
+        return tree
 
+    family_graph, individuals_data = load_tree(gedcom_file)
+    with run_stats.phase('save snapshot'):
+        save_snapshot(snapshot_file, key, family_graph, individuals_data)
+    return family_graph, individuals_data
+
+def collect_tree(records):
+    """Build the family graph and individuals_data from the GEDCOM records, in file order."""
     # Dictionary to store individual data
     individuals_data = {}
+    individual_records = []
+    family_records = []
 
-    # First pass: collect all individual data
-    for element in gedcom_parser.get_root_child_elements():
-        if isinstance(element, IndividualElement):
-            # Get individual details
-            individual_id = generate_id_from_pointer(element.get_pointer())
-            name = get_name(element)
-            surname, given_name = extract_name_parts(name)
-            birth_date = get_birth_data(element)
-            death_date = get_death_data(element)
-
-            # Determine file path using the new structure
-            file_path = get_individual_file_path(surname, given_name, individual_id)
-            relative_path = get_individual_relative_path(surname, given_name, individual_id)
-
-            # Store individual data
-            individuals_data[individual_id] = {
-                'name': name,
-                'birth_date': birth_date,
-                'death_date': death_date,
-                'surname': surname,
-                'given_name': given_name,
-                'path': relative_path,
-                'element': element
-            }
+    # First pass: stream the GEDCOM records
+    for record in records:
+        if isinstance(record, IndividualRecord):
+            individual_records.append(record)
+        else:
+            family_records.append(record)
 
-    # Second pass: generate HTML files with all paths available
-    for individual_id, data in individuals_data.items():
-        # Generate HTML content
-        html_content = generate_html_for_individual(gedcom_parser, data['element'], individuals_data)
+    # Compute the IDs, names and paths of all individuals in bulk, hashing and sanitizing each once
+    ids = get_ids_from_pointers(record.pointer for record in individual_records)
+    names = [format_name(record.name) for record in individual_records]
+    name_parts = [extract_name_parts(name) for name in names]
+    relative_paths = get_individual_relative_paths(
+        (ids[record.pointer], surname, given_name)
+        for record, (surname, given_name) in zip(individual_records, name_parts)
+    )
+
+    # Store individual data
+    for record, name, (surname, given_name) in zip(individual_records, names, name_parts):
+        individual_id = ids[record.pointer]
+        individuals_data[individual_id] = Person(
+            pointer=record.pointer,
+            name=name,
+            surname=surname,
+            given_name=given_name,
+            gender=format_gender(record.gender),
+            birth_date=record.birth_date,
+            death_date=record.death_date,
+            path=relative_paths[individual_id]
+        )
+
+    # Index the family relationships once so page generation is a series of lookups
+    family_graph = build_family_graph(individual_records, family_records, ids)
+    del individual_records, family_records
+
+    return family_graph, individuals_data
+
+def get_relationships(args, family_graph, individuals_data):
+    """Return the relationships to the --home-person shown on the pages, exiting if there is no such individual."""
+    try:
+        with run_stats.phase('relationships'):
+            return get_home_relationships(family_graph, individuals_data, args.home_person)
+    except ValueError as error:
+        sys.exit(f"--home-person: {error}")
+
+def get_cpu_profile(profiler, limit=25):
+    """Save a cProfile run to PROFILE_FILE and return its most expensive functions by cumulative time."""
+    profiler.dump_stats(PROFILE_FILE)
+    stats = pstats.Stats(profiler)
+    functions = []
+    for (file_name, line, function), (_, calls, own_time, cumulative_time, _) in stats.stats.items():
+        functions.append({
+            'function': f"{file_name}:{line}({function})",
+            'calls': calls,
+            'own_seconds': own_time,
+            'cumulative_seconds': cumulative_time
+        })
+    functions.sort(key=lambda entry: -entry['cumulative_seconds'])
+    return {'type': 'cpu', 'file': PROFILE_FILE, 'functions': functions[:limit]}
+
+def get_memory_profile(limit=25):
+    """Return the peak traced memory and the lines that allocated the most memory still held."""
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    allocations = [
+        {'line': str(statistic.traceback), 'bytes': statistic.size, 'blocks': statistic.count}
+        for statistic in snapshot.statistics('lineno')[:limit]
+    ]
+    return {'type': 'memory', 'peak_bytes': peak, 'allocations': allocations}
+
+def main(args=None):
+    """Main function to parse GEDCOM and generate HTML files with new structure."""
+    if args is None:
+        args = parse_arguments()
+
+    if args.serve:
+        family_graph, individuals_data = load_tree(GEDCOM_FILE, SNAPSHOT_FILE if args.snapshot else None)
+        site = PreviewSite(
+            family_graph, individuals_data, args.ancestor_depth, args.shard_size, args.cache_size,
+            get_relationships(args, family_graph, individuals_data), args.descendant_depth
+        )
+        serve_preview(site, args.port)
+        return
+
+    if args.watch:
+        with DirectoryWriter(args.writer_threads, get_sidecar_extensions() if args.precompress else ()) as site_writer:
+            SiteWatcher(args, site_writer, load_tree).watch()
+        return
 
-        # Get the file path
-        file_path = get_individual_file_path(data['surname'], data['given_name'], individual_id)
+    # Profilers only see this process, so with --jobs the page rendering is not profiled
+    profiler = None
+    if args.profile == 'cpu':
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif args.profile == 'memory':
+        tracemalloc.start()
 
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    start = time.perf_counter()
+    if args.archive:
+        # A single thread writes the archive, with as many pages waiting as the writer threads would hold
+        site_writer = ArchiveWriter(args.archive, args.archive_format, args.writer_threads * PENDING_WRITES_PER_THREAD)
+    else:
+        sidecars = get_sidecar_extensions() if args.precompress else ()
+        if args.precompress:
+            print(f"Writing precompressed {' and '.join(sidecars)} copies of the generated files")
+
+        # Worker processes write their own pages, so threads only help a single process
+        site_writer = DirectoryWriter(args.writer_threads if args.jobs <= 1 else 0, sidecars)
+    with site_writer:
+        build_site(args, site_writer)
+    wall_seconds = time.perf_counter() - start
+
+    profile = None
+    if profiler is not None:
+        profiler.disable()
+        profile = get_cpu_profile(profiler)
+    elif args.profile == 'memory':
+        profile = get_memory_profile()
+        tracemalloc.stop()
+
+    write_run_report(args.report, wall_seconds, vars(args), profile)
+    print(f"Run report written to {args.report}")
+
+def build_site(args, site_writer):
+    """Parse the GEDCOM file and generate the individual, surname and listing pages with site_writer."""
+    family_graph, individuals_data = load_tree(GEDCOM_FILE, SNAPSHOT_FILE if args.snapshot else None)
+    relationships = get_relationships(args, family_graph, individuals_data)
+
+    # A full build rewrites the pages without hashing them, so the manifest no longer describes the site
+    if site_writer.in_place and not args.incremental:
+        remove_manifest()
 
-        # Write HTML file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    # In incremental mode, only the pages whose inputs changed since the last build are written
+    individual_ids = None
+    if args.incremental:
+        manifest = load_manifest()
+        generator = get_generator_fingerprint(site_writer.sidecars)
+        ancestor_resolver = AncestorResolver(family_graph, individuals_data, args.ancestor_depth)
+        descendant_resolver = DescendantResolver(family_graph, individuals_data, args.descendant_depth)
+        pages = {}
+        with run_stats.phase('hash pages'):
+            for individual_id, data in individuals_data.items():
+                pages[data.pointer] = {
+                    'hash': compute_page_hash(
+                        family_graph, data.pointer, individuals_data, ancestor_resolver, relationships,
+                        descendant_resolver
+                    ),
+                    'path': data.file_path
+                }
+        changed = find_changed_pages(manifest, pages, generator)
+        individual_ids = [family_graph.ids[pointer] for pointer in changed]
+        removed = remove_stale_files(
+            [page['path'] for page in manifest['pages'].values()], [page['path'] for page in pages.values()]
+        )
+        print(f"Incremental build: {len(changed)} of {len(pages)} pages changed, {len(removed)} removed")
 
-        print(f"Generated HTML file for {data['name']} at {file_path}")
+        # Sidecars of the previous build would be served in place of pages rewritten without them
+        if manifest.get('sidecars') and not site_writer.sidecars:
+            remove_sidecars([page['path'] for page in pages.values()] + manifest['surname_pages'])
+
+    # Second pass: generate HTML files with all paths available
+    progress = ProgressCounter(
+        len(individuals_data) if individual_ids is None else len(individual_ids), "Generated individual pages"
+    )
+    page_paths = []
+    for individual_id, file_path in write_individual_pages(
+        family_graph, individuals_data, args.jobs, individual_ids, args.ancestor_depth, site_writer, relationships,
+        args.descendant_depth
+    ):
+        page_paths.append(file_path)
+        progress.advance()
 
     # Generate index.html, individuals.html, and surname pages with updated paths
-    generate_index_html(individuals_data)
-    generate_individuals_html(individuals_data)
-    generate_surname_pages(individuals_data)
+    with run_stats.phase('index page'):
+        listing_paths = generate_index_html(individuals_data, args.shard_size, site_writer)
+    with run_stats.phase('individuals page'):
+        listing_paths += generate_individuals_html(individuals_data, args.shard_size, site_writer)
+    with run_stats.phase('surname pages'):
+        surname_paths = generate_surname_pages(individuals_data, site_writer)
+    if args.search_index:
+        with run_stats.phase('search index'):
+            listing_paths += generate_search_index(individuals_data, site_writer)
+
+    # Listing pages are rewritten by every build, so drop their sidecars when no longer precompressing
+    if site_writer.in_place and not site_writer.sidecars:
+        remove_sidecars(listing_paths)
+
+    # An archive holds the whole site, including the files that are not generated
+    if not site_writer.in_place:
+        for file_path in STATIC_SITE_FILES:
+            site_writer.add_file(file_path)
+        print(f"Site written to {args.archive}")
+
+    # Pages are written over the previous build, whose pages for people no longer in the tree are left over;
+    # incremental builds without a manifest to go by also rewrite every page and clean up the same way
+    if site_writer.in_place and len(page_paths) == len(individuals_data):
+        site_writer.wait()
+        removed = remove_files_not_written(
+            [OUTPUT_DIR, SURNAMES_DIR], page_paths + surname_paths, site_writer.sidecars
+        )
+        if removed:
+            print(f"Removed {len(removed)} files left over from the previous build")
+
+    if args.incremental:
+        remove_stale_files(manifest['surname_pages'], surname_paths)
+        # Only record the new hashes once every queued page is on disk, so a failed write is retried next time
+        site_writer.wait()
+        save_manifest({
+            'generator': generator, 'pages': pages, 'surname_pages': surname_paths,
+            'sidecars': list(site_writer.sidecars)
+        })
 
     print("HTML generation completed with new directory structure.")
 
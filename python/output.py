@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Output of the generated pages: creating directories once, writing files from a thread pool,
+and reporting progress without printing a line per file.
+
+Pages are written through a site writer: DirectoryWriter writes them into the site directory,
+ArchiveWriter into a single zip or tar archive. Both write the same bytes for each page.
+DirectoryWriter can also write precompressed .gz and .br sidecars next to each file, for
+static hosts that serve them to browsers accepting those encodings.
+
+DirectoryWriter leaves files whose contents didn't change untouched, keeping their modification
+times, so that rsync, CDN caches and browsers only see the pages that actually changed.
+"""
+
+import filecmp
+import gzip
+import io
+import os
+import queue
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import brotli
+except ImportError:
+    # Brotli sidecars are only written when the brotli package is installed
+    brotli = None
+
+from instrumentation import run_stats
+
+# Writes waiting in the thread pool per thread, beyond which writing a page waits for the oldest one
+PENDING_WRITES_PER_THREAD = 16
+
+# Encoding of the pages, in directories and archives alike
+PAGE_ENCODING = 'utf-8'
+
+# Archive formats, and the tarfile mode of each tar format
+ARCHIVE_FORMATS = {'zip': None, 'tar': 'w|', 'tar.gz': 'w|gz', 'tar.bz2': 'w|bz2', 'tar.xz': 'w|xz'}
+ARCHIVE_EXTENSIONS = {'.zip': 'zip', '.tar': 'tar', '.tar.gz': 'tar.gz', '.tgz': 'tar.gz', '.tar.bz2': 'tar.bz2',
+                      '.tar.xz': 'tar.xz'}
+
+# Extensions of the precompressed copies of a file that can be written next to it
+SIDECAR_EXTENSIONS = ('.gz', '.br')
+
+def get_sidecar_extensions():
+    """Return the extensions of the sidecars this installation can write: .gz, and .br if brotli is installed."""
+    return SIDECAR_EXTENSIONS if brotli is not None else ('.gz',)
+
+def compress(data, extension):
+    """Compress data for the sidecar with the given extension."""
+    if extension == '.gz':
+        # A fixed mtime keeps the sidecars of unchanged pages identical between builds
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+def write_sidecars(file_path, extensions, data=None, missing_only=False):
+    """Write a compressed copy of a file next to it for each extension, and return the counters of the writes.
+
+    With missing_only, only the sidecars that don't exist yet are written, for a file that didn't change.
+    """
+    if missing_only:
+        extensions = [extension for extension in extensions if not os.path.exists(file_path + extension)]
+        if not extensions:
+            return {}
+    if data is None:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+    sidecar_bytes = 0
+    for extension in extensions:
+        compressed = compress(data, extension)
+        with open(file_path + extension, 'wb') as f:
+            f.write(compressed)
+        sidecar_bytes += len(compressed)
+    return {'sidecar bytes written': sidecar_bytes}
+
+def remove_sidecars(file_paths):
+    """Delete the sidecars of the given files, so a host doesn't serve stale compressed copies."""
+    for file_path in file_paths:
+        for extension in SIDECAR_EXTENSIONS:
+            if os.path.exists(file_path + extension):
+                os.remove(file_path + extension)
+
+def has_contents(file_path, data):
+    """Return whether the file exists and holds exactly data, reading it only if its size matches."""
+    try:
+        if os.path.getsize(file_path) != len(data):
+            return False
+        with open(file_path, 'rb') as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+def encode_page(content):
+    """Return the bytes of a page as written to the site, the same ones open() writes in text mode.
+
+    Directory and archive output both go through here, so they agree on line endings and encoding.
+    """
+    return content.replace('\n', os.linesep).encode(PAGE_ENCODING)
+
+def write_file(file_path, content, sidecars=()):
+    """Write a page to a file whose directory exists, and its sidecars, returning the counters of the writes.
+
+    A file already holding the page is left untouched, and only its missing sidecars are written.
+    """
+    data = encode_page(content)
+    if has_contents(file_path, data):
+        counters = {'files unchanged': 1}
+        if sidecars:
+            counters.update(write_sidecars(file_path, sidecars, data, missing_only=True))
+        return counters
+
+    with open(file_path, 'wb') as f:
+        f.write(data)
+    counters = {'bytes written': len(data)}
+    if sidecars:
+        counters.update(write_sidecars(file_path, sidecars, data))
+    return counters
+
+def replace_if_changed(temporary_path, file_path):
+    """Move a freshly written file over file_path unless that already holds the same bytes.
+
+    Returns the counters of the write.
+    """
+    if os.path.exists(file_path) and filecmp.cmp(temporary_path, file_path, shallow=False):
+        os.remove(temporary_path)
+        return {'files unchanged': 1}
+
+    counters = {'bytes written': os.path.getsize(temporary_path)}
+    os.replace(temporary_path, file_path)
+    return counters
+
+def remove_files_not_written(directories, file_paths, sidecars=()):
+    """Delete the files in directories, other than file_paths and their sidecars, and the directories left empty.
+
+    Returns the paths of the files removed.
+    """
+    keep = set(file_paths)
+    keep.update(file_path + extension for file_path in file_paths for extension in sidecars)
+    removed = []
+    for directory in directories:
+        for root, _, names in os.walk(directory, topdown=False):
+            for name in names:
+                file_path = os.path.join(root, name)
+                if file_path not in keep:
+                    os.remove(file_path)
+                    removed.append(file_path)
+            if not os.listdir(root):
+                os.rmdir(root)
+    return removed
+
+class DirectoryWriter:
+    """Writes pages into the site directories, creating each directory once.
+
+    With threads > 0, files are written by a pool of threads so that the build keeps rendering
+    while the filesystem catches up; close() waits for the last writes and raises their errors.
+    Each file also gets a compressed copy for each extension in sidecars, made by the same threads.
+    Files that already hold the page being written are not rewritten.
+    """
+
+    # Pages are written over the previous build, whose leftover files must be removed
+    in_place = True
+
+    def __init__(self, threads=0, sidecars=()):
+        self.directories = set()
+        self.sidecars = tuple(sidecars)
+        self.executor = ThreadPoolExecutor(threads, thread_name_prefix='page-writer') if threads > 0 else None
+        self.max_pending = threads * PENDING_WRITES_PER_THREAD
+        self.pending = deque()
+
+    def make_directories(self, file_paths):
+        """Create the directories of all the given files up front, each one once."""
+        for directory in sorted({os.path.dirname(file_path) for file_path in file_paths} - self.directories):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.directories.add(directory)
+
+    def write(self, file_path, content):
+        """Write a page, creating its directory if this writer hasn't yet."""
+        directory = os.path.dirname(file_path)
+        if directory not in self.directories:
+            self.make_directories([file_path])
+
+        run_stats.count('pages written')
+        self.run(write_file, file_path, content, self.sidecars)
+
+    @contextmanager
+    def open(self, file_path):
+        """Open a page for writing as a text file, to stream its contents.
+
+        The page is streamed to a temporary file, which only replaces file_path if their contents differ.
+        """
+        directory = os.path.dirname(file_path)
+        if directory not in self.directories:
+            self.make_directories([file_path])
+
+        temporary_path = file_path + '.tmp'
+        try:
+            with open(temporary_path, 'w', encoding=PAGE_ENCODING) as f:
+                yield f
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+        # Replaced right away, so the page is in place once the with block ends
+        counters = replace_if_changed(temporary_path, file_path)
+        count_writes(counters)
+        if self.sidecars:
+            self.run(write_sidecars, file_path, self.sidecars, None, 'files unchanged' in counters)
+
+    def run(self, task, *args):
+        """Call task(*args) in the thread pool, or right away without one, and count the writes it returns."""
+        if self.executor is None:
+            count_writes(task(*args))
+            return
+
+        # Bound the pages held in memory while they wait for a thread
+        if len(self.pending) >= self.max_pending:
+            count_writes(self.pending.popleft().result())
+        self.pending.append(self.executor.submit(task, *args))
+
+    def wait(self):
+        """Wait for the pending writes, raising their errors."""
+        while self.pending:
+            count_writes(self.pending.popleft().result())
+
+    def close(self):
+        """Wait for the pending writes and stop the threads."""
+        if self.executor is None:
+            return
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def count_writes(counters):
+    """Add the counters returned by a write to the stats of the run."""
+    for name, amount in counters.items():
+        run_stats.count(name, amount)
+
+class MemoryWriter:
+    """Keeps the pages written to it in memory, by file path, for pages served without being saved."""
+
+    # Nothing is written to the site directories
+    in_place = False
+    sidecars = ()
+
+    def __init__(self):
+        self.pages = {}
+
+    def make_directories(self, file_paths):
+        """Pages are kept in memory, so there is nothing to create."""
+
+    def write(self, file_path, content):
+        """Keep a page."""
+        self.pages[file_path] = content
+
+    @contextmanager
+    def open(self, file_path):
+        """Open a page for writing as a text file, to stream its contents."""
+        buffer = io.StringIO()
+        yield buffer
+        self.pages[file_path] = buffer.getvalue()
+
+def get_archive_format(archive_path, archive_format=None):
+    """Return the format of an archive: archive_format if given, otherwise the one of its extension."""
+    if archive_format is not None:
+        return archive_format
+    for extension, extension_format in ARCHIVE_EXTENSIONS.items():
+        if archive_path.endswith(extension):
+            return extension_format
+    raise ValueError(f"Cannot tell the archive format of {archive_path}, choose one of: {', '.join(ARCHIVE_FORMATS)}")
+
+class ArchiveWriter:
+    """Writes pages into a zip or tar archive, as the files DirectoryWriter would write.
+
+    Pages hold the same bytes as in the site directory, including the platform's line endings.
+    With queue_size > 0, pages are compressed and added by a writer thread, the only one touching
+    the archive, while the build renders the next ones; once queue_size pages are waiting, writing
+    a page waits for the thread to catch up.
+    """
+
+    # Each build writes a new archive, so there are no leftover files to remove
+    in_place = False
+
+    def __init__(self, archive_path, archive_format=None, queue_size=0):
+        self.archive_format = get_archive_format(archive_path, archive_format)
+        self.mtime = time.time()
+        self.zip_file = None
+        self.tar_file = None
+        if self.archive_format == 'zip':
+            self.zip_file = zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED)
+        else:
+            self.tar_file = tarfile.open(archive_path, ARCHIVE_FORMATS[self.archive_format])
+
+        self.queue = None
+        if queue_size > 0:
+            self.queue = queue.Queue(queue_size)
+            # Counters and first error of the writer thread, handed over by wait()
+            self.thread_counters = {}
+            self.thread_error = None
+            self.thread = threading.Thread(target=self.write_queued_pages, name='archive-writer', daemon=True)
+            self.thread.start()
+
+    def make_directories(self, file_paths):
+        """Archives hold the directories of their files, so there is nothing to create."""
+
+    def write(self, file_path, content):
+        """Add a page to the archive, or queue it for the writer thread."""
+        run_stats.count('pages written')
+        if self.queue is None:
+            count_writes(self.add_page(file_path, content))
+            return
+
+        if self.thread_error is not None:
+            self.wait()
+        self.queue.put((file_path, content))
+
+    def add_page(self, file_path, content):
+        """Add a page to the archive and return the counters of the write."""
+        data = encode_page(content)
+        member_name = file_path.replace(os.sep, '/')
+        if self.zip_file is not None:
+            zip_info = zipfile.ZipInfo(member_name, time.localtime(self.mtime)[:6])
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            self.zip_file.writestr(zip_info, data)
+        else:
+            self.add_member(member_name, data)
+        return {'bytes written': len(data)}
+
+    def write_queued_pages(self):
+        """Add the queued pages to the archive until the None sent by close()."""
+        while True:
+            page = self.queue.get()
+            try:
+                if page is None:
+                    return
+                # After an error, pages are only taken off the queue so the build doesn't wait forever
+                if self.thread_error is None:
+                    for name, amount in self.add_page(*page).items():
+                        self.thread_counters[name] = self.thread_counters.get(name, 0) + amount
+            except Exception as error:
+                self.thread_error = error
+            finally:
+                self.queue.task_done()
+
+    def wait(self):
+        """Wait for the queued pages to be in the archive, raising the error of the writer thread if any."""
+        if self.queue is None:
+            return
+        self.queue.join()
+        count_writes(self.thread_counters)
+        self.thread_counters = {}
+        if self.thread_error is not None:
+            raise self.thread_error
+
+    @contextmanager
+    def open(self, file_path):
+        """Open a page of the archive for writing as a text file, to stream its contents."""
+        # The archive takes one member at a time
+        self.wait()
+
+        member_name = file_path.replace(os.sep, '/')
+        if self.zip_file is not None:
+            zip_info = zipfile.ZipInfo(member_name, time.localtime(self.mtime)[:6])
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            # Text files translate newlines like open() does in directory mode
+            with io.TextIOWrapper(self.zip_file.open(zip_info, 'w'), encoding=PAGE_ENCODING) as f:
+                yield f
+            run_stats.count('bytes written', zip_info.file_size)
+            return
+
+        # Tar members are written after their size is known
+        buffer = io.BytesIO()
+        f = io.TextIOWrapper(buffer, encoding=PAGE_ENCODING)
+        yield f
+        f.flush()
+        self.add_member(member_name, buffer.getvalue())
+        run_stats.count('bytes written', len(buffer.getvalue()))
+        f.close()
+
+    def add_member(self, member_name, data):
+        """Add a file holding data to the tar archive."""
+        tar_info = tarfile.TarInfo(member_name)
+        tar_info.size = len(data)
+        tar_info.mtime = self.mtime
+        tar_info.mode = 0o644
+        self.tar_file.addfile(tar_info, io.BytesIO(data))
+
+    def add_file(self, file_path):
+        """Copy a file or directory of the site, such as its stylesheets, into the archive."""
+        self.wait()
+        if self.tar_file is not None:
+            self.tar_file.add(file_path, file_path.replace(os.sep, '/'))
+            return
+
+        if os.path.isdir(file_path):
+            sources = [os.path.join(root, name) for root, _, names in sorted(os.walk(file_path)) for name in sorted(names)]
+        else:
+            sources = [file_path]
+        for source in sources:
+            self.zip_file.write(source, source.replace(os.sep, '/'))
+
+    def close(self):
+        """Finish the archive."""
+        try:
+            if self.queue is not None:
+                self.queue.put(None)
+                self.thread.join()
+                self.wait()
+        finally:
+            if self.zip_file is not None:
+                self.zip_file.close()
+            else:
+                self.tar_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class ProgressCounter:
+    """Prints how many of a known number of items are done, in place on a terminal and every 10% otherwise."""
+
+    def __init__(self, total, label, stream=None):
+        self.total = total
+        self.label = label
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        self.done = 0
+        self.shown = 0
+
+    def advance(self, amount=1):
+        """Count finished items, printing the progress when it moved enough to be worth showing."""
+        self.done += amount
+        steps = 100 if self.interactive else 10
+        step = self.done * steps // self.total if self.total else steps
+        if step != self.shown:
+            self.shown = step
+            self.show()
+
+    def show(self):
+        """Print the current progress."""
+        message = f"{self.label}: {self.done}/{self.total}"
+        if self.interactive:
+            end = '\n' if self.done >= self.total else ''
+            print(f"\r{message}", end=end, file=self.stream, flush=True)
+        else:
+            print(message, file=self.stream)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Compact record holding the data of an individual needed to render the site.
+"""
+
+import sys
+
+from utils import get_file_path_from_relative
+
+class Person:
+    """Slotted record for an individual, stored in individuals_data by individual ID."""
+
+    __slots__ = (
+        'pointer', 'name', 'surname', 'given_name', 'gender', 'birth_date', 'death_date', 'path'
+    )
+
+    def __init__(self, pointer, name, surname, given_name, gender, birth_date, death_date, path):
+        self.pointer = pointer
+        self.name = name
+        # Surnames are shared by many individuals, so only keep one copy of each
+        self.surname = sys.intern(surname)
+        self.given_name = given_name
+        self.gender = gender
+        self.birth_date = birth_date
+        self.death_date = death_date
+        self.path = path
+
+    def __getstate__(self):
+        return self.as_tuple()
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+        self.surname = sys.intern(self.surname)
+
+    @property
+    def file_path(self):
+        """Path of the individual's page in the site directories."""
+        return get_file_path_from_relative(self.path)
+
+    def __repr__(self):
+        return f"Person({self.pointer!r}, {self.name!r})"
+
+    def as_tuple(self):
+        """Return the fields of the record as a tuple, in slot order."""
+        return tuple(getattr(self, slot) for slot in self.__slots__)
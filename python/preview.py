@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Local preview server that renders the pages of the site when they are requested.
+
+The tree is loaded once and no page is rendered up front, so the first page of even a large tree
+is served within seconds. Rendered pages are kept in a bounded LRU cache; the stylesheets,
+images and other static files are served from the current directory.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from ancestors import AncestorResolver
+from constants import ANCESTOR_DEPTH, DESCENDANT_DEPTH, OUTPUT_DIR, SEARCH_DIR, SURNAMES_DIR
+from descendants import DescendantResolver
+from html_generation import (
+    generate_html_for_individual, generate_index_html, generate_individuals_html, get_surname_page_file_path,
+    group_by_surname, write_surname_page
+)
+from output import MemoryWriter
+from search_index import generate_search_index
+
+# Number of rendered pages kept in memory by default
+PREVIEW_CACHE_SIZE = 1000
+
+# Listing pages at the site root, including their shards
+LISTING_REGEX = re.compile(r'(index|individuals)(_\d+)?\.html')
+
+# Content type of the generated files, by extension
+CONTENT_TYPES = {'.html': 'text/html; charset=utf-8', '.js': 'text/javascript; charset=utf-8'}
+
+class PreviewSite:
+    """Renders the pages of the site on demand and keeps the most recently used ones."""
+
+    def __init__(self, family_graph, individuals_data, ancestor_depth=ANCESTOR_DEPTH, shard_size=0,
+                 cache_size=PREVIEW_CACHE_SIZE, relationships=None, descendant_depth=DESCENDANT_DEPTH):
+        self.family_graph = family_graph
+        self.individuals_data = individuals_data
+        self.relationships = relationships
+        self.ancestor_resolver = AncestorResolver(family_graph, individuals_data, ancestor_depth)
+        self.descendant_resolver = DescendantResolver(family_graph, individuals_data, descendant_depth)
+        self.shard_size = shard_size
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        # Pages are rendered one at a time, as the ancestor and descendant resolver caches are shared
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Individuals by the path of their page, and surnames by the file path of theirs
+        self.individual_ids = {data.path: individual_id for individual_id, data in individuals_data.items()}
+        self.surnames = None
+        # Paths of the files written by each listing generator, known once it has run, so requests for files
+        # it doesn't write are answered without rendering the whole listing again
+        self.listing_paths = {}
+
+    def get_page(self, path):
+        """Return the contents of the generated file at path, relative to the site root, or None."""
+        if not self.is_generated(path) and not LISTING_REGEX.fullmatch(path):
+            return None
+
+        listing = self.get_listing(path)
+        if path.startswith(f"{OUTPUT_DIR}/") and path not in self.individual_ids:
+            return None
+
+        with self.lock:
+            if path in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(path)
+                return self.cache[path]
+            if listing in self.listing_paths and path not in self.listing_paths[listing]:
+                return None
+
+            self.misses += 1
+            pages = {
+                page_path.replace(os.sep, '/'): content.encode('utf-8')
+                for page_path, content in self.render(path).items()
+            }
+            if listing:
+                self.listing_paths[listing] = set(pages)
+            for page_path, content in pages.items():
+                self.cache[page_path] = content
+                self.cache.move_to_end(page_path)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            return pages.get(path)
+
+    def render(self, path):
+        """Render the file at path, and the files rendered along with it, as {file path: content}."""
+        site_writer = MemoryWriter()
+        if path in self.individual_ids:
+            individual_id = self.individual_ids[path]
+            site_writer.write(path, generate_html_for_individual(
+                self.family_graph, self.individuals_data[individual_id].pointer, self.individuals_data,
+                self.ancestor_resolver, self.relationships, self.descendant_resolver
+            ))
+        elif path.startswith(f"{SURNAMES_DIR}/"):
+            if self.surnames is None:
+                self.surnames = {
+                    get_surname_page_file_path(surname).replace(os.sep, '/'): (surname, individuals)
+                    for surname, individuals in group_by_surname(self.individuals_data).items()
+                }
+            if path in self.surnames:
+                write_surname_page(*self.surnames[path], site_writer)
+        elif path.startswith(f"{SEARCH_DIR}/"):
+            generate_search_index(self.individuals_data, site_writer)
+        elif path.startswith('index'):
+            generate_index_html(self.individuals_data, self.shard_size, site_writer)
+        else:
+            generate_individuals_html(self.individuals_data, self.shard_size, site_writer)
+        return site_writer.pages
+
+    def get_listing(self, path):
+        """Return the listing generator writing the file at path: 'search', 'index' or 'individuals', or None."""
+        if path.startswith(f"{SEARCH_DIR}/"):
+            return 'search'
+        if LISTING_REGEX.fullmatch(path):
+            return LISTING_REGEX.fullmatch(path).group(1)
+        return None
+
+    def is_generated(self, path):
+        """Return whether path is in one of the directories of generated files, rather than a static file."""
+        return path.split('/', 1)[0] in (OUTPUT_DIR, SURNAMES_DIR, SEARCH_DIR)
+
+class PreviewRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the pages of the preview site, and the static files of the site from the current directory."""
+
+    # Set on the class by serve_preview
+    site = None
+
+    def do_GET(self):
+        self.serve(head_only=False)
+
+    def do_HEAD(self):
+        self.serve(head_only=True)
+
+    def serve(self, head_only):
+        """Send a generated page, or fall back to the static file handling."""
+        path = unquote(urlsplit(self.path).path).lstrip('/') or 'index.html'
+        start = time.perf_counter()
+        content = self.site.get_page(path)
+        if content is None:
+            if self.site.is_generated(path):
+                self.send_error(404, "No such page in the tree")
+            elif head_only:
+                super().do_HEAD()
+            else:
+                super().do_GET()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES.get(os.path.splitext(path)[1], 'application/octet-stream'))
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Server-Timing', f"render;dur={(time.perf_counter() - start) * 1000:.1f}")
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(content)
+
+def serve_preview(site, port=8000, host='127.0.0.1'):
+    """Serve the preview site until interrupted."""
+    handler = type('Handler', (PreviewRequestHandler,), {'site': site})
+    with ThreadingHTTPServer((host, port), handler) as server:
+        print(f"Previewing {len(site.individuals_data)} individuals at http://{host}:{server.server_port}/ "
+              f"(Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    print(f"Preview stopped: {site.hits} pages served from the cache, {site.misses} rendered")
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Relationship calculator: how two individuals of the tree are related.
+
+Each individual's ancestors are collected once, with the number of generations up to each of
+them, and shared by all the queries: an ancestor reached through several lines (pedigree collapse)
+is only kept once, at its nearest distance, so the ancestor sets never grow exponentially.
+The nearest common ancestors of two individuals then give their relationship, as a pair of
+generation counts (1, 1 for siblings, 2, 2 for first cousins, 0, n for an ancestor...).
+
+Run as a script to ask for the relationship of two individuals, by pointer, ID or name:
+
+    python python/relationships.py @I0001@ "Kerimov, Emil"
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+
+from data_extraction import get_parents
+
+# description is "<first individual> is the <description> of <second individual>"; for blood relatives,
+# generations holds the number of generations from each of them up to their nearest common ancestors,
+# degree is the cousin degree (0 for siblings) and removal the difference in generations
+Relationship = namedtuple('Relationship', ['description', 'common_ancestors', 'generations', 'degree', 'removal'])
+
+ORDINALS = {1: 'first', 2: 'second', 3: 'third', 4: 'fourth', 5: 'fifth', 6: 'sixth', 7: 'seventh', 8: 'eighth'}
+REMOVALS = {1: 'once removed', 2: 'twice removed'}
+
+# Prefix of the relatives sharing a single common ancestor rather than a couple, e.g. "half brother"
+HALF_PREFIX = "half "
+
+# Description of two individuals without common ancestors who are not married to each other
+UNRELATED = "not related by blood"
+
+def get_gendered(gender, male, female, neutral):
+    """Return the word for a relative of the given gender."""
+    if gender == "male":
+        return male
+    if gender == "female":
+        return female
+    return neutral
+
+def get_generation_prefix(generations):
+    """Return the prefix of a relative generations above or below the great- level, e.g. "great-", "3x great-"."""
+    if generations == 1:
+        return "great-"
+    return f"{generations}x great-"
+
+def get_ordinal(number):
+    """Return the ordinal of a cousin degree, in words up to the eighth and as 9th, 21st... after that."""
+    if number in ORDINALS:
+        return ORDINALS[number]
+    if number % 100 in (11, 12, 13):
+        return f"{number}th"
+    return f"{number}{({1: 'st', 2: 'nd', 3: 'rd'}).get(number % 10, 'th')}"
+
+def describe_relationship(up, down, gender, half=False):
+    """Describe the relative of an individual of the given gender, up generations below and down generations
+    beside their nearest common ancestor: up is the first individual's distance to it, down the second's."""
+    half_prefix = HALF_PREFIX if half and up and down else ""
+    if up == 0 and down == 0:
+        return "self"
+    if up == 0:
+        # The first individual is an ancestor of the second
+        word = get_gendered(gender, "father", "mother", "parent")
+        if down == 1:
+            return word
+        return (get_generation_prefix(down - 2) if down > 2 else "") + "grand" + word
+    if down == 0:
+        word = get_gendered(gender, "son", "daughter", "child")
+        if up == 1:
+            return word
+        return (get_generation_prefix(up - 2) if up > 2 else "") + "grand" + word
+    if up == 1 and down == 1:
+        return half_prefix + get_gendered(gender, "brother", "sister", "sibling")
+    if up == 1:
+        word = get_gendered(gender, "uncle", "aunt", "aunt or uncle")
+        return half_prefix + (get_generation_prefix(down - 2) if down > 2 else "") + word
+    if down == 1:
+        word = get_gendered(gender, "nephew", "niece", "niece or nephew")
+        return half_prefix + (get_generation_prefix(up - 2) if up > 2 else "") + word
+
+    degree = min(up, down) - 1
+    removal = abs(up - down)
+    description = f"{half_prefix}{get_ordinal(degree)} cousin"
+    if removal:
+        description += " " + REMOVALS.get(removal, f"{removal} times removed")
+    return description
+
+class RelationshipCalculator:
+    """Answers kinship queries on a family graph, caching the ancestors of each individual asked about."""
+
+    def __init__(self, family_graph, individuals_data):
+        self.family_graph = family_graph
+        self.individuals_data = individuals_data
+        # Pointer -> {ancestor pointer: generations up to it}
+        self._ancestors = {}
+
+    def get_parents(self, pointer):
+        """Return the pointers of the known parents of an individual, as shown on their page."""
+        parents_info = get_parents(self.family_graph, pointer)
+        if not parents_info:
+            return ()
+        return tuple(parent for parent in (parents_info['father'], parents_info['mother']) if parent)
+
+    def get_ancestors(self, pointer):
+        """Return {ancestor pointer: generations up to it} of an individual, at the nearest distance of each."""
+        # Visit the parents before their children without recursion, as trees can be thousands of generations deep
+        stack = [pointer]
+        visiting = set()
+        while stack:
+            current = stack[-1]
+            if current in self._ancestors:
+                stack.pop()
+                continue
+
+            parents = self.get_parents(current)
+            # A malformed file can make an individual their own ancestor; that line is cut where it loops
+            missing = [parent for parent in parents if parent not in self._ancestors and parent not in visiting]
+            if missing and current not in visiting:
+                visiting.add(current)
+                stack.extend(missing)
+                continue
+
+            ancestors = {}
+            for parent in parents:
+                ancestors[parent] = 1
+            for parent in parents:
+                for ancestor, generations in self._ancestors.get(parent, {}).items():
+                    if generations + 1 < ancestors.get(ancestor, generations + 2):
+                        ancestors[ancestor] = generations + 1
+            self._ancestors[current] = ancestors
+            visiting.discard(current)
+            stack.pop()
+        return self._ancestors[pointer]
+
+    def get_ancestors_and_self(self, pointer):
+        """Return the ancestors of an individual, with the individual themself at 0 generations."""
+        ancestors = dict(self.get_ancestors(pointer))
+        ancestors[pointer] = 0
+        return ancestors
+
+    def get_line_families(self, ancestors):
+        """Return {ancestor pointer: pointers of the families} the lines of an individual come down through from
+        each ancestor, given the ancestors of the individual and themself."""
+        line_families = {}
+        for pointer, generations in ancestors.items():
+            if pointer not in self.family_graph.child_families:
+                continue
+            family = self.family_graph.child_families[pointer][0]
+            for parent in self.get_parents(pointer):
+                if ancestors.get(parent) == generations + 1:
+                    line_families.setdefault(parent, set()).add(family)
+        return line_families
+
+    def relate(self, first, second):
+        """Return how the individual `first` is related to `second`, as a Relationship."""
+        first_ancestors = self.get_ancestors_and_self(first)
+        second_ancestors = self.get_ancestors_and_self(second)
+        if len(first_ancestors) > len(second_ancestors):
+            common = [ancestor for ancestor in second_ancestors if ancestor in first_ancestors]
+        else:
+            common = [ancestor for ancestor in first_ancestors if ancestor in second_ancestors]
+        if not common:
+            return self.relate_by_marriage(first, second)
+
+        # The nearest common ancestors are the ones with the fewest generations between the two individuals
+        nearest = min((first_ancestors[ancestor] + second_ancestors[ancestor], first_ancestors[ancestor])
+                      for ancestor in common)
+        common_ancestors = [
+            ancestor for ancestor in common
+            if (first_ancestors[ancestor] + second_ancestors[ancestor], first_ancestors[ancestor]) == nearest
+        ]
+        first_families = self.get_line_families(first_ancestors)
+        second_families = self.get_line_families(second_ancestors)
+        up = nearest[1]
+        return self.make_relationship(first, up, nearest[0] - up, {
+            ancestor: (first_families.get(ancestor, set()), second_families.get(ancestor, set()))
+            for ancestor in common_ancestors
+        })
+
+    def relate_all_to(self, home):
+        """Return the Relationship of every individual of the tree to the individual `home`.
+
+        The nearest common ancestors with home are carried down from parents to children in a single
+        pass over the tree, so no ancestor set other than home's is built.
+        """
+        home_ancestors = self.get_ancestors_and_self(home)
+        home_families = self.get_line_families(home_ancestors)
+
+        # Pointer -> ((generations between the two, generations up),
+        #             {nearest common ancestor: families the line comes down through}), or None
+        nearest = {}
+        order = self.get_parents_first_order()
+        for pointer in order:
+            if pointer in home_ancestors:
+                # Ancestors of home are their own nearest common ancestor with home
+                nearest[pointer] = ((home_ancestors[pointer], 0), {pointer: set()})
+                continue
+
+            best = None
+            for parent in self.get_parents(pointer):
+                if nearest.get(parent) is None:
+                    continue
+                (distance, up), ancestors = nearest[parent]
+                if up == 0:
+                    # The line leaves the common ancestor through the family of this individual's parents
+                    family = self.family_graph.child_families[pointer][0]
+                    ancestors = {ancestor: {family} for ancestor in ancestors}
+                key = (distance + 1, up + 1)
+                if best is None or key < best[0]:
+                    best = (key, {ancestor: set(families) for ancestor, families in ancestors.items()})
+                elif key == best[0]:
+                    for ancestor, families in ancestors.items():
+                        best[1].setdefault(ancestor, set()).update(families)
+            nearest[pointer] = best
+
+        relationships = {}
+        for pointer in order:
+            if nearest[pointer] is None:
+                relationships[pointer] = self.relate_by_marriage(pointer, home)
+            else:
+                (distance, up), ancestors = nearest[pointer]
+                relationships[pointer] = self.make_relationship(pointer, up, distance - up, {
+                    ancestor: (families, home_families.get(ancestor, set()))
+                    for ancestor, families in ancestors.items()
+                })
+        return relationships
+
+    def get_parents_first_order(self):
+        """Return the pointers of all individuals, each one after their parents, in file order otherwise."""
+        order = []
+        placed = set()
+        for data in self.individuals_data.values():
+            stack = [data.pointer]
+            visiting = set()
+            while stack:
+                current = stack[-1]
+                if current in placed:
+                    stack.pop()
+                    continue
+                missing = [parent for parent in self.get_parents(current)
+                           if parent not in placed and parent not in visiting]
+                if missing and current not in visiting:
+                    visiting.add(current)
+                    stack.extend(reversed(missing))
+                    continue
+                placed.add(current)
+                order.append(current)
+                stack.pop()
+        return order
+
+    def make_relationship(self, pointer, up, down, common_ancestors):
+        """Build the Relationship of a blood relative from the generations to their nearest common ancestors,
+        given as {ancestor pointer: (families the first line comes down through, the second's)}."""
+        # Relatives through a single common ancestor, down different families of theirs, are half-relatives
+        half = len(common_ancestors) == 1 and not any(
+            first_families & second_families for first_families, second_families in common_ancestors.values()
+        )
+        gender = self.individuals_data[self.family_graph.ids[pointer]].gender
+        return Relationship(
+            describe_relationship(up, down, gender, half), list(common_ancestors), (up, down), min(up, down) - 1,
+            abs(up - down)
+        )
+
+    def relate_by_marriage(self, first, second):
+        """Return the Relationship of two individuals without common ancestors: spouses, or unrelated."""
+        for family in self.family_graph.get_spouse_families(first):
+            if second in (family['husband'], family['wife']):
+                gender = self.individuals_data[self.family_graph.ids[first]].gender
+                return Relationship(get_gendered(gender, "husband", "wife", "spouse"), [], None, None, None)
+        return Relationship(UNRELATED, [], None, None, None)
+
+def find_individual(individuals_data, family_graph, text):
+    """Return the pointer of the individual given by pointer, individual ID or exact name."""
+    for pointer in (text, f"@{text.strip('@')}@"):
+        if pointer in family_graph.ids:
+            return pointer
+    if text in individuals_data:
+        return individuals_data[text].pointer
+
+    matches = [data.pointer for data in individuals_data.values() if data.name == text]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise ValueError(f"{len(matches)} individuals are named {text!r}, use their pointer: {', '.join(matches)}")
+    raise ValueError(f"No individual with the pointer, ID or name {text!r}")
+
+def get_home_relationships(family_graph, individuals_data, home_person):
+    """Return {pointer: (relationship, home pointer)} of the relatives of the home person, given by pointer, ID
+    or name, or None without a home person."""
+    if home_person is None:
+        return None
+
+    home = find_individual(individuals_data, family_graph, home_person)
+    relationships = RelationshipCalculator(family_graph, individuals_data).relate_all_to(home)
+    return {
+        pointer: (relationship.description, home) for pointer, relationship in relationships.items()
+        if pointer != home and relationship.description != UNRELATED
+    }
+
+def main():
+    """Print how two individuals of the tree are related."""
+    from constants import GEDCOM_FILE, SNAPSHOT_FILE
+    from main import load_tree
+
+    parser = argparse.ArgumentParser(description="Tell how two individuals of the family tree are related.")
+    parser.add_argument('first', help="pointer (@I0001@), ID or name (\"Surname, Given\") of the first individual")
+    parser.add_argument('second', help="pointer, ID or name of the second individual")
+    parser.add_argument('--gedcom', default=GEDCOM_FILE, help=f"GEDCOM file of the tree (default: {GEDCOM_FILE})")
+    args = parser.parse_args()
+
+    # The snapshot belongs to the site's GEDCOM file, another file is parsed without replacing it
+    family_graph, individuals_data = load_tree(args.gedcom, SNAPSHOT_FILE if args.gedcom == GEDCOM_FILE else None)
+    try:
+        first = find_individual(individuals_data, family_graph, args.first)
+        second = find_individual(individuals_data, family_graph, args.second)
+    except ValueError as error:
+        parser.error(str(error))
+
+    calculator = RelationshipCalculator(family_graph, individuals_data)
+    start = time.perf_counter()
+    relationship = calculator.relate(first, second)
+    seconds = time.perf_counter() - start
+
+    def get_name(pointer):
+        return individuals_data[family_graph.ids[pointer]].name
+
+    if relationship.description == UNRELATED:
+        print(f"{get_name(first)} and {get_name(second)} are {UNRELATED}")
+    else:
+        print(f"{get_name(first)} is the {relationship.description} of {get_name(second)}")
+    if relationship.common_ancestors:
+        up, down = relationship.generations
+        print(f"Nearest common ancestors ({up} and {down} generations up): "
+              f"{'; '.join(get_name(ancestor) for ancestor in relationship.common_ancestors)}")
+    print(f"Answered in {seconds * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    # Allow running from the repository root as python python/relationships.py
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    main()
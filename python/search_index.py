@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Search index loaded by search.html, split by the first two letters of each word of the names.
+
+Each shard is a small script calling searchShard(key, entries), so the search page can load it
+with a <script> tag, which also works when the site is opened from the local disk.
+"""
+
+import json
+import os
+import re
+import unicodedata
+
+from constants import SEARCH_DIR
+from output import SIDECAR_EXTENSIONS, DirectoryWriter
+
+YEAR_REGEX = re.compile(r'\b(\d{4})\b')
+# Runs of letters and digits of any script
+WORD_REGEX = re.compile(r'[^\W_]+')
+
+def get_name_words(name):
+    """Split a name into lowercase words without accents, as the search page does with what is typed.
+
+    Names in Cyrillic or other scripts keep their letters, so they are indexed under them.
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    folded = ''.join(char for char in decomposed if not unicodedata.category(char).startswith('M')).lower()
+    return WORD_REGEX.findall(folded)
+
+def get_shard_key(word):
+    """Return the key of the shard a word is indexed in: its first two letters."""
+    return (word + '_')[:2]
+
+def get_year(date):
+    """Return the year of a GEDCOM date, or '' if it has none."""
+    regex_match = YEAR_REGEX.search(date or '')
+    return regex_match.group(1) if regex_match else ''
+
+def build_search_shards(individuals_data):
+    """Return the entries of each shard: [name, birth year, death year, path], sorted by name."""
+    shards = {}
+    for data in sorted(individuals_data.values(), key=lambda x: x.name):
+        entry = [data.name, get_year(data.birth_date), get_year(data.death_date), data.path]
+        # Index the individual once under each shard one of the words of their name starts in
+        for key in dict.fromkeys(get_shard_key(word) for word in get_name_words(data.name)):
+            shards.setdefault(key, []).append(entry)
+    return shards
+
+def generate_search_index(individuals_data, site_writer=None):
+    """Write the search index shards to SEARCH_DIR and return the paths of the files written.
+
+    Shards are written with site_writer, into the site directory by default.
+    """
+    if site_writer is None:
+        site_writer = DirectoryWriter()
+
+    file_paths = []
+    for key, entries in sorted(build_search_shards(individuals_data).items()):
+        file_path = os.path.join(SEARCH_DIR, f"{key}.js")
+        entries_json = json.dumps(entries, ensure_ascii=False, separators=(',', ':'))
+        with site_writer.open(file_path) as f:
+            f.write(f'searchShard("{key}",{entries_json});\n')
+        file_paths.append(file_path)
+
+    # Drop the shards of prefixes no name starts with anymore, and their sidecars
+    if site_writer.in_place and os.path.isdir(SEARCH_DIR):
+        current_paths = set(file_paths)
+        for file_name in os.listdir(SEARCH_DIR):
+            file_path = os.path.join(SEARCH_DIR, file_name)
+            shard_path, extension = os.path.splitext(file_path)
+            if file_path not in current_paths and not (extension in SIDECAR_EXTENSIONS and shard_path in current_paths):
+                os.remove(file_path)
+
+    print(f"Generated search index with {len(file_paths)} shards")
+    return file_paths
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Binary snapshot of the tree extracted from a GEDCOM file, so that builds of an unchanged file
+(for example after editing the templates) skip parsing it.
+
+The snapshot starts with a header line holding the hash of the GEDCOM file and of the code that
+extracts the tree, followed by the pickled family graph and individuals_data. It is read through
+a memory map, so the file is unpickled straight from the page cache without being copied first.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+
+# Format of the snapshot file, changed whenever the layout of the header or payload changes
+SNAPSHOT_MAGIC = b'FAMILYTREE-SNAPSHOT 1 '
+
+# Modules whose code shapes the extracted tree
+EXTRACTION_MODULES = ('gedcom_reader.py', 'family_graph.py', 'person.py', 'utils.py', 'data_extraction.py', 'main.py')
+
+def get_snapshot_key(gedcom_file):
+    """Hash the GEDCOM file and the extraction code, so a change to either invalidates the snapshot."""
+    hash_obj = hashlib.sha1()
+    with open(gedcom_file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            hash_obj.update(block)
+
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    for module in EXTRACTION_MODULES:
+        with open(os.path.join(module_dir, module), 'rb') as f:
+            hash_obj.update(f.read())
+    return hash_obj.hexdigest()
+
+def load_snapshot(snapshot_file, key):
+    """Return the (family_graph, individuals_data) saved under key, or None if there is no such snapshot."""
+    header = SNAPSHOT_MAGIC + key.encode('ascii') + b'\n'
+    try:
+        with open(snapshot_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= len(header):
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+                if snapshot[:len(header)] != header:
+                    return None
+                with memoryview(snapshot) as view:
+                    return pickle.loads(view[len(header):])
+    except (OSError, pickle.UnpicklingError, EOFError):
+        # A missing or unreadable snapshot is rebuilt from the GEDCOM file
+        return None
+
+def save_snapshot(snapshot_file, key, family_graph, individuals_data):
+    """Save the extracted tree under key, replacing the previous snapshot in one step."""
+    temporary_file = snapshot_file + '.tmp'
+    with open(temporary_file, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC + key.encode('ascii') + b'\n')
+        pickle.dump((family_graph, individuals_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_file, snapshot_file)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Page templates from constants.py, split once at import into static chunks and slots.
+
+Each template is exposed under the same name as in constants.py, as a CompiledTemplate
+whose render() fills the slots with a single join instead of re-parsing the format string,
+and whose write_to() streams the filled template to a file.
+"""
+
+from string import Formatter
+
+import constants
+
+class CompiledTemplate:
+    """A str.format template precompiled into its static chunks and named slots."""
+
+    __slots__ = ('chunks', 'slots')
+
+    def __init__(self, template):
+        # chunks[i] is the static text before slots[i]; the last chunk follows the last slot
+        self.chunks = []
+        self.slots = []
+
+        literal_text = ''
+        for literal, field, format_spec, conversion in Formatter().parse(template):
+            literal_text += literal
+            if field is None:
+                continue
+            if format_spec or conversion or not field.isidentifier():
+                raise ValueError(f"Unsupported template field {{{field}}}: only plain named slots are allowed")
+            self.chunks.append(literal_text)
+            self.slots.append(field)
+            literal_text = ''
+        self.chunks.append(literal_text)
+
+    def render_into(self, parts, values):
+        """Append the chunks of the template, filled with values, to the list parts."""
+        chunks = self.chunks
+        parts.append(chunks[0])
+        for index, slot in enumerate(self.slots, 1):
+            parts.append(str(values[slot]))
+            parts.append(chunks[index])
+
+    def render(self, **values):
+        """Return the template filled with values, like str.format."""
+        parts = []
+        self.render_into(parts, values)
+        return ''.join(parts)
+
+    def write_to(self, writer, values):
+        """Write the template filled with values to a PageWriter, without building it in memory.
+
+        A callable value is called with the writer to stream the contents of its slot, such as the rows of a listing.
+        """
+        parts = writer.parts
+        chunks = self.chunks
+        parts.append(chunks[0])
+        for index, slot in enumerate(self.slots, 1):
+            value = values[slot]
+            if callable(value):
+                value(writer)
+            else:
+                parts.append(str(value))
+            parts.append(chunks[index])
+        if len(parts) >= writer.batch_size:
+            writer.flush()
+
+class PageWriter:
+    """Writes the parts of a page to a file in batches, so big pages never sit whole in memory.
+
+    Parts are appended to `parts`, which is written out and emptied each time a template
+    written with CompiledTemplate.write_to leaves it with at least batch_size parts.
+    """
+
+    __slots__ = ('file', 'parts', 'batch_size')
+
+    def __init__(self, file, batch_size=4096):
+        self.file = file
+        self.parts = []
+        self.batch_size = batch_size
+
+    def flush(self):
+        """Write the queued parts to the file."""
+        self.file.write(''.join(self.parts))
+        self.parts.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+HTML_TEMPLATE = CompiledTemplate(constants.HTML_TEMPLATE)
+MARRIED_NAME_TEMPLATE = CompiledTemplate(constants.MARRIED_NAME_TEMPLATE)
+RELATIONSHIP_TEMPLATE = CompiledTemplate(constants.RELATIONSHIP_TEMPLATE)
+PARENTS_TEMPLATE = CompiledTemplate(constants.PARENTS_TEMPLATE)
+PARENT_ROW_TEMPLATE = CompiledTemplate(constants.PARENT_ROW_TEMPLATE)
+SIBLING_ROW_TEMPLATE = CompiledTemplate(constants.SIBLING_ROW_TEMPLATE)
+FAMILIES_TEMPLATE = CompiledTemplate(constants.FAMILIES_TEMPLATE)
+FAMILY_ROW_TEMPLATE = CompiledTemplate(constants.FAMILY_ROW_TEMPLATE)
+CHILD_ROW_TEMPLATE = CompiledTemplate(constants.CHILD_ROW_TEMPLATE)
+PEDIGREE_TEMPLATE = CompiledTemplate(constants.PEDIGREE_TEMPLATE)
+ANCESTORS_TEMPLATE = CompiledTemplate(constants.ANCESTORS_TEMPLATE)
+DESCENDANTS_TEMPLATE = CompiledTemplate(constants.DESCENDANTS_TEMPLATE)
+INDEX_HTML_TEMPLATE = CompiledTemplate(constants.INDEX_HTML_TEMPLATE)
+INDIVIDUALS_HTML_TEMPLATE = CompiledTemplate(constants.INDIVIDUALS_HTML_TEMPLATE)
+SURNAME_ENTRY_TEMPLATE = CompiledTemplate(constants.SURNAME_ENTRY_TEMPLATE)
+SURNAME_PAGE_TEMPLATE = CompiledTemplate(constants.SURNAME_PAGE_TEMPLATE)
+SURNAME_INDIVIDUAL_ENTRY_TEMPLATE = CompiledTemplate(constants.SURNAME_INDIVIDUAL_ENTRY_TEMPLATE)
+INDIVIDUAL_ENTRY_TEMPLATE = CompiledTemplate(constants.INDIVIDUAL_ENTRY_TEMPLATE)
+SHARD_NAVIGATION_TEMPLATE = CompiledTemplate(constants.SHARD_NAVIGATION_TEMPLATE)
+SHARD_LINK_TEMPLATE = CompiledTemplate(constants.SHARD_LINK_TEMPLATE)
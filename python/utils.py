@@ -8,6 +8,9 @@ import hashlib
 import re
 from constants import OUTPUT_DIR, SURNAMES_DIR
 
+# Characters removed from names to make them safe file names
+UNSAFE_CHARACTERS_REGEX = re.compile(r'[^\w\s]')
+
 def generate_id_from_pointer(pointer):
     """Generate a unique ID from a GEDCOM pointer."""
     # Remove the @ symbols and create a hash
@@ -16,6 +19,38 @@ def generate_id_from_pointer(pointer):
     hash_obj = hashlib.md5(clean_pointer.encode())
     return hash_obj.hexdigest()[:30]
 
+def get_ids_from_pointers(pointers):
+    """Return a dict of the ID of each pointer, hashing each distinct pointer once."""
+    return {pointer: generate_id_from_pointer(pointer) for pointer in dict.fromkeys(pointers)}
+
+def get_safe_names(names):
+    """Return the safe file name of each name, as get_individual_file_path makes them.
+
+    Names can't hold line breaks, so they are sanitized together in a single regex pass.
+    """
+    names = list(names)
+    if not names:
+        return []
+    return UNSAFE_CHARACTERS_REGEX.sub('', '\n'.join(names)).lower().replace(' ', '_').split('\n')
+
+def get_individual_relative_paths(individuals):
+    """Return a dict of the relative path of each (individual_id, surname, given_name), computed in bulk.
+
+    The paths are the ones get_individual_relative_path returns.
+    """
+    individuals = list(individuals)
+    safe_surnames = get_safe_names(surname for _, surname, _ in individuals)
+    safe_given_names = get_safe_names(given_name for _, _, given_name in individuals)
+    return {
+        individual_id: f"{OUTPUT_DIR}/{safe_surname}/{safe_given_name}_{individual_id[:8]}.html"
+        for (individual_id, _, _), safe_surname, safe_given_name in zip(individuals, safe_surnames, safe_given_names)
+    }
+
+def get_file_path_from_relative(relative_path):
+    """Return the file path of a page from its path relative to the root directory, as os.path.join builds it."""
+    # Safe names hold no dots, so normalizing only drops empty parts and switches the separators
+    return os.path.normpath(relative_path)
+
 def get_file_path(individual_id):
     """Generate the file path for an individual based on their ID."""
     # Use the first two characters of the ID for the directory structure
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Watch mode: builds the site, then keeps the tree in memory and updates the site each time the
+GEDCOM file or the templates are saved.
+
+When the GEDCOM file changes, the hash of every page's inputs (see incremental.compute_page_hash)
+is compared with the previous one, and only the pages whose inputs changed are rendered again,
+along with the surname pages of the individuals concerned and the listing pages. When one of the
+generator modules changes, they are reloaded and every page is rendered again; pages whose output
+didn't change are not rewritten by DirectoryWriter either way.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import ancestors
+import constants
+import descendants
+import html_generation
+import templates
+from incremental import GENERATOR_MODULES, compute_page_hash, remove_manifest, remove_stale_files
+from output import remove_files_not_written
+from relationships import get_home_relationships
+from search_index import generate_search_index
+
+# Seconds between two checks of the watched files
+WATCH_INTERVAL = 0.5
+
+# Generator modules in the order they are reloaded, each one after the modules it imports names from
+RELOADED_MODULES = (constants, templates, ancestors, descendants, html_generation)
+
+def get_modification_times(file_paths):
+    """Return the modification time of each file, None for the ones missing."""
+    times = {}
+    for file_path in file_paths:
+        try:
+            times[file_path] = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            times[file_path] = None
+    return times
+
+class SiteWatcher:
+    """Keeps the tree and page hashes of the last build in memory to update the site when its inputs change."""
+
+    def __init__(self, args, site_writer, load_tree):
+        self.args = args
+        self.site_writer = site_writer
+        self.load_tree = load_tree
+        self.family_graph = None
+        self.individuals_data = {}
+        self.ancestor_resolver = None
+        self.descendant_resolver = None
+        self.relationships = None
+        # Pointer -> {'hash': ..., 'path': ...} of the pages written
+        self.pages = {}
+
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        self.module_files = [os.path.join(module_dir, module) for module in GENERATOR_MODULES]
+        self.gedcom_file = constants.GEDCOM_FILE
+
+    def build(self):
+        """Load the tree and write the whole site."""
+        # The pages written while watching are not recorded in the manifest of incremental builds
+        remove_manifest()
+        self.read_tree()
+        self.write_pages(list(self.pages))
+        self.write_listings(None)
+        self.site_writer.wait()
+
+        removed = remove_files_not_written(
+            [constants.OUTPUT_DIR, constants.SURNAMES_DIR], self.get_page_file_paths() + self.get_surname_file_paths(),
+            self.site_writer.sidecars
+        )
+        print(f"Built {len(self.pages)} individual pages, removed {len(removed)} files left over")
+
+    def read_tree(self):
+        """Load the tree and hash the inputs of every page, returning the previous page hashes."""
+        self.family_graph, self.individuals_data = self.load_tree(
+            self.gedcom_file, constants.SNAPSHOT_FILE if self.args.snapshot else None
+        )
+        self.make_resolvers()
+        self.relationships = self.get_relationships()
+
+        previous = self.pages
+        self.pages = {}
+        for individual_id, data in self.individuals_data.items():
+            self.pages[data.pointer] = {
+                'hash': compute_page_hash(
+                    self.family_graph, data.pointer, self.individuals_data, self.ancestor_resolver, self.relationships,
+                    self.descendant_resolver
+                ),
+                'path': data.file_path
+            }
+        return previous
+
+    def get_relationships(self):
+        """Return the relationships to the --home-person of the tree just read.
+
+        The first build exits if there is no such individual, as a normal build does. Once watching,
+        a home person removed from the GEDCOM file only drops the relationship lines, so the site
+        keeps being updated.
+        """
+        try:
+            return get_home_relationships(self.family_graph, self.individuals_data, self.args.home_person)
+        except ValueError as error:
+            if not self.pages:
+                sys.exit(f"--home-person: {error}")
+            print(f"--home-person: {error}, writing the pages without their relationship line")
+            return None
+
+    def make_resolvers(self):
+        """Create the ancestor and descendant resolvers of the current tree and generator modules."""
+        self.ancestor_resolver = ancestors.AncestorResolver(
+            self.family_graph, self.individuals_data, self.args.ancestor_depth
+        )
+        self.descendant_resolver = descendants.DescendantResolver(
+            self.family_graph, self.individuals_data, self.args.descendant_depth
+        )
+
+    def write_pages(self, pointers):
+        """Render and write the pages of the given individuals."""
+        ids = self.family_graph.ids
+        self.site_writer.make_directories([self.pages[pointer]['path'] for pointer in pointers])
+        for pointer in pointers:
+            html_content = html_generation.generate_html_for_individual(
+                self.family_graph, pointer, self.individuals_data, self.ancestor_resolver, self.relationships,
+                self.descendant_resolver
+            )
+            self.site_writer.write(self.individuals_data[ids[pointer]].file_path, html_content)
+
+    def write_listings(self, surnames):
+        """Write the listing pages, search index and the pages of the given surnames (all if None)."""
+        html_generation.generate_index_html(self.individuals_data, self.args.shard_size, self.site_writer)
+        html_generation.generate_individuals_html(self.individuals_data, self.args.shard_size, self.site_writer)
+        for surname, individuals in html_generation.group_by_surname(self.individuals_data).items():
+            if surnames is None or surname in surnames:
+                html_generation.write_surname_page(surname, individuals, self.site_writer)
+        if self.args.search_index:
+            generate_search_index(self.individuals_data, self.site_writer)
+
+    def get_page_file_paths(self):
+        """Return the file paths of the individual pages of the tree."""
+        return [page['path'] for page in self.pages.values()]
+
+    def get_surname_file_paths(self):
+        """Return the file paths of the surname pages of the tree."""
+        return [html_generation.get_surname_page_file_path(surname)
+                for surname in {data.surname for data in self.individuals_data.values()}]
+
+    def update_tree(self):
+        """Read the changed GEDCOM file and write the pages whose inputs changed."""
+        previous_data = self.individuals_data
+        previous_surname_paths = self.get_surname_file_paths()
+        previous = self.read_tree()
+
+        changed = [pointer for pointer, page in self.pages.items() if previous.get(pointer) != page]
+        self.write_pages(changed)
+
+        # Surname pages list the names and birth dates of their individuals, before and after the change
+        ids = self.family_graph.ids
+        surnames = {self.individuals_data[ids[pointer]].surname for pointer in changed}
+        surnames.update(data.surname for data in previous_data.values() if data.pointer not in self.pages
+                        or self.individuals_data[ids[data.pointer]].surname != data.surname)
+        self.write_listings(surnames)
+        self.site_writer.wait()
+
+        removed = remove_stale_files([page['path'] for page in previous.values()], self.get_page_file_paths())
+        remove_stale_files(previous_surname_paths, self.get_surname_file_paths())
+        print(f"{self.gedcom_file} changed: rewrote {len(changed)} individual pages and {len(surnames)} surname "
+              f"pages, removed {len(removed)} pages")
+
+    def update_generator(self):
+        """Reload the templates and rendering code and write every page again."""
+        for module in RELOADED_MODULES:
+            importlib.reload(module)
+        self.make_resolvers()
+
+        self.write_pages(list(self.pages))
+        self.write_listings(None)
+        self.site_writer.wait()
+        print("Templates changed: rendered every page again")
+
+    def watch(self, interval=WATCH_INTERVAL):
+        """Build the site, then update it whenever the watched files change, until interrupted."""
+        self.build()
+        module_times = get_modification_times(self.module_files)
+        gedcom_times = get_modification_times([self.gedcom_file])
+        print(f"Watching {self.gedcom_file} and the templates for changes (Ctrl+C to stop)")
+
+        try:
+            while True:
+                time.sleep(interval)
+                current_module_times = get_modification_times(self.module_files)
+                current_gedcom_times = get_modification_times([self.gedcom_file])
+                if current_module_times == module_times and current_gedcom_times == gedcom_times:
+                    continue
+
+                start = time.perf_counter()
+                updates = []
+                if current_gedcom_times != gedcom_times:
+                    updates.append(self.update_tree)
+                if current_module_times != module_times:
+                    updates.append(self.update_generator)
+                for update in updates:
+                    try:
+                        update()
+                    except Exception as error:
+                        # Keep watching: a file caught halfway through being saved, or an edited template or module
+                        # that fails, is read again on its next change
+                        print(f"Could not update the site: {type(error).__name__}: {error}")
+                module_times = current_module_times
+                gedcom_times = current_gedcom_times
+                print(f"Updated in {time.perf_counter() - start:.2f} s")
+        except KeyboardInterrupt:
+            print("Stopped watching")
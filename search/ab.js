@@ -0,0 +1 @@
+searchShard("ab",[["Abbasov, Abbas","","","ppl/abbasov/abbas_1f98826c.html"],["Abbasov, Elman","2018","","ppl/abbasov/elman_84eb10bb.html"],["Abbasov, Elman","1955","","ppl/abbasov/elman_ded5aab2.html"],["Abbasov, Emil","","","ppl/abbasov/emil_bc7e9c87.html"],["Abbasov, Ruslan","1989","","ppl/abbasov/ruslan_ee478fef.html"],["Abbasova, Amina","1996","","ppl/abbasova/amina_b56f9083.html"],["Abbasova, Irina","","2019","ppl/abbasova/irina_e1be5364.html"],["Abbasova, Sayali","1939","","ppl/abbasova/sayali_3a511d8b.html"]]);
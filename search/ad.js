@@ -0,0 +1 @@
+searchShard("ad",[["___, Adan","","","ppl/___/adan_00986eda.html"]]);
@@ -0,0 +1 @@
+searchShard("af",[["Bairamov, Afgan","","","ppl/bairamov/afgan_70259a08.html"]]);
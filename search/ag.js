@@ -0,0 +1 @@
+searchShard("ag",[["Agaoglanov, Elchin","","","ppl/agaoglanov/elchin_ed7587a8.html"],["Agaoglanov, Muzaphar","","","ppl/agaoglanov/muzaphar_e7488338.html"],["Agaoglanov, ___","","","ppl/agaoglanov/____20d3c928.html"],["Agaoglanova, Citatra","","","ppl/agaoglanova/citatra_c6746a45.html"],["Agaoglanova, Sevda","","","ppl/agaoglanova/sevda_c0327f9c.html"],["Agaoglanova, Zohra","","","ppl/agaoglanova/zohra_0d5af216.html"],["Agayev, Akif","1964","","ppl/agayev/akif_a977a92d.html"],["Agayev, Anver","","","ppl/agayev/anver_11f2645c.html"],["Agayeva, Khatira","1965","","ppl/agayeva/khatira_cc526ab7.html"],["Agayeva, Makhfura","1931","","ppl/agayeva/makhfura_c5affa38.html"],["Agazadeh, Aynur","","","ppl/agazadeh/aynur_2bdf7144.html"],["Agazadeh, Azada","","","ppl/agazadeh/azada_313c022e.html"],["Agazadeh, Farah","","2011","ppl/agazadeh/farah_7343c3e3.html"],["Agazadeh, Laman","","","ppl/agazadeh/laman_0128616d.html"],["Agazadeh, Mehin","","","ppl/agazadeh/mehin_92e11663.html"],["Agazadeh, Natik","1954","2012","ppl/agazadeh/natik_b8dd637a.html"],["Agazadeh, Nilufer","1993","","ppl/agazadeh/nilufer_075b8a98.html"],["Agazadeh, Tural","1991","","ppl/agazadeh/tural_7dd636e5.html"],["Bagirov, Agamehti","","","ppl/bagirov/agamehti_8b41cec7.html"],["Kerimov, Agakerim","","","ppl/kerimov/agakerim_6e7ae79c.html"],["Mechtiv, Agadair","","","ppl/mechtiv/agadair_6118ae7a.html"],["___, Agamehti","","","ppl/___/agamehti_36e84a8a.html"]]);
@@ -0,0 +1 @@
+searchShard("ah",[["Ahmadov, Rustam","2002","","ppl/ahmadov/rustam_7c7e4c01.html"],["Ahmedov, Babash","","","ppl/ahmedov/babash_4b53ead0.html"],["Ahmedov, Hassan","","","ppl/ahmedov/hassan_e9c103d9.html"],["Ahmedov, Hassan","","2019","ppl/ahmedov/hassan_31991c10.html"],["Ahmedov, Imran","","","ppl/ahmedov/imran_25e970b4.html"],["Ahmedov, Kanan","","","ppl/ahmedov/kanan_4f4b4cfb.html"],["Ahmedov, Nijat","","","ppl/ahmedov/nijat_5230a647.html"],["Ahmedov, Raschad","","2024","ppl/ahmedov/raschad_0c520cd1.html"],["Ahmedov, Samed","","","ppl/ahmedov/samed_ffd01bf6.html"],["Ahmedov, Samed","","","ppl/ahmedov/samed_9f3c0ebc.html"],["Ahmedov, ___","","","ppl/ahmedov/____bec13efa.html"],["Ahmedov, ___","","","ppl/ahmedov/____f3cc6d14.html"],["Ahmedova, Elnara","","","ppl/ahmedova/elnara_8e7fb9db.html"],["Ahmedova, Ilaha","","","ppl/ahmedova/ilaha_b9f5dd72.html"],["Ahmedova, Latifa","","2020","ppl/ahmedova/latifa_98a6467b.html"],["Ahmedova, Narmina","","","ppl/ahmedova/narmina_3c59df26.html"],["Ahmedova, Sonia","","","ppl/ahmedova/sonia_1e26dd11.html"],["Ahmedova, Sonia","1929","","ppl/ahmedova/sonia_cacf8059.html"],["Ahmedova, ___","","","ppl/ahmedova/____7b09d146.html"],["Suleimanov, Ahmad","1937","1951","ppl/suleimanov/ahmad_f2be565a.html"],["Suleimanov, Ahmed","","","ppl/suleimanov/ahmed_7debdcd8.html"]]);
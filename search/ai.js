@@ -0,0 +1 @@
+searchShard("ai",[["Bagirova, Aibanize","","","ppl/bagirova/aibanize_9c1640b5.html"],["Huseynova, Aiten","","","ppl/huseynova/aiten_4467a91d.html"],["___, Ainur","","","ppl/___/ainur_b00bb374.html"]]);
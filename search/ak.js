@@ -0,0 +1 @@
+searchShard("ak",[["Agayev, Akif","1964","","ppl/agayev/akif_a977a92d.html"],["Kerimov, Akif","","","ppl/kerimov/akif_151ac442.html"]]);
@@ -0,0 +1 @@
+searchShard("al",[["Allahverdiyev, Arda","2023","","ppl/allahverdiyev/arda_63ad3902.html"],["Allahverdiyev, Ayan","2016","","ppl/allahverdiyev/ayan_b4b4fb6b.html"],["Allahverdiyev, Galib","1991","","ppl/allahverdiyev/galib_40e8975c.html"],["Bairamov, Ali","","","ppl/bairamov/ali_b269c30e.html"],["Sattarov, Alec","","","ppl/sattarov/alec_1c1ab415.html"],["Suleimanov, Aligaydar","1968","","ppl/suleimanov/aligaydar_519adbf3.html"],["Suleimanov, Aligeidar","1906","","ppl/suleimanov/aligeidar_2f0fbb0d.html"]]);
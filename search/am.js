@@ -0,0 +1 @@
+searchShard("am",[["Abbasova, Amina","1996","","ppl/abbasova/amina_b56f9083.html"],["Bagirova, Amala","","","ppl/bagirova/amala_277b307c.html"],["Bagirova, Amala","","","ppl/bagirova/amala_010905a0.html"],["Rasulova, Amira","2025","","ppl/rasulova/amira_ab0fd95c.html"]]);
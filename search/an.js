@@ -0,0 +1 @@
+searchShard("an",[["Agayev, Anver","","","ppl/agayev/anver_11f2645c.html"],["Dugin, Anatoli","","2022","ppl/dugin/anatoli_aa1b58dc.html"],["Kerimova, Anahamin","","","ppl/kerimova/anahamin_05a72bb4.html"]]);
@@ -0,0 +1 @@
+searchShard("ar",[["Allahverdiyev, Arda","2023","","ppl/allahverdiyev/arda_63ad3902.html"],["Bagirova, Arzu","","","ppl/bagirova/arzu_2b7ae9bb.html"]]);
@@ -0,0 +1 @@
+searchShard("as",[["Bagirov, Aslan","","","ppl/bagirov/aslan_2cb4eacf.html"],["Kerimov, Asad","","","ppl/kerimov/asad_c025b444.html"],["Muzafarov, Asker","","","ppl/muzafarov/asker_165e760e.html"]]);
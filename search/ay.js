@@ -0,0 +1 @@
+searchShard("ay",[["Agazadeh, Aynur","","","ppl/agazadeh/aynur_2bdf7144.html"],["Allahverdiyev, Ayan","2016","","ppl/allahverdiyev/ayan_b4b4fb6b.html"],["Bagirov, Aydin","","","ppl/bagirov/aydin_54beca49.html"],["Bagirova, Ayan","","","ppl/bagirova/ayan_90842706.html"],["Bairamova, Aytekin","","","ppl/bairamova/aytekin_ad0d0902.html"],["Malikov, Aydin","","","ppl/malikov/aydin_6116d178.html"],["Novruzu, Aydan","","","ppl/novruzu/aydan_fb4f3bc8.html"]]);
@@ -0,0 +1 @@
+searchShard("az",[["Agazadeh, Azada","","","ppl/agazadeh/azada_313c022e.html"],["Kerimov, Azad","1962","","ppl/kerimov/azad_94abc53a.html"],["Rzaev, Azis","","","ppl/rzaev/azis_c58e89c6.html"]]);
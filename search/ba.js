@@ -0,0 +1 @@
+searchShard("ba",[["Ahmedov, Babash","","","ppl/ahmedov/babash_4b53ead0.html"],["Bagirov, Agamehti","","","ppl/bagirov/agamehti_8b41cec7.html"],["Bagirov, Aslan","","","ppl/bagirov/aslan_2cb4eacf.html"],["Bagirov, Aydin","","","ppl/bagirov/aydin_54beca49.html"],["Bagirov, Bagir","","","ppl/bagirov/bagir_7f8a7693.html"],["Bagirov, Eldar","","","ppl/bagirov/eldar_cd3fc55f.html"],["Bagirov, Elkin","","","ppl/bagirov/elkin_9824e8e2.html"],["Bagirov, Emil","","","ppl/bagirov/emil_3a51a20c.html"],["Bagirov, Huseyn","","","ppl/bagirov/huseyn_eef16ddb.html"],["Bagirov, Ibragim","","","ppl/bagirov/ibragim_d4b1388a.html"],["Bagirov, Ibragim","1979","","ppl/bagirov/ibragim_f44f3adb.html"],["Bagirov, Kamil","1939","2005","ppl/bagirov/kamil_2e23f3d6.html"],["Bagirov, Kamil","1990","","ppl/bagirov/kamil_8265040a.html"],["Bagirov, Mehemmed","","","ppl/bagirov/mehemmed_47e8a04e.html"],["Bagirov, Mehti","","","ppl/bagirov/mehti_e0099a57.html"],["Bagirov, Namik","","","ppl/bagirov/namik_4b81f707.html"],["Bagirov, Natik","","","ppl/bagirov/natik_31ac9dd2.html"],["Bagirov, Orhan","","","ppl/bagirov/orhan_2b45164a.html"],["Bagirov, Rafik","","","ppl/bagirov/rafik_7f038c7a.html"],["Bagirov, Rafik","","","ppl/bagirov/rafik_f449a991.html"],["Bagirov, Ramiz","","","ppl/bagirov/ramiz_2057924a.html"],["Bagirov, Rashad","","","ppl/bagirov/rashad_0646029d.html"],["Bagirov, Rasim","","","ppl/bagirov/rasim_f6fe722c.html"],["Bagirov, Samir","","","ppl/bagirov/samir_0955d1f2.html"],["Bagirov, Sevgili","","","ppl/bagirov/sevgili_bdffb20e.html"],["Bagirov, Taleh","","","ppl/bagirov/taleh_dd3fbc53.html"],["Bagirov, Tamerlan","","","ppl/bagirov/tamerlan_2857b13d.html"],["Bagirov, Tofik","","","ppl/bagirov/tofik_d2b21bd7.html"],["Bagirov, Tofik","","","ppl/bagirov/tofik_6e70fa37.html"],["Bagirov, Vugar","","","ppl/bagirov/vugar_b78ceb71.html"],["Bagirov, Yousif","","","ppl/bagirov/yousif_284769c8.html"],["Bagirov, Yusif","","","ppl/bagirov/yusif_71c85658.html"],["Bagirov, ___","","","ppl/bagirov/____83bae520.html"],["Bagirova, Aibanize","","","ppl/bagirova/aibanize_9c1640b5.html"],["Bagirova, Amala","","","ppl/bagirova/amala_277b307c.html"],["Bagirova, Amala","","","ppl/bagirova/amala_010905a0.html"],["Bagirova, Arzu","","","ppl/bagirova/arzu_2b7ae9bb.html"],["Bagirova, Ayan","","","ppl/bagirova/ayan_90842706.html"],["Bagirova, Chovket","","","ppl/bagirova/chovket_a50b77a1.html"],["Bagirova, Dilara","","","ppl/bagirova/dilara_90e35320.html"],["Bagirova, Esmer","","","ppl/bagirova/esmer_81d81896.html"],["Bagirova, Fidan","","","ppl/bagirova/fidan_02c9f255.html"],["Bagirova, Gulchoaxra","","","ppl/bagirova/gulchoaxra_0581085c.html"],["Bagirova, Gunel","","","ppl/bagirova/gunel_8d3f066f.html"],["Bagirova, Hadija","","","ppl/bagirova/hadija_dee440ac.html"],["Bagirova, Halida","","","ppl/bagirova/halida_cabbb88e.html"],["Bagirova, Hanum","","","ppl/bagirova/hanum_954b2eb6.html"],["Bagirova, Hatira","","","ppl/bagirova/hatira_b2f0c3cc.html"],["Bagirova, Hokuma","","","ppl/bagirova/hokuma_4c9354d1.html"],["Bagirova, Ilhama","","","ppl/bagirova/ilhama_9405cec3.html"],["Bagirova, Kamala","","","ppl/bagirova/kamala_0531c5c5.html"],["Bagirova, Latifa","","","ppl/bagirova/latifa_ba1090d8.html"],["Bagirova, Mariam","","","ppl/bagirova/mariam_90189598.html"],["Bagirova, Medina","","","ppl/bagirova/medina_14add6b6.html"],["Bagirova, Natavan","","","ppl/bagirova/natavan_195c4561.html"],["Bagirova, Nigar","","","ppl/bagirova/nigar_b75df148.html"],["Bagirova, Nigar","","","ppl/bagirova/nigar_9a556b1c.html"],["Bagirova, Oksana","","","ppl/bagirova/oksana_8fc24fdf.html"],["Bagirova, Samira","","","ppl/bagirova/samira_7c1febb0.html"],["Bagirova, Sevda","","","ppl/bagirova/sevda_e656be4f.html"],["Bagirova, Shirin","","","ppl/bagirova/shirin_4303daf7.html"],["Bagirova, Shirin","","","ppl/bagirova/shirin_ab55b207.html"],["Bagirova, Solmace","","","ppl/bagirova/solmace_dd52e83e.html"],["Bagirova, Sona","","","ppl/bagirova/sona_7c0e6416.html"],["Bagirova, Svetlana","1949","2011","ppl/bagirova/svetlana_33ceff0b.html"],["Bagirova, Taira","","","ppl/bagirova/taira_3bce10b0.html"],["Bagirova, Tarana","","","ppl/bagirova/tarana_73f1bac0.html"],["Bagirova, Turan","","","ppl/bagirova/turan_1908dd97.html"],["Bairamov, Afgan","","","ppl/bairamov/afgan_70259a08.html"],["Bairamov, Ali","","","ppl/bairamov/ali_b269c30e.html"],["Bairamov, Jayhun","","","ppl/bairamov/jayhun_bfe483b5.html"],["Bairamov, Shahin","","","ppl/bairamov/shahin_b207208c.html"],["Bairamov, Shahin","2000","","ppl/bairamov/shahin_50ba32c4.html"],["Bairamov, Valeh","","","ppl/bairamov/valeh_971f9ea1.html"],["Bairamov, ___","","","ppl/bairamov/____2b873035.html"],["Bairamova, Aytekin","","","ppl/bairamova/aytekin_ad0d0902.html"],["Bairamova, Gulay","","","ppl/bairamova/gulay_e50fb960.html"],["Bairamova, Kenul","","","ppl/bairamova/kenul_3797a511.html"],["Bairamova, Natavan","","","ppl/bairamova/natavan_969c7f8d.html"],["Bairamova, Ofila","","","ppl/bairamova/ofila_27f5c9b9.html"],["Bairamova, Ophela","","","ppl/bairamova/ophela_f612178f.html"],["Kerimov, Baba","1932","1995","ppl/kerimov/baba_72289527.html"],["Kerimov, Balaga","","","ppl/kerimov/balaga_5350e555.html"],["Kerimov, Balakerim","","","ppl/kerimov/balakerim_775c2aef.html"],["Kerimova, Balahanim","","","ppl/kerimova/balahanim_fed2b999.html"],["Suleimanov, Bahram","1939","1976","ppl/suleimanov/bahram_94a21b3c.html"],["___, Baba","","","ppl/___/baba_b8aa44fb.html"]]);
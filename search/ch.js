@@ -0,0 +1 @@
+searchShard("ch",[["Bagirova, Chovket","","","ppl/bagirova/chovket_a50b77a1.html"],["Kasumov, Chingise","","","ppl/kasumov/chingise_5d10277a.html"],["Kasumova, Chanisa","","","ppl/kasumova/chanisa_b925e675.html"],["Rzaev, Chamsadin","","","ppl/rzaev/chamsadin_bc7162fd.html"]]);
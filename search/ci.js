@@ -0,0 +1 @@
+searchShard("ci",[["Agaoglanova, Citatra","","","ppl/agaoglanova/citatra_c6746a45.html"]]);
@@ -0,0 +1 @@
+searchShard("di",[["Bagirova, Dilara","","","ppl/bagirova/dilara_90e35320.html"],["Suleimanova, Dilshad","","","ppl/suleimanova/dilshad_8e29140c.html"]]);
@@ -0,0 +1 @@
+searchShard("du",[["Dugin, Anatoli","","2022","ppl/dugin/anatoli_aa1b58dc.html"],["Dugina, Svetlana","","","ppl/dugina/svetlana_469effc0.html"]]);
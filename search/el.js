@@ -0,0 +1 @@
+searchShard("el",[["Abbasov, Elman","2018","","ppl/abbasov/elman_84eb10bb.html"],["Abbasov, Elman","1955","","ppl/abbasov/elman_ded5aab2.html"],["Agaoglanov, Elchin","","","ppl/agaoglanov/elchin_ed7587a8.html"],["Ahmedova, Elnara","","","ppl/ahmedova/elnara_8e7fb9db.html"],["Bagirov, Eldar","","","ppl/bagirov/eldar_cd3fc55f.html"],["Bagirov, Elkin","","","ppl/bagirov/elkin_9824e8e2.html"],["Kerimov, Elchin","","","ppl/kerimov/elchin_1095fbb7.html"],["Kerimov, Elkin","","","ppl/kerimov/elkin_4d4116b6.html"],["Mamedova, Elmira","","","ppl/mamedova/elmira_590e755d.html"],["Suleimanova, Elvira","","","ppl/suleimanova/elvira_d50f7ad3.html"],["___, Elmira","","","ppl/___/elmira_eadd613a.html"]]);
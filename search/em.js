@@ -0,0 +1 @@
+searchShard("em",[["Abbasov, Emil","","","ppl/abbasov/emil_bc7e9c87.html"],["Bagirov, Emil","","","ppl/bagirov/emil_3a51a20c.html"],["Gafarov, Emil","1988","","ppl/gafarov/emil_76d4e8e1.html"],["Kerimov, Emil","1993","","ppl/kerimov/emil_ad0a489d.html"],["___, Emil","","","ppl/___/emil_5af87619.html"]]);
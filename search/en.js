@@ -0,0 +1 @@
+searchShard("en",[["Kerimova, Engie","","","ppl/kerimova/engie_4f3d4f84.html"]]);
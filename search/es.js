@@ -0,0 +1 @@
+searchShard("es",[["Bagirova, Esmer","","","ppl/bagirova/esmer_81d81896.html"],["Kerimova, Esmira","","","ppl/kerimova/esmira_3c996547.html"],["___, Esvera","","","ppl/___/esvera_c95fb405.html"]]);
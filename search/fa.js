@@ -0,0 +1 @@
+searchShard("fa",[["Agazadeh, Farah","","2011","ppl/agazadeh/farah_7343c3e3.html"],["Kerimov, Fahradin","1974","","ppl/kerimov/fahradin_0b432916.html"],["Kerimova, Fatima","","","ppl/kerimova/fatima_af747685.html"],["Novruzu, Farhat","","","ppl/novruzu/farhat_bd9057b3.html"],["Rustamava, Fatima","","","ppl/rustamava/fatima_82232845.html"],["Sadihli, Farid","","","ppl/sadihli/farid_313e50fd.html"],["___, Fahrai","","","ppl/___/fahrai_456130ff.html"],["___, Farhad","","","ppl/___/farhad_c073123a.html"],["___, Farhat","","","ppl/___/farhat_52af02ef.html"],["___, Farid","","","ppl/___/farid_c3e15521.html"]]);
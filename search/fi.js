@@ -0,0 +1 @@
+searchShard("fi",[["Bagirova, Fidan","","","ppl/bagirova/fidan_02c9f255.html"],["Kerimova, Firangiz","1935","","ppl/kerimova/firangiz_7c4562df.html"],["Suleimanova, Fidan","","","ppl/suleimanova/fidan_56415058.html"],["Zeinalov, Fikret","","","ppl/zeinalov/fikret_1ea0549e.html"]]);
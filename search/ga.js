@@ -0,0 +1 @@
+searchShard("ga",[["Allahverdiyev, Galib","1991","","ppl/allahverdiyev/galib_40e8975c.html"],["Gafarov, Emil","1988","","ppl/gafarov/emil_76d4e8e1.html"],["Gafarova, Nazaket","1945","","ppl/gafarova/nazaket_7612a4aa.html"],["Gafarova, Sabina","1981","","ppl/gafarova/sabina_e5ae0e0f.html"],["Gafarova, Vusala","1978","","ppl/gafarova/vusala_8ec4a182.html"],["Kerimov, Gabil","","","ppl/kerimov/gabil_c15e6c86.html"],["Kerimova, Galina","","","ppl/kerimova/galina_7a77ef44.html"],["Kerimova, Gallina","","","ppl/kerimova/gallina_d1aa0ee1.html"],["Novruzu, Gayeb","","","ppl/novruzu/gayeb_35201f5b.html"]]);
@@ -0,0 +1 @@
+searchShard("gu",[["Bagirova, Gulchoaxra","","","ppl/bagirova/gulchoaxra_0581085c.html"],["Bagirova, Gunel","","","ppl/bagirova/gunel_8d3f066f.html"],["Bairamova, Gulay","","","ppl/bairamova/gulay_e50fb960.html"],["Gulam, Guliev","","","ppl/gulam/guliev_8cb14da9.html"],["Gulam, Manii","","","ppl/gulam/manii_9cf6f516.html"],["Gulcheev, Hadjiismail","1906","1987","ppl/gulcheev/hadjiismail_6a7f2772.html"],["Gulchiev, Hagjimurad","","","ppl/gulchiev/hagjimurad_ed34de43.html"],["Gulchieva, Lisa","","","ppl/gulchieva/lisa_eaf6e8db.html"],["Gulchieva, Praskovia","","","ppl/gulchieva/praskovia_77d464eb.html"],["Gulchieva, Rosa","","","ppl/gulchieva/rosa_c4176586.html"],["Gulieva, Teyara","","","ppl/gulieva/teyara_f02914ab.html"],["___, Gulay","","","ppl/___/gulay_d99d4521.html"]]);
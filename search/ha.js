@@ -0,0 +1 @@
+searchShard("ha",[["Ahmedov, Hassan","","","ppl/ahmedov/hassan_e9c103d9.html"],["Ahmedov, Hassan","","2019","ppl/ahmedov/hassan_31991c10.html"],["Bagirova, Hadija","","","ppl/bagirova/hadija_dee440ac.html"],["Bagirova, Halida","","","ppl/bagirova/halida_cabbb88e.html"],["Bagirova, Hanum","","","ppl/bagirova/hanum_954b2eb6.html"],["Bagirova, Hatira","","","ppl/bagirova/hatira_b2f0c3cc.html"],["Gulcheev, Hadjiismail","1906","1987","ppl/gulcheev/hadjiismail_6a7f2772.html"],["Gulchiev, Hagjimurad","","","ppl/gulchiev/hagjimurad_ed34de43.html"],["Hadgilsmail, ?","","","ppl/hadgilsmail/_ace986a8.html"],["Kerimov, Habil","","","ppl/kerimov/habil_ec0a7cf3.html"],["Kerimov, Halid","","","ppl/kerimov/halid_7702fd4a.html"],["Kerimov, Halig","1880","","ppl/kerimov/halig_9cfe082a.html"],["Mechtiva, Hanum","","","ppl/mechtiva/hanum_a718ab09.html"],["Sattarov, Hassan","","","ppl/sattarov/hassan_71044a26.html"],["___, Hayala","","","ppl/___/hayala_a5c3177f.html"]]);
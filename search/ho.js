@@ -0,0 +1 @@
+searchShard("ho",[["Bagirova, Hokuma","","","ppl/bagirova/hokuma_4c9354d1.html"]]);
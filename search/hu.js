@@ -0,0 +1 @@
+searchShard("hu",[["Bagirov, Huseyn","","","ppl/bagirov/huseyn_eef16ddb.html"],["Huseynov, Vahid","","","ppl/huseynov/vahid_9de1c32c.html"],["Huseynov, Zaur","","","ppl/huseynov/zaur_ad98cdbb.html"],["Huseynova, Aiten","","","ppl/huseynova/aiten_4467a91d.html"],["Huseynova, Taira","","","ppl/huseynova/taira_55aee23e.html"],["Huseynova, Ulker","","","ppl/huseynova/ulker_ad06d02c.html"],["Rasulov, Huseynn","","","ppl/rasulov/huseynn_d5fc0c6f.html"],["Sattarova, Hummara","","","ppl/sattarova/hummara_f62f304d.html"]]);
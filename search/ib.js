@@ -0,0 +1 @@
+searchShard("ib",[["Bagirov, Ibragim","","","ppl/bagirov/ibragim_d4b1388a.html"],["Bagirov, Ibragim","1979","","ppl/bagirov/ibragim_f44f3adb.html"],["___, Ibraghim","","","ppl/___/ibraghim_b49d3a03.html"]]);
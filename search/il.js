@@ -0,0 +1 @@
+searchShard("il",[["Ahmedova, Ilaha","","","ppl/ahmedova/ilaha_b9f5dd72.html"],["Bagirova, Ilhama","","","ppl/bagirova/ilhama_9405cec3.html"],["Kerimov, Ilgar","1964","","ppl/kerimov/ilgar_698c4a87.html"],["___, Ilas","","","ppl/___/ilas_4d5f8571.html"]]);
@@ -0,0 +1 @@
+searchShard("im",[["Ahmedov, Imran","","","ppl/ahmedov/imran_25e970b4.html"],["___, Imran","","","ppl/___/imran_4591da35.html"]]);
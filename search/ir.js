@@ -0,0 +1 @@
+searchShard("ir",[["Abbasova, Irina","","2019","ppl/abbasova/irina_e1be5364.html"],["Kerimova, Irada","1963","","ppl/kerimova/irada_81a8e864.html"]]);
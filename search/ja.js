@@ -0,0 +1 @@
+searchShard("ja",[["Bairamov, Jayhun","","","ppl/bairamov/jayhun_bfe483b5.html"],["Kerimov, Jaehoon","","","ppl/kerimov/jaehoon_70cfdf62.html"],["Kerimov, Jaheed","","","ppl/kerimov/jaheed_39955104.html"],["Kerimova, Javahir","","","ppl/kerimova/javahir_4c38e9df.html"],["___, Jabir","","","ppl/___/jabir_82b3128f.html"]]);
@@ -0,0 +1 @@
+searchShard("ka",[["Ahmedov, Kanan","","","ppl/ahmedov/kanan_4f4b4cfb.html"],["Bagirov, Kamil","1939","2005","ppl/bagirov/kamil_2e23f3d6.html"],["Bagirov, Kamil","1990","","ppl/bagirov/kamil_8265040a.html"],["Bagirova, Kamala","","","ppl/bagirova/kamala_0531c5c5.html"],["Kasumov, Chingise","","","ppl/kasumov/chingise_5d10277a.html"],["Kasumov, Oktai","","","ppl/kasumov/oktai_a7feaa35.html"],["Kasumov, ___","","","ppl/kasumov/____ed1483b4.html"],["Kasumov, ___","","","ppl/kasumov/____becc4606.html"],["Kasumova, Chanisa","","","ppl/kasumova/chanisa_b925e675.html"],["Kasumova, Maya","","","ppl/kasumova/maya_d8588b9c.html"],["Kasumova, Mehine","","","ppl/kasumova/mehine_5e4301c8.html"]]);
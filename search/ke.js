@@ -0,0 +1 @@
+searchShard("ke",[["Bairamova, Kenul","","","ppl/bairamova/kenul_3797a511.html"],["Kerimov, Agakerim","","","ppl/kerimov/agakerim_6e7ae79c.html"],["Kerimov, Akif","","","ppl/kerimov/akif_151ac442.html"],["Kerimov, Asad","","","ppl/kerimov/asad_c025b444.html"],["Kerimov, Azad","1962","","ppl/kerimov/azad_94abc53a.html"],["Kerimov, Baba","1932","1995","ppl/kerimov/baba_72289527.html"],["Kerimov, Balaga","","","ppl/kerimov/balaga_5350e555.html"],["Kerimov, Balakerim","","","ppl/kerimov/balakerim_775c2aef.html"],["Kerimov, Elchin","","","ppl/kerimov/elchin_1095fbb7.html"],["Kerimov, Elkin","","","ppl/kerimov/elkin_4d4116b6.html"],["Kerimov, Emil","1993","","ppl/kerimov/emil_ad0a489d.html"],["Kerimov, Fahradin","1974","","ppl/kerimov/fahradin_0b432916.html"],["Kerimov, Gabil","","","ppl/kerimov/gabil_c15e6c86.html"],["Kerimov, Habil","","","ppl/kerimov/habil_ec0a7cf3.html"],["Kerimov, Halid","","","ppl/kerimov/halid_7702fd4a.html"],["Kerimov, Halig","1880","","ppl/kerimov/halig_9cfe082a.html"],["Kerimov, Ilgar","1964","","ppl/kerimov/ilgar_698c4a87.html"],["Kerimov, Jaehoon","","","ppl/kerimov/jaehoon_70cfdf62.html"],["Kerimov, Jaheed","","","ppl/kerimov/jaheed_39955104.html"],["Kerimov, Mamedkerim","","","ppl/kerimov/mamedkerim_e04b1b87.html"],["Kerimov, Mirzakerim","","","ppl/kerimov/mirzakerim_fdaaba3f.html"],["Kerimov, Negmatin","","","ppl/kerimov/negmatin_b0ec1c7e.html"],["Kerimov, Oleg","","","ppl/kerimov/oleg_29ee1418.html"],["Kerimov, Orhan","","","ppl/kerimov/orhan_f243f3cc.html"],["Kerimov, Rahib","","","ppl/kerimov/rahib_68051871.html"],["Kerimov, Ramiz","","","ppl/kerimov/ramiz_08c0f89a.html"],["Kerimov, Saidular","","","ppl/kerimov/saidular_76b7ece3.html"],["Kerimov, Salim","","","ppl/kerimov/salim_01812de3.html"],["Kerimov, Sultan","1920","","ppl/kerimov/sultan_b931f09a.html"],["Kerimov, Tofik","","","ppl/kerimov/tofik_73d34381.html"],["Kerimov, Urah","","","ppl/kerimov/urah_2b3cf596.html"],["Kerimov, Yavar","","","ppl/kerimov/yavar_9929e141.html"],["Kerimov, Zahid","","2014","ppl/kerimov/zahid_2cfb9b2a.html"],["Kerimov, Zaqir","","","ppl/kerimov/zaqir_6da961cb.html"],["Kerimov, Zaur","1971","","ppl/kerimov/zaur_083635bf.html"],["Kerimov, Zaur","","","ppl/kerimov/zaur_e247c0fd.html"],["Kerimov, ___","","","ppl/kerimov/____75f6c0d5.html"],["Kerimov, ___","","","ppl/kerimov/____56dd1d35.html"],["Kerimov, ___","","","ppl/kerimov/____9278e994.html"],["Kerimov, ___","","","ppl/kerimov/____6119e67f.html"],["Kerimova, Anahamin","","","ppl/kerimova/anahamin_05a72bb4.html"],["Kerimova, Balahanim","","","ppl/kerimova/balahanim_fed2b999.html"],["Kerimova, Engie","","","ppl/kerimova/engie_4f3d4f84.html"],["Kerimova, Esmira","","","ppl/kerimova/esmira_3c996547.html"],["Kerimova, Fatima","","","ppl/kerimova/fatima_af747685.html"],["Kerimova, Firangiz","1935","","ppl/kerimova/firangiz_7c4562df.html"],["Kerimova, Galina","","","ppl/kerimova/galina_7a77ef44.html"],["Kerimova, Gallina","","","ppl/kerimova/gallina_d1aa0ee1.html"],["Kerimova, Irada","1963","","ppl/kerimova/irada_81a8e864.html"],["Kerimova, Javahir","","","ppl/kerimova/javahir_4c38e9df.html"],["Kerimova, Malak","","","ppl/kerimova/malak_aeed0c26.html"],["Kerimova, Mehreban","","","ppl/kerimova/mehreban_963e7635.html"],["Kerimova, Naseba","","","ppl/kerimova/naseba_dcd4093c.html"],["Kerimova, Nasila","","","ppl/kerimova/nasila_5f8e43b7.html"],["Kerimova, Niki","1988","","ppl/kerimova/niki_298336db.html"],["Kerimova, Sabina","1973","","ppl/kerimova/sabina_3f6a8607.html"],["Kerimova, Sarah","","","ppl/kerimova/sarah_152cfb8d.html"],["Kerimova, Sarfinaz","","","ppl/kerimova/sarfinaz_6204c953.html"],["Kerimova, Solmaz","","","ppl/kerimova/solmaz_404d5f39.html"],["Kerimova, Zeinab","","","ppl/kerimova/zeinab_34c804a0.html"],["Kerimova, ___","","","ppl/kerimova/____162a7703.html"],["Kerimova, ___","","","ppl/kerimova/____52a167fe.html"],["Kerimova, ___","","","ppl/kerimova/____7d0891f5.html"],["Kerimova, ___","","","ppl/kerimova/____fe2ced46.html"],["Kerimova, ___","","","ppl/kerimova/____a002d863.html"],["Kerimova, ___","","","ppl/kerimova/____9807e360.html"],["Kerimova, ___","","","ppl/kerimova/____c0242df8.html"]]);
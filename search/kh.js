@@ -0,0 +1 @@
+searchShard("kh",[["Agayeva, Khatira","1965","","ppl/agayeva/khatira_cc526ab7.html"]]);
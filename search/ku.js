@@ -0,0 +1 @@
+searchShard("ku",[["Suleimanova, Kursum","1912","","ppl/suleimanova/kursum_0a2ecd50.html"]]);
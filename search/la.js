@@ -0,0 +1 @@
+searchShard("la",[["Agazadeh, Laman","","","ppl/agazadeh/laman_0128616d.html"],["Ahmedova, Latifa","","2020","ppl/ahmedova/latifa_98a6467b.html"],["Bagirova, Latifa","","","ppl/bagirova/latifa_ba1090d8.html"],["Sattarova, Latifa","","","ppl/sattarova/latifa_fbd5bc40.html"]]);
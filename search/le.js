@@ -0,0 +1 @@
+searchShard("le",[["___, Leila","","","ppl/___/leila_8997ccbe.html"]]);
@@ -0,0 +1 @@
+searchShard("li",[["Gulchieva, Lisa","","","ppl/gulchieva/lisa_eaf6e8db.html"]]);
@@ -0,0 +1 @@
+searchShard("ma",[["Agayeva, Makhfura","1931","","ppl/agayeva/makhfura_c5affa38.html"],["Bagirova, Mariam","","","ppl/bagirova/mariam_90189598.html"],["Gulam, Manii","","","ppl/gulam/manii_9cf6f516.html"],["Kasumova, Maya","","","ppl/kasumova/maya_d8588b9c.html"],["Kerimov, Mamedkerim","","","ppl/kerimov/mamedkerim_e04b1b87.html"],["Kerimova, Malak","","","ppl/kerimova/malak_aeed0c26.html"],["Malikov, Aydin","","","ppl/malikov/aydin_6116d178.html"],["Malikov, Mamedaga","","","ppl/malikov/mamedaga_49d212c0.html"],["Malikov, ___","","","ppl/malikov/____adc87d85.html"],["Malikova, Samira","","","ppl/malikova/samira_186d2a26.html"],["Malikova, Shafack","","","ppl/malikova/shafack_bc96391f.html"],["Mamedov, Najaf","","","ppl/mamedov/najaf_44cb798b.html"],["Mamedov, Ramiz","","","ppl/mamedov/ramiz_8f9baadd.html"],["Mamedova, Elmira","","","ppl/mamedova/elmira_590e755d.html"],["Muradkhanov, Mansur","","","ppl/muradkhanov/mansur_93f573d5.html"],["Muradkhanov, Marat","1992","","ppl/muradkhanov/marat_15c1a805.html"],["Rzaeva, Malahad","","","ppl/rzaeva/malahad_c2f218fd.html"],["___, Malahet","","","ppl/___/malahet_d7693d2c.html"],["___, Mariam","","","ppl/___/mariam_b4dbf675.html"]]);
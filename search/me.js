@@ -0,0 +1 @@
+searchShard("me",[["Agazadeh, Mehin","","","ppl/agazadeh/mehin_92e11663.html"],["Bagirov, Mehemmed","","","ppl/bagirov/mehemmed_47e8a04e.html"],["Bagirov, Mehti","","","ppl/bagirov/mehti_e0099a57.html"],["Bagirova, Medina","","","ppl/bagirova/medina_14add6b6.html"],["Kasumova, Mehine","","","ppl/kasumova/mehine_5e4301c8.html"],["Kerimova, Mehreban","","","ppl/kerimova/mehreban_963e7635.html"],["Mechtiv, Agadair","","","ppl/mechtiv/agadair_6118ae7a.html"],["Mechtiva, Hanum","","","ppl/mechtiva/hanum_a718ab09.html"],["Mechtiva, Narmina","","","ppl/mechtiva/narmina_6ab6bff4.html"],["Mechtiva, Sevinch","","","ppl/mechtiva/sevinch_99666ad6.html"],["Mechtiva, Tahmina","","","ppl/mechtiva/tahmina_ec5e0e50.html"]]);
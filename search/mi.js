@@ -0,0 +1 @@
+searchShard("mi",[["Kerimov, Mirzakerim","","","ppl/kerimov/mirzakerim_fdaaba3f.html"]]);
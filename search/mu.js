@@ -0,0 +1 @@
+searchShard("mu",[["Agaoglanov, Muzaphar","","","ppl/agaoglanov/muzaphar_e7488338.html"],["Muradkhanov, Mansur","","","ppl/muradkhanov/mansur_93f573d5.html"],["Muradkhanov, Marat","1992","","ppl/muradkhanov/marat_15c1a805.html"],["Muradkhanova, Umaira","","","ppl/muradkhanova/umaira_779020c6.html"],["Musayev, Shahin","1963","","ppl/musayev/shahin_958451a2.html"],["Musayev, Ughur","1998","","ppl/musayev/ughur_a4ecf3cf.html"],["Muzafarov, ?","","","ppl/muzafarov/_b8180020.html"],["Muzafarov, Asker","","","ppl/muzafarov/asker_165e760e.html"],["Muzafarova, Safura","","","ppl/muzafarova/safura_ceea5dc8.html"],["___, Sevil (Mumu)","","","ppl/___/sevil_mumu_82852df4.html"]]);
@@ -0,0 +1 @@
+searchShard("na",[["Agazadeh, Natik","1954","2012","ppl/agazadeh/natik_b8dd637a.html"],["Ahmedova, Narmina","","","ppl/ahmedova/narmina_3c59df26.html"],["Bagirov, Namik","","","ppl/bagirov/namik_4b81f707.html"],["Bagirov, Natik","","","ppl/bagirov/natik_31ac9dd2.html"],["Bagirova, Natavan","","","ppl/bagirova/natavan_195c4561.html"],["Bairamova, Natavan","","","ppl/bairamova/natavan_969c7f8d.html"],["Gafarova, Nazaket","1945","","ppl/gafarova/nazaket_7612a4aa.html"],["Kerimova, Naseba","","","ppl/kerimova/naseba_dcd4093c.html"],["Kerimova, Nasila","","","ppl/kerimova/nasila_5f8e43b7.html"],["Mamedov, Najaf","","","ppl/mamedov/najaf_44cb798b.html"],["Mechtiva, Narmina","","","ppl/mechtiva/narmina_6ab6bff4.html"],["Rustamava, Nargiz","","","ppl/rustamava/nargiz_e42c518e.html"],["Zohrabova, Nazile","","","ppl/zohrabova/nazile_dba98e75.html"],["___, Nazifa","","","ppl/___/nazifa_77433927.html"]]);
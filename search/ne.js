@@ -0,0 +1 @@
+searchShard("ne",[["Kerimov, Negmatin","","","ppl/kerimov/negmatin_b0ec1c7e.html"]]);
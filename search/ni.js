@@ -0,0 +1 @@
+searchShard("ni",[["Agazadeh, Nilufer","1993","","ppl/agazadeh/nilufer_075b8a98.html"],["Ahmedov, Nijat","","","ppl/ahmedov/nijat_5230a647.html"],["Bagirova, Nigar","","","ppl/bagirova/nigar_b75df148.html"],["Bagirova, Nigar","","","ppl/bagirova/nigar_9a556b1c.html"],["Kerimova, Niki","1988","","ppl/kerimova/niki_298336db.html"],["Rustamava, Nigar","","","ppl/rustamava/nigar_ad924fe1.html"],["Zeinalov, Nizami","","","ppl/zeinalov/nizami_09cd5948.html"],["Zohrabov, Nijat","","","ppl/zohrabov/nijat_227a028e.html"]]);
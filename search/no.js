@@ -0,0 +1 @@
+searchShard("no",[["Novruzu, ","","","ppl/novruzu/_618d390f.html"],["Novruzu, Aydan","","","ppl/novruzu/aydan_fb4f3bc8.html"],["Novruzu, Farhat","","","ppl/novruzu/farhat_bd9057b3.html"],["Novruzu, Gayeb","","","ppl/novruzu/gayeb_35201f5b.html"],["Novruzu, Nurlan","","","ppl/novruzu/nurlan_477813cd.html"],["Sattarova, Nona","","","ppl/sattarova/nona_9332070f.html"]]);
@@ -0,0 +1 @@
+searchShard("nu",[["Novruzu, Nurlan","","","ppl/novruzu/nurlan_477813cd.html"]]);
@@ -0,0 +1 @@
+searchShard("of",[["Bairamova, Ofila","","","ppl/bairamova/ofila_27f5c9b9.html"]]);
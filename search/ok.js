@@ -0,0 +1 @@
+searchShard("ok",[["Bagirova, Oksana","","","ppl/bagirova/oksana_8fc24fdf.html"],["Kasumov, Oktai","","","ppl/kasumov/oktai_a7feaa35.html"]]);
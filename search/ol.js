@@ -0,0 +1 @@
+searchShard("ol",[["Kerimov, Oleg","","","ppl/kerimov/oleg_29ee1418.html"]]);
@@ -0,0 +1 @@
+searchShard("op",[["Bairamova, Ophela","","","ppl/bairamova/ophela_f612178f.html"]]);
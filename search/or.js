@@ -0,0 +1 @@
+searchShard("or",[["Bagirov, Orhan","","","ppl/bagirov/orhan_2b45164a.html"],["Kerimov, Orhan","","","ppl/kerimov/orhan_f243f3cc.html"]]);
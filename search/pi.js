@@ -0,0 +1 @@
+searchShard("pi",[["Zeinalova, Pika","1992","","ppl/zeinalova/pika_f552c3d7.html"],["Zeinalova, Pikahanum","","","ppl/zeinalova/pikahanum_d116de3b.html"]]);
@@ -0,0 +1 @@
+searchShard("pr",[["Gulchieva, Praskovia","","","ppl/gulchieva/praskovia_77d464eb.html"]]);
@@ -0,0 +1 @@
+searchShard("ra",[["Ahmedov, Raschad","","2024","ppl/ahmedov/raschad_0c520cd1.html"],["Bagirov, Rafik","","","ppl/bagirov/rafik_7f038c7a.html"],["Bagirov, Rafik","","","ppl/bagirov/rafik_f449a991.html"],["Bagirov, Ramiz","","","ppl/bagirov/ramiz_2057924a.html"],["Bagirov, Rashad","","","ppl/bagirov/rashad_0646029d.html"],["Bagirov, Rasim","","","ppl/bagirov/rasim_f6fe722c.html"],["Kerimov, Rahib","","","ppl/kerimov/rahib_68051871.html"],["Kerimov, Ramiz","","","ppl/kerimov/ramiz_08c0f89a.html"],["Mamedov, Ramiz","","","ppl/mamedov/ramiz_8f9baadd.html"],["Rasulov, Huseynn","","","ppl/rasulov/huseynn_d5fc0c6f.html"],["Rasulova, Amira","2025","","ppl/rasulova/amira_ab0fd95c.html"],["Rzaev, Ramin","","","ppl/rzaev/ramin_152e2501.html"],["Zohrabov, Rasul","","","ppl/zohrabov/rasul_38807e66.html"],["___, Rafael","","","ppl/___/rafael_2f55fc60.html"],["___, Rafik","","","ppl/___/rafik_637082bf.html"],["___, Raphael","","","ppl/___/raphael_a1cd6d74.html"]]);
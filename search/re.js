@@ -0,0 +1 @@
+searchShard("re",[["Suleimanova, Rena","1968","","ppl/suleimanova/rena_e481eefa.html"],["Zeinalova, Rena","1973","","ppl/zeinalova/rena_9b931174.html"]]);
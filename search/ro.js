@@ -0,0 +1 @@
+searchShard("ro",[["Gulchieva, Rosa","","","ppl/gulchieva/rosa_c4176586.html"],["Rzaev, Rovshane","","","ppl/rzaev/rovshane_66fe3270.html"],["Zeinalov, Rovchan","","","ppl/zeinalov/rovchan_1087f63a.html"]]);
@@ -0,0 +1 @@
+searchShard("ru",[["Abbasov, Ruslan","1989","","ppl/abbasov/ruslan_ee478fef.html"],["Ahmadov, Rustam","2002","","ppl/ahmadov/rustam_7c7e4c01.html"],["Rustamava, Fatima","","","ppl/rustamava/fatima_82232845.html"],["Rustamava, Nargiz","","","ppl/rustamava/nargiz_e42c518e.html"],["Rustamava, Nigar","","","ppl/rustamava/nigar_ad924fe1.html"],["Rzaev, Ruhsara","","2024","ppl/rzaev/ruhsara_f2a097a6.html"],["Rzaeva, Ruhsara","","","ppl/rzaeva/ruhsara_7424f279.html"]]);
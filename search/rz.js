@@ -0,0 +1 @@
+searchShard("rz",[["Rzaev, Azis","","","ppl/rzaev/azis_c58e89c6.html"],["Rzaev, Chamsadin","","","ppl/rzaev/chamsadin_bc7162fd.html"],["Rzaev, Ramin","","","ppl/rzaev/ramin_152e2501.html"],["Rzaev, Rovshane","","","ppl/rzaev/rovshane_66fe3270.html"],["Rzaev, Ruhsara","","2024","ppl/rzaev/ruhsara_f2a097a6.html"],["Rzaev, Sadik","","","ppl/rzaev/sadik_67c01114.html"],["Rzaev, Samandar","","","ppl/rzaev/samandar_15d325b5.html"],["Rzaev, Simran","","","ppl/rzaev/simran_b0efde34.html"],["Rzaev, ___","","","ppl/rzaev/____fffdc0de.html"],["Rzaev, ___","","","ppl/rzaev/____dba097b4.html"],["Rzaeva, Malahad","","","ppl/rzaeva/malahad_c2f218fd.html"],["Rzaeva, Ruhsara","","","ppl/rzaeva/ruhsara_7424f279.html"],["Rzaeva, Zarifa","","","ppl/rzaeva/zarifa_625da094.html"]]);
@@ -0,0 +1 @@
+searchShard("sa",[["Abbasova, Sayali","1939","","ppl/abbasova/sayali_3a511d8b.html"],["Ahmedov, Samed","","","ppl/ahmedov/samed_ffd01bf6.html"],["Ahmedov, Samed","","","ppl/ahmedov/samed_9f3c0ebc.html"],["Bagirov, Samir","","","ppl/bagirov/samir_0955d1f2.html"],["Bagirova, Samira","","","ppl/bagirova/samira_7c1febb0.html"],["Gafarova, Sabina","1981","","ppl/gafarova/sabina_e5ae0e0f.html"],["Kerimov, Saidular","","","ppl/kerimov/saidular_76b7ece3.html"],["Kerimov, Salim","","","ppl/kerimov/salim_01812de3.html"],["Kerimova, Sabina","1973","","ppl/kerimova/sabina_3f6a8607.html"],["Kerimova, Sarah","","","ppl/kerimova/sarah_152cfb8d.html"],["Kerimova, Sarfinaz","","","ppl/kerimova/sarfinaz_6204c953.html"],["Malikova, Samira","","","ppl/malikova/samira_186d2a26.html"],["Muzafarova, Safura","","","ppl/muzafarova/safura_ceea5dc8.html"],["Rzaev, Sadik","","","ppl/rzaev/sadik_67c01114.html"],["Rzaev, Samandar","","","ppl/rzaev/samandar_15d325b5.html"],["Sadihli, Farid","","","ppl/sadihli/farid_313e50fd.html"],["Sadihli, Vafa","","","ppl/sadihli/vafa_073c32c3.html"],["Sattarov, Alec","","","ppl/sattarov/alec_1c1ab415.html"],["Sattarov, Hassan","","","ppl/sattarov/hassan_71044a26.html"],["Sattarova, Hummara","","","ppl/sattarova/hummara_f62f304d.html"],["Sattarova, Latifa","","","ppl/sattarova/latifa_fbd5bc40.html"],["Sattarova, Nona","","","ppl/sattarova/nona_9332070f.html"],["Sattarv, Sattar","","","ppl/sattarv/sattar_941e0508.html"],["Zeinalov, Samir","1965","2018","ppl/zeinalov/samir_be42fb13.html"],["Zohrabova, Sabina","","","ppl/zohrabova/sabina_21e102b6.html"],["___, Saida","","","ppl/___/saida_f715c6cc.html"],["___, Samir","","","ppl/___/samir_e7487b58.html"],["___, Samira","","","ppl/___/samira_08d5681a.html"]]);
@@ -0,0 +1 @@
+searchShard("se",[["Agaoglanova, Sevda","","","ppl/agaoglanova/sevda_c0327f9c.html"],["Bagirov, Sevgili","","","ppl/bagirov/sevgili_bdffb20e.html"],["Bagirova, Sevda","","","ppl/bagirova/sevda_e656be4f.html"],["Mechtiva, Sevinch","","","ppl/mechtiva/sevinch_99666ad6.html"],["___, Sevil","","","ppl/___/sevil_293aaf53.html"],["___, Sevil (Mumu)","","","ppl/___/sevil_mumu_82852df4.html"],["___, Seving","","","ppl/___/seving_3fddc525.html"]]);
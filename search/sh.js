@@ -0,0 +1 @@
+searchShard("sh",[["Bagirova, Shirin","","","ppl/bagirova/shirin_4303daf7.html"],["Bagirova, Shirin","","","ppl/bagirova/shirin_ab55b207.html"],["Bairamov, Shahin","","","ppl/bairamov/shahin_b207208c.html"],["Bairamov, Shahin","2000","","ppl/bairamov/shahin_50ba32c4.html"],["Malikova, Shafack","","","ppl/malikova/shafack_bc96391f.html"],["Musayev, Shahin","1963","","ppl/musayev/shahin_958451a2.html"],["Suleimanov, Shahine","1965","","ppl/suleimanov/shahine_168bffc8.html"]]);
@@ -0,0 +1 @@
+searchShard("si",[["Rzaev, Simran","","","ppl/rzaev/simran_b0efde34.html"]]);
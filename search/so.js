@@ -0,0 +1 @@
+searchShard("so",[["Ahmedova, Sonia","","","ppl/ahmedova/sonia_1e26dd11.html"],["Ahmedova, Sonia","1929","","ppl/ahmedova/sonia_cacf8059.html"],["Bagirova, Solmace","","","ppl/bagirova/solmace_dd52e83e.html"],["Bagirova, Sona","","","ppl/bagirova/sona_7c0e6416.html"],["Kerimova, Solmaz","","","ppl/kerimova/solmaz_404d5f39.html"],["___, Sona","","","ppl/___/sona_7699186f.html"]]);
@@ -0,0 +1 @@
+searchShard("su",[["Kerimov, Sultan","1920","","ppl/kerimov/sultan_b931f09a.html"],["Suleimanov, Ahmad","1937","1951","ppl/suleimanov/ahmad_f2be565a.html"],["Suleimanov, Ahmed","","","ppl/suleimanov/ahmed_7debdcd8.html"],["Suleimanov, Aligaydar","1968","","ppl/suleimanov/aligaydar_519adbf3.html"],["Suleimanov, Aligeidar","1906","","ppl/suleimanov/aligeidar_2f0fbb0d.html"],["Suleimanov, Bahram","1939","1976","ppl/suleimanov/bahram_94a21b3c.html"],["Suleimanov, Shahine","1965","","ppl/suleimanov/shahine_168bffc8.html"],["Suleimanova, Dilshad","","","ppl/suleimanova/dilshad_8e29140c.html"],["Suleimanova, Elvira","","","ppl/suleimanova/elvira_d50f7ad3.html"],["Suleimanova, Fidan","","","ppl/suleimanova/fidan_56415058.html"],["Suleimanova, Kursum","1912","","ppl/suleimanova/kursum_0a2ecd50.html"],["Suleimanova, Rena","1968","","ppl/suleimanova/rena_e481eefa.html"],["Suleimanova, ___","","","ppl/suleimanova/____b8b2b337.html"],["___, Sura","","","ppl/___/sura_9d44a6c9.html"]]);
@@ -0,0 +1 @@
+searchShard("sv",[["Bagirova, Svetlana","1949","2011","ppl/bagirova/svetlana_33ceff0b.html"],["Dugina, Svetlana","","","ppl/dugina/svetlana_469effc0.html"],["Zeinalova, Svetlana","1999","","ppl/zeinalova/svetlana_d1e4f42b.html"]]);
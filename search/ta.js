@@ -0,0 +1 @@
+searchShard("ta",[["Bagirov, Taleh","","","ppl/bagirov/taleh_dd3fbc53.html"],["Bagirov, Tamerlan","","","ppl/bagirov/tamerlan_2857b13d.html"],["Bagirova, Taira","","","ppl/bagirova/taira_3bce10b0.html"],["Bagirova, Tarana","","","ppl/bagirova/tarana_73f1bac0.html"],["Huseynova, Taira","","","ppl/huseynova/taira_55aee23e.html"],["Mechtiva, Tahmina","","","ppl/mechtiva/tahmina_ec5e0e50.html"],["___, Tamara","","","ppl/___/tamara_5516f069.html"]]);
@@ -0,0 +1 @@
+searchShard("te",[["Gulieva, Teyara","","","ppl/gulieva/teyara_f02914ab.html"]]);
@@ -0,0 +1 @@
+searchShard("to",[["Bagirov, Tofik","","","ppl/bagirov/tofik_d2b21bd7.html"],["Bagirov, Tofik","","","ppl/bagirov/tofik_6e70fa37.html"],["Kerimov, Tofik","","","ppl/kerimov/tofik_73d34381.html"]]);
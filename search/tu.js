@@ -0,0 +1 @@
+searchShard("tu",[["Agazadeh, Tural","1991","","ppl/agazadeh/tural_7dd636e5.html"],["Bagirova, Turan","","","ppl/bagirova/turan_1908dd97.html"],["Zohrabova, Turan","","","ppl/zohrabova/turan_edc84e16.html"],["___, Tuba","","","ppl/___/tuba_6442e6d9.html"]]);
@@ -0,0 +1 @@
+searchShard("ug",[["Musayev, Ughur","1998","","ppl/musayev/ughur_a4ecf3cf.html"]]);
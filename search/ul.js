@@ -0,0 +1 @@
+searchShard("ul",[["Huseynova, Ulker","","","ppl/huseynova/ulker_ad06d02c.html"]]);
@@ -0,0 +1 @@
+searchShard("um",[["Muradkhanova, Umaira","","","ppl/muradkhanova/umaira_779020c6.html"]]);
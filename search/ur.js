@@ -0,0 +1 @@
+searchShard("ur",[["Kerimov, Urah","","","ppl/kerimov/urah_2b3cf596.html"]]);
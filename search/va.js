@@ -0,0 +1 @@
+searchShard("va",[["Bairamov, Valeh","","","ppl/bairamov/valeh_971f9ea1.html"],["Huseynov, Vahid","","","ppl/huseynov/vahid_9de1c32c.html"],["Sadihli, Vafa","","","ppl/sadihli/vafa_073c32c3.html"],["Zeinalov, Vafa","","","ppl/zeinalov/vafa_4a39d831.html"]]);
@@ -0,0 +1 @@
+searchShard("vu",[["Bagirov, Vugar","","","ppl/bagirov/vugar_b78ceb71.html"],["Gafarova, Vusala","1978","","ppl/gafarova/vusala_8ec4a182.html"]]);
@@ -0,0 +1 @@
+searchShard("ya",[["Kerimov, Yavar","","","ppl/kerimov/yavar_9929e141.html"]]);
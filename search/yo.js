@@ -0,0 +1 @@
+searchShard("yo",[["Bagirov, Yousif","","","ppl/bagirov/yousif_284769c8.html"]]);
@@ -0,0 +1 @@
+searchShard("yu",[["Bagirov, Yusif","","","ppl/bagirov/yusif_71c85658.html"]]);
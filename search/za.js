@@ -0,0 +1 @@
+searchShard("za",[["Huseynov, Zaur","","","ppl/huseynov/zaur_ad98cdbb.html"],["Kerimov, Zahid","","2014","ppl/kerimov/zahid_2cfb9b2a.html"],["Kerimov, Zaqir","","","ppl/kerimov/zaqir_6da961cb.html"],["Kerimov, Zaur","1971","","ppl/kerimov/zaur_083635bf.html"],["Kerimov, Zaur","","","ppl/kerimov/zaur_e247c0fd.html"],["Rzaeva, Zarifa","","","ppl/rzaeva/zarifa_625da094.html"]]);
@@ -0,0 +1 @@
+searchShard("ze",[["Kerimova, Zeinab","","","ppl/kerimova/zeinab_34c804a0.html"],["Zeinalov, Fikret","","","ppl/zeinalov/fikret_1ea0549e.html"],["Zeinalov, Nizami","","","ppl/zeinalov/nizami_09cd5948.html"],["Zeinalov, Rovchan","","","ppl/zeinalov/rovchan_1087f63a.html"],["Zeinalov, Samir","1965","2018","ppl/zeinalov/samir_be42fb13.html"],["Zeinalov, Vafa","","","ppl/zeinalov/vafa_4a39d831.html"],["Zeinalov, ___","","","ppl/zeinalov/____8594db67.html"],["Zeinalova, Pika","1992","","ppl/zeinalova/pika_f552c3d7.html"],["Zeinalova, Pikahanum","","","ppl/zeinalova/pikahanum_d116de3b.html"],["Zeinalova, Rena","1973","","ppl/zeinalova/rena_9b931174.html"],["Zeinalova, Svetlana","1999","","ppl/zeinalova/svetlana_d1e4f42b.html"],["___, Zebaida","","","ppl/___/zebaida_9c058240.html"]]);
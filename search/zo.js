@@ -0,0 +1 @@
+searchShard("zo",[["Agaoglanova, Zohra","","","ppl/agaoglanova/zohra_0d5af216.html"],["Zohrabov, Nijat","","","ppl/zohrabov/nijat_227a028e.html"],["Zohrabov, Rasul","","","ppl/zohrabov/rasul_38807e66.html"],["Zohrabov, Zoxrab","","","ppl/zohrabov/zoxrab_f9b7f7dc.html"],["Zohrabova, Nazile","","","ppl/zohrabova/nazile_dba98e75.html"],["Zohrabova, Sabina","","","ppl/zohrabova/sabina_21e102b6.html"],["Zohrabova, Turan","","","ppl/zohrabova/turan_edc84e16.html"]]);
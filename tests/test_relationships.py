@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests of the relationship calculator on a small fixture tree.
+
+The fixture has a grandfather (G1) with two wives, so his grandchildren through each are half
+first cousins; a father (P1) with children by two wives; and a marriage between first cousins
+(C1 and C4), whose son D2 reaches his great-grandparents G1 and G2 through both parents.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'python'))
+
+from main import load_tree
+from relationships import UNRELATED, RelationshipCalculator, describe_relationship, find_individual
+
+FIXTURE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'relationships.ged')
+
+class RelationshipCalculatorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.family_graph, cls.individuals_data = load_tree(FIXTURE_FILE)
+
+    def setUp(self):
+        self.calculator = RelationshipCalculator(self.family_graph, self.individuals_data)
+
+    def relate(self, first, second):
+        return self.calculator.relate(f"@{first}@", f"@{second}@")
+
+    def assertDescription(self, first, second, description):
+        self.assertEqual(self.relate(first, second).description, description)
+
+    def test_self(self):
+        self.assertDescription('C1', 'C1', "self")
+
+    def test_direct_line(self):
+        self.assertDescription('G3', 'P3', "mother")
+        self.assertDescription('P3', 'G3', "son")
+        self.assertDescription('C5', 'G1', "grandson")
+        self.assertDescription('G2', 'C4', "grandmother")
+
+    def test_full_and_half_siblings(self):
+        relationship = self.relate('C2', 'C1')
+        self.assertEqual(relationship.description, "sister")
+        self.assertEqual(sorted(relationship.common_ancestors), ['@P1@', '@S1@'])
+        self.assertEqual((relationship.degree, relationship.removal), (0, 0))
+
+        relationship = self.relate('C3', 'C1')
+        self.assertEqual(relationship.description, "half brother")
+        self.assertEqual(relationship.common_ancestors, ['@P1@'])
+
+    def test_aunts_and_uncles(self):
+        self.assertDescription('P2', 'C1', "aunt")
+        self.assertDescription('P3', 'C1', "half uncle")
+        self.assertDescription('C1', 'P3', "half nephew")
+
+    def test_cousins(self):
+        relationship = self.relate('C4', 'C1')
+        self.assertEqual(relationship.description, "first cousin")
+        self.assertEqual(relationship.generations, (2, 2))
+        self.assertDescription('C5', 'C1', "half first cousin")
+
+        relationship = self.relate('D1', 'C1')
+        self.assertEqual(relationship.description, "first cousin once removed")
+        self.assertEqual((relationship.degree, relationship.removal), (1, 1))
+
+    def test_spouses_and_unrelated(self):
+        self.assertDescription('S1', 'P1', "wife")
+        self.assertDescription('P1', 'S1', "husband")
+        relationship = self.relate('S1', 'S3')
+        self.assertEqual(relationship.description, UNRELATED)
+        self.assertIsNone(relationship.generations)
+
+    def test_pedigree_collapse(self):
+        # D2's parents are first cousins: each ancestor is kept once, at its nearest distance
+        ancestors = self.calculator.get_ancestors('@D2@')
+        self.assertEqual(ancestors, {
+            '@C1@': 1, '@C4@': 1, '@P1@': 2, '@S1@': 2, '@S3@': 2, '@P2@': 2, '@G1@': 3, '@G2@': 3
+        })
+        self.assertDescription('G1', 'D2', "great-grandfather")
+
+        # Nearest common ancestors win over the ones reached through the other parent
+        relationship = self.relate('D2', 'C2')
+        self.assertEqual(relationship.description, "nephew")
+        self.assertEqual(sorted(relationship.common_ancestors), ['@P1@', '@S1@'])
+
+        # D1 and D2 only share their mother
+        self.assertDescription('D1', 'D2', "half sister")
+
+    def test_relate_all_to_matches_relate(self):
+        pointers = [data.pointer for data in self.individuals_data.values()]
+        for home in pointers:
+            relationships = self.calculator.relate_all_to(home)
+            for pointer in pointers:
+                expected = self.calculator.relate(pointer, home)
+                actual = relationships[pointer]
+                self.assertEqual(
+                    (actual.description, sorted(actual.common_ancestors), actual.generations),
+                    (expected.description, sorted(expected.common_ancestors), expected.generations),
+                    f"{pointer} to {home}"
+                )
+
+    def test_find_individual(self):
+        self.assertEqual(find_individual(self.individuals_data, self.family_graph, '@C1@'), '@C1@')
+        self.assertEqual(find_individual(self.individuals_data, self.family_graph, 'C1'), '@C1@')
+        self.assertEqual(find_individual(self.individuals_data, self.family_graph, 'Elder, Carl'), '@C1@')
+        with self.assertRaises(ValueError):
+            find_individual(self.individuals_data, self.family_graph, 'Nobody, Here')
+
+class DescribeRelationshipTest(unittest.TestCase):
+
+    def test_great_generations(self):
+        self.assertEqual(describe_relationship(0, 3, "male"), "great-grandfather")
+        self.assertEqual(describe_relationship(0, 5, "female"), "3x great-grandmother")
+        self.assertEqual(describe_relationship(1, 4, "male"), "2x great-uncle")
+        self.assertEqual(describe_relationship(4, 1, "unknown", half=True), "half 2x great-niece or nephew")
+
+    def test_cousin_wording(self):
+        self.assertEqual(describe_relationship(3, 3, "male"), "second cousin")
+        self.assertEqual(describe_relationship(2, 4, "male"), "first cousin twice removed")
+        self.assertEqual(describe_relationship(2, 5, "male"), "first cousin 3 times removed")
+        self.assertEqual(describe_relationship(10, 10, "male"), "9th cousin")
+        self.assertEqual(describe_relationship(22, 23, "male", half=True), "half 21st cousin once removed")
+
+if __name__ == "__main__":
+    unittest.main()